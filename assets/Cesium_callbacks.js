@@ -57,6 +57,30 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
             }, Cesium.ScreenSpaceEventType.MOUSE_MOVE);
          }
 
+         function setCameraReport(viewer)
+         {
+            // Reports the camera to the server so it can cull hidden links
+            viewer.camera.moveEnd.addEventListener(function () {
+               const camera = viewer.camera;
+               const destination = viewer.flightDestination;
+               viewer.flightDestination = undefined;
+
+               // A move that ends where the server flew the camera is not the analyst's
+               if (destination && Cesium.Cartesian3.equalsEpsilon(camera.positionWC, destination, Cesium.Math.EPSILON6)) {
+                  return;
+               }
+
+               dash_clientside.set_props('cesium-view', {
+                  data: {
+                     position: {x: camera.positionWC.x, y: camera.positionWC.y, z: camera.positionWC.z},
+                     direction: {x: camera.directionWC.x, y: camera.directionWC.y, z: camera.directionWC.z},
+                     fov: camera.frustum.fov,
+                     aspect_ratio: camera.frustum.aspectRatio
+                  }
+               });
+            });
+         }
+
          function setPointHoverEvent(viewer)
          {
             const handler = new Cesium.ScreenSpaceEventHandler(viewer.scene.canvas); 
@@ -130,6 +154,7 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
 
             setPointHoverEvent(viewer);
             setArrowHoverEvent(viewer);
+            setCameraReport(viewer);
 
             return viewer;
          });
@@ -212,7 +237,7 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
             }
          }
 
-         let transmissionText = function(transmission, current_time, info)
+         let transmissionText = function(transmission, current_time, info, success_rate)
          {
             let transmission_color = {
                "Success": Cesium.Color.MEDIUMTURQUOISE,
@@ -243,9 +268,16 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
                }
             }
 
+            let color = transmission_color[transmission_result];
+            if (success_rate !== undefined && success_rate !== null)
+            {
+               transmission_info += `<b>Rolling Success Rate: ${Math.round(100 * success_rate)}%</b><br>`;
+               color = Cesium.Color.lerp(Cesium.Color.DARKRED, Cesium.Color.MEDIUMTURQUOISE, success_rate, new Cesium.Color());
+            }
+
             result = {
                "transmission_info": transmission_info, 
-               "color": transmission_color[transmission_result]
+               "color": color
             };
 
             return result;
@@ -257,8 +289,9 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
             const info = jsonData[group]["info"];
             const line_data = jsonData[group]["line_points"];
             const current_time = jsonData[group]["current_time"];
+            const success_rate = jsonData[group]["success_rate"];
             
-            let transmission_info = transmissionText(transmission, current_time, info);
+            let transmission_info = transmissionText(transmission, current_time, info, success_rate);
             createPoints(info, transmission_info, cesium_viewer);
             createLine(line_data, transmission_info, cesium_viewer);
          }
@@ -323,16 +356,200 @@ window.dash_clientside = Object.assign({}, window.dash_clientside, {
          }
       },
 
+      message_path: function(data, cesium_viewer) {
+
+         if (!cesium_viewer) {
+            return;
+         }
+
+         if (cesium_viewer.messagePath !== undefined) {
+            cesium_viewer.scene.primitives.remove(cesium_viewer.messagePath);
+            cesium_viewer.messagePath = undefined;
+         }
+
+         if (!data) {
+            return;
+         }
+
+         let path_color = {
+            "Success": Cesium.Color.MEDIUMTURQUOISE,
+            "Fail": Cesium.Color.DARKRED
+         };
+
+         const messagePath = new Cesium.PolylineCollection();
+         const jsonData = JSON.parse(data);
+         for (const segment of jsonData["segments"]) {
+            let positions = [];
+            for (let i = 0; i < segment["x"].length; i++) {
+               positions.push(new Cesium.Cartesian3(segment["x"][i], segment["y"][i], segment["z"][i]));
+            }
+
+            messagePath.add({
+               positions: positions,
+               width: 6,
+               material: Cesium.Material.fromType('Color', {color: path_color[segment["result"]]})
+            });
+         }
+
+         cesium_viewer.messagePath = cesium_viewer.scene.primitives.add(messagePath);
+      },
+
+      platforms: function(data, cesium_viewer) {
+
+         if (!cesium_viewer) {
+            return;
+         }
+
+         if (cesium_viewer.platformPoints !== undefined) {
+            cesium_viewer.scene.primitives.remove(cesium_viewer.platformPoints);
+            cesium_viewer.platformPoints = undefined;
+         }
+
+         if (cesium_viewer.platformTrails !== undefined) {
+            cesium_viewer.scene.primitives.remove(cesium_viewer.platformTrails);
+            cesium_viewer.platformTrails = undefined;
+         }
+
+         if (!data) {
+            return;
+         }
+
+         const jsonData = JSON.parse(data);
+         const positions = jsonData["positions"];
+         const platformPoints = new Cesium.PointPrimitiveCollection();
+         for (let i = 0; i < jsonData["names"].length; i++) {
+            platformPoints.add({
+               position: new Cesium.Cartesian3(positions[3 * i], positions[3 * i + 1], positions[3 * i + 2]),
+               pixelSize: 6,
+               color: jsonData["active"][i] ? Cesium.Color.GOLDENROD : Cesium.Color.LIGHTGRAY,
+               id: `${jsonData["names"][i]}_platform`
+            });
+         }
+         cesium_viewer.platformPoints = cesium_viewer.scene.primitives.add(platformPoints);
+
+         const trailPoints = jsonData["trail_points"];
+         if (trailPoints < 2) {
+            return;
+         }
+
+         const trails = jsonData["trails"];
+         const platformTrails = new Cesium.PolylineCollection();
+         const trailMaterial = Cesium.Material.fromType('Color', {color: Cesium.Color.GOLDENROD.withAlpha(0.6)});
+         for (let i = 0; i < jsonData["names"].length; i++) {
+            let trail = [];
+            for (let j = 0; j < trailPoints; j++) {
+               const k = 3 * (i * trailPoints + j);
+               trail.push(new Cesium.Cartesian3(trails[k], trails[k + 1], trails[k + 2]));
+            }
+
+            platformTrails.add({
+               positions: trail,
+               width: 2,
+               material: trailMaterial
+            });
+         }
+         cesium_viewer.platformTrails = cesium_viewer.scene.primitives.add(platformTrails);
+      },
+
+      clusters: function(data, cesium_viewer) {
+
+         if (!cesium_viewer) {
+            return;
+         }
+
+         for (const collection of ["clusterPoints", "clusterLabels", "clusterBundles"]) {
+            if (cesium_viewer[collection] !== undefined) {
+               cesium_viewer.scene.primitives.remove(cesium_viewer[collection]);
+               cesium_viewer[collection] = undefined;
+            }
+         }
+
+         if (!data) {
+            return;
+         }
+
+         const jsonData = JSON.parse(data);
+         const positions = jsonData["positions"];
+         const clusterPoints = new Cesium.PointPrimitiveCollection();
+         const clusterLabels = new Cesium.LabelCollection();
+         for (let i = 0; i < jsonData["counts"].length; i++) {
+            const count = jsonData["counts"][i];
+            const position = new Cesium.Cartesian3(positions[3 * i], positions[3 * i + 1], positions[3 * i + 2]);
+            clusterPoints.add({
+               position: position,
+               pixelSize: 6 + 3 * Math.log2(count),
+               color: Cesium.Color.GOLDENROD
+            });
+
+            if (count > 1) {
+               clusterLabels.add({
+                  position: position,
+                  text: `${count}`,
+                  font: '12px sans-serif',
+                  pixelOffset: new Cesium.Cartesian2(0, -14)
+               });
+            }
+         }
+
+         const clusterBundles = new Cesium.PolylineCollection();
+         for (const bundle of jsonData["bundles"]) {
+            let bundlePositions = [];
+            for (let i = 0; i < bundle["x"].length; i++) {
+               bundlePositions.push(new Cesium.Cartesian3(bundle["x"][i], bundle["y"][i], bundle["z"][i]));
+            }
+
+            const color = Cesium.Color.lerp(Cesium.Color.DARKRED, Cesium.Color.MEDIUMTURQUOISE, bundle["success_rate"], new Cesium.Color());
+            clusterBundles.add({
+               positions: bundlePositions,
+               width: 1 + Math.log2(bundle["links"]),
+               material: Cesium.Material.fromType('Color', {color: color})
+            });
+         }
+
+         cesium_viewer.clusterBundles = cesium_viewer.scene.primitives.add(clusterBundles);
+         cesium_viewer.clusterPoints = cesium_viewer.scene.primitives.add(clusterPoints);
+         cesium_viewer.clusterLabels = cesium_viewer.scene.primitives.add(clusterLabels);
+      },
+
+      activity: function(data, cesium_viewer) {
+
+         if (!cesium_viewer) {
+            return;
+         }
+
+         if (cesium_viewer.activityLayer !== undefined) {
+            cesium_viewer.imageryLayers.remove(cesium_viewer.activityLayer);
+            cesium_viewer.activityLayer = undefined;
+         }
+
+         if (!data) {
+            return;
+         }
+
+         const activityLayer = new Cesium.ImageryLayer(
+            new Cesium.SingleTileImageryProvider({
+               url: data,
+               rectangle: Cesium.Rectangle.fromDegrees(-180, -90, 180, 90),
+               tileWidth: 512,
+               tileHeight: 256
+            })
+         );
+         cesium_viewer.activityLayer = cesium_viewer.imageryLayers.add(activityLayer);
+      },
+
       camera_view: function(camera_location, cesium_viewer) {
 
          const jsonCamera = JSON.parse(camera_location);
          let adjustCamera = function(camera_location, cesium_viewer) {
 
+            const destination = new Cesium.Cartesian3(
+               camera_location.x, 
+               camera_location.y, 
+               camera_location.z);
+
+            cesium_viewer.flightDestination = destination;
             cesium_viewer.camera.flyTo({
-               destination: new Cesium.Cartesian3(
-                  camera_location.x, 
-                  camera_location.y, 
-                  camera_location.z),
+               destination: destination,
                duration: 1
             });
          }
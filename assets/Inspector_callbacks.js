@@ -0,0 +1,120 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+   Inspector: {
+      session_id: function(id, current) {
+
+         if (current) {
+            return window.dash_clientside.no_update;
+         }
+
+         if (window.crypto && window.crypto.randomUUID) {
+            return window.crypto.randomUUID();
+         }
+
+         return `${Date.now().toString(16)}-${Math.random().toString(16).slice(2)}`;
+      },
+
+      decode_timestamps: function(data) {
+
+         const Inspector = window.dash_clientside.Inspector;
+
+         if (!data) {
+            return [];
+         }
+
+         if (Array.isArray(data)) {
+            return data;
+         }
+
+         if (Inspector._timestamp_source !== data.bdata) {
+            const bytes = Uint8Array.from(atob(data.bdata), c => c.charCodeAt(0));
+            Inspector._timestamp_source = data.bdata;
+            Inspector._timestamps = new Float64Array(bytes.buffer);
+         }
+
+         return Inspector._timestamps;
+      },
+
+      search_time: function(timestamps, time, right) {
+
+         // First index whose timestamp is after (right) or not before (left) the given time
+         let low = 0;
+         let high = timestamps.length;
+         while (low < high) {
+            const mid = (low + high) >>> 1;
+            if (timestamps[mid] < time || (right && timestamps[mid] === time)) {
+               low = mid + 1;
+            } else {
+               high = mid;
+            }
+         }
+
+         return low;
+      },
+
+      shift_time: function(previous_clicks, next_clicks, index, data, stride) {
+
+         const Inspector = window.dash_clientside.Inspector;
+         const timestamps = Inspector.decode_timestamps(data);
+
+         if (timestamps.length === 0) {
+            return window.dash_clientside.no_update;
+         }
+
+         const triggered = window.dash_clientside.callback_context.triggered.map(t => t.prop_id);
+         const backward = triggered.includes("previous-time.n_clicks");
+         let idx = Math.min(Math.max(index || 0, 0), timestamps.length - 1);
+
+         if (stride > 0) {
+            if (backward) {
+               idx = Inspector.search_time(timestamps, timestamps[idx] - stride, true) - 1;
+            } else {
+               idx = Inspector.search_time(timestamps, timestamps[idx] + stride, false);
+            }
+         } else {
+            idx += backward ? -1 : 1;
+         }
+
+         return Math.min(Math.max(idx, 0), timestamps.length - 1);
+      },
+
+      current_time: function(index, data) {
+
+         const timestamps = window.dash_clientside.Inspector.decode_timestamps(data);
+
+         if (timestamps.length === 0) {
+            return window.dash_clientside.no_update;
+         }
+
+         const idx = Math.min(Math.max(index || 0, 0), timestamps.length - 1);
+         return timestamps[idx];
+      },
+
+      graph_width: function(graph_id) {
+
+         const graph = document.getElementById(graph_id);
+         if (graph && graph.offsetWidth > 0) {
+            return graph.offsetWidth;
+         }
+
+         return Math.round(window.innerWidth / 2);
+      },
+
+      time_label: function(current_time, radio_val, window_size) {
+
+         if (!radio_val) {
+            return "Plots not tied to time!";
+         }
+
+         if (current_time === null || current_time === undefined) {
+            return window.dash_clientside.no_update;
+         }
+
+         const format = time => new Date(time * 1000).toISOString().substring(11, 23);
+         if (window_size > 0) {
+            return `Current Window: ${format(current_time)} - ${format(current_time + window_size)}`;
+         }
+
+         return `Current Time: ${format(current_time)}`;
+      }
+   }
+});
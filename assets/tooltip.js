@@ -3,4 +3,15 @@ window.dccFunctions = window.dccFunctions || {};
 window.dccFunctions.convertToHMS = function(value) {
    const date = new Date(value * 1000);
    return `${date.toISOString()}`
-}
\ No newline at end of file
+}
+window.dccFunctions.indexToHMS = function(value) {
+   // Slider transforms only receive the value, so read the timestamps store directly
+   const store = window.dash_component_api && window.dash_component_api.getLayout("timestamps");
+   const data = store && store.props ? store.props.data : null;
+   const timestamps = window.dash_clientside.Inspector.decode_timestamps(data);
+   if (!timestamps || timestamps.length === 0) {
+      return `${value}`;
+   }
+   const idx = Math.min(Math.max(value, 0), timestamps.length - 1);
+   return window.dccFunctions.convertToHMS(timestamps[idx]);
+}
@@ -0,0 +1,63 @@
+import time
+
+
+class CallbackRequest:
+   """
+   Builds the JSON body Dash's renderer posts to /_dash-update-component for
+   one registered callback, so benchmarks can drive callbacks without a
+   browser.
+   """
+
+   def __init__(self, app, output_fragment):
+
+      for output, callback in app.callback_map.items():
+         if output_fragment in output:
+            self._output = output
+            self._callback = callback
+            break
+      else:
+         raise KeyError(f"No callback writes to {output_fragment}")
+
+
+   def payload(self, values, changed):
+
+      return {
+         "output": self._output,
+         "outputs": self._outputs(),
+         "inputs": self._pack(self._callback["inputs"], values),
+         "state": self._pack(self._callback.get("state", []), values),
+         "changedPropIds": changed
+      }
+
+
+   def post(self, client, values, changed):
+
+      start = time.perf_counter()
+      response = client.post("/_dash-update-component", json=self.payload(values, changed))
+      elapsed = time.perf_counter() - start
+
+      return response, elapsed
+
+
+   def _outputs(self):
+
+      if not self._output.startswith(".."):
+         return self._split(self._output)
+
+      return [self._split(part) for part in self._output.strip(".").split("...")]
+
+
+   def _split(self, output):
+
+      component_id, component_property = output.rsplit(".", 1)
+      return {"id": component_id, "property": component_property.split("@")[0]}
+
+
+   def _pack(self, dependencies, values):
+
+      packed = []
+      for dependency in dependencies:
+         key = f'{dependency["id"]}.{dependency["property"]}'
+         packed.append({"id": dependency["id"], "property": dependency["property"], "value": values.get(key)})
+
+      return packed
@@ -0,0 +1,69 @@
+import argparse
+import statistics
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_events import make_events
+from benchmarks.dash_requests import CallbackRequest
+from inspector_packages.dash_app import *
+from inspector_packages.dash_app.dash_callbacks import DashCallbacks
+
+
+def time_callbacks(frame, validate, repeats):
+
+   callbacks = DashCallbacks(frame, resolution="low", validate_figures=validate)
+   client = callbacks.app.server.test_client()
+   timestamps = frame["Timestamp"].unique()
+
+   values = {
+      f"{CURRENT_TIME}.data": None,
+      f"{DISPLAY_MEMORY}.data": None,
+      f"{SUBPLOT_CATEGORY}.value": "Event_Type",
+      f"{BAR_GRAPH_CATEGORY}.value": "Sender_Name",
+      f"{BAR_STACK_CATEGORY}.value": "Receiver_Name",
+      f"{NETWORK_LAYOUT}.value": "Circular",
+      f"{NETWORK_SCOPE}.value": "Global",
+      f"{RADIOS}.value": 0
+   }
+
+   results = {}
+   for name, output in [("globe", GLOBE_GRAPH), ("bar", BAR_GRAPH), ("network", "network-graph")]:
+      request = CallbackRequest(callbacks.app, f"{output}.figure")
+      latencies, sizes = [], []
+      for idx in range(repeats):
+         values[f"{CURRENT_TIME}.data"] = float(timestamps[idx % len(timestamps)])
+         response, elapsed = request.post(client, values, [f"{CURRENT_TIME}.data"])
+         if response.status_code != 200:
+            raise RuntimeError(f"{name} callback failed with status {response.status_code}")
+         latencies.append(elapsed)
+         sizes.append(len(response.data))
+      results[name] = (statistics.median(latencies), statistics.mean(sizes))
+
+   return results
+
+
+def main():
+
+   parser = argparse.ArgumentParser(description="Callback latency with and without Plotly figure validation.")
+   parser.add_argument("--rows", type=int, default=200000)
+   parser.add_argument("--platforms", type=int, default=150)
+   parser.add_argument("--timestamps", type=int, default=500)
+   parser.add_argument("--repeats", type=int, default=10)
+   args = parser.parse_args()
+
+   frame = make_events(args.rows, args.platforms, args.timestamps)
+   validated = time_callbacks(frame, True, args.repeats)
+   assembled = time_callbacks(frame, False, args.repeats)
+
+   print(f"{'callback':<10}{'validated ms':>15}{'dict ms':>12}{'speedup':>10}{'bytes':>12}")
+   for name in validated:
+      slow, size = validated[name]
+      fast, _ = assembled[name]
+      print(f"{name:<10}{slow * 1000:>15.1f}{fast * 1000:>12.1f}{slow / fast:>10.1f}{size:>12.0f}")
+
+
+if __name__ == "__main__":
+
+   main()
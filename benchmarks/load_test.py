@@ -0,0 +1,175 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic_events import make_events
+from benchmarks.dash_requests import CallbackRequest
+from inspector_packages.dash_app import *
+from inspector_packages.dash_app.dash_callbacks import DashCallbacks
+from inspector_packages.dash_app.production_server import ProductionServer
+from inspector_packages.data_store import EventStore
+
+
+class HttpClient:
+   """
+   Gives a requests session the client.post(path, json=...) interface that
+   CallbackRequest uses with Flask's test client.
+   """
+
+   def __init__(self, base_url):
+
+      self._base_url = base_url
+      self._session = requests.Session()
+
+
+   def post(self, path, json):
+
+      return self._session.post(self._base_url + path, json=json)
+
+
+def start_server(store_dir, workers, port):
+
+   process = subprocess.Popen(
+      [sys.executable, __file__, "--serve", str(store_dir), "--workers", str(workers), "--port", str(port)],
+      cwd=str(Path(__file__).parent.parent),
+      stdout=subprocess.DEVNULL,
+      stderr=subprocess.DEVNULL)
+
+   base_url = f"http://127.0.0.1:{port}"
+   deadline = time.time() + 300
+   while time.time() < deadline:
+      try:
+         if requests.get(base_url + "/", timeout=1).status_code == 200:
+            return process, base_url
+      except requests.ConnectionError:
+         pass
+      time.sleep(0.5)
+
+   process.terminate()
+   raise RuntimeError(f"Server with {workers} workers did not start")
+
+
+def process_tree(pid):
+
+   pids = [pid]
+   for task in Path(f"/proc/{pid}/task").glob("*"):
+      children = task.joinpath("children")
+      if children.exists():
+         for child in children.read_text().split():
+            pids.extend(process_tree(int(child)))
+
+   return pids
+
+
+def proportional_memory(pid):
+
+   total = 0
+   for child in process_tree(pid):
+      rollup = Path(f"/proc/{child}/smaps_rollup")
+      if not rollup.exists():
+         continue
+      for line in rollup.read_text().splitlines():
+         if line.startswith("Pss:"):
+            total += int(line.split()[1]) * 1024
+
+   return total
+
+
+def run_load(base_url, app, timestamps, clients, num_requests, filter_states=None):
+
+   requests_by_output = [CallbackRequest(app, f"{output}.figure") for output in (GLOBE_GRAPH, BAR_GRAPH, "network-graph")]
+   local = threading.local()
+
+   def send(idx):
+
+      if not hasattr(local, "client"):
+         local.client = HttpClient(base_url)
+
+      values = {
+         f"{CURRENT_TIME}.data": float(timestamps[idx % len(timestamps)]),
+         f"{DISPLAY_MEMORY}.data": filter_states[idx % len(filter_states)] if filter_states else None,
+         f"{SUBPLOT_CATEGORY}.value": "Event_Type",
+         f"{BAR_GRAPH_CATEGORY}.value": "Sender_Name",
+         f"{BAR_STACK_CATEGORY}.value": "Receiver_Name",
+         f"{NETWORK_LAYOUT}.value": "Circular",
+         f"{NETWORK_SCOPE}.value": "Per Timestep",
+         f"{RADIOS}.value": 1
+      }
+      request = requests_by_output[idx % len(requests_by_output)]
+      response, elapsed = request.post(local.client, values, [f"{CURRENT_TIME}.data"])
+      if response.status_code != 200:
+         raise RuntimeError(f"Request failed with status {response.status_code}")
+
+      return elapsed
+
+   with ThreadPoolExecutor(max_workers=clients) as pool:
+      list(pool.map(send, range(clients * 2)))
+
+      start = time.perf_counter()
+      latencies = list(pool.map(send, range(num_requests)))
+      duration = time.perf_counter() - start
+
+   latencies.sort()
+   return num_requests / duration, statistics.median(latencies), latencies[int(0.95 * (len(latencies) - 1))]
+
+
+def main():
+
+   parser = argparse.ArgumentParser(description="Throughput and memory of the dashboard with one worker versus several.")
+   parser.add_argument("--rows", type=int, default=200000)
+   parser.add_argument("--platforms", type=int, default=150)
+   parser.add_argument("--timestamps", type=int, default=500)
+   parser.add_argument("--workers", type=int, default=os.cpu_count())
+   parser.add_argument("--clients", type=int, default=16)
+   parser.add_argument("--requests", type=int, default=300)
+   parser.add_argument("--port", type=int, default=8060)
+   parser.add_argument("--serve", type=str, default=None, help=argparse.SUPPRESS)
+   args = parser.parse_args()
+
+   if args.serve is not None:
+      ProductionServer(args.serve, args.workers, "127.0.0.1", args.port, {"resolution": "low"}).run()
+      return
+
+   if not ProductionServer.available():
+      print("gunicorn is required for the load test (pip install gunicorn)")
+      return
+
+   store_dir = Path(tempfile.mkdtemp()).joinpath("event_store")
+   frame = make_events(args.rows, args.platforms, args.timestamps)
+   EventStore.save(frame, store_dir)
+
+   app = DashCallbacks(frame, resolution="low").app
+   timestamps = frame["Timestamp"].unique()
+   senders = sorted(frame["Sender_Name"].unique())
+   filter_states = [{"Sender_Name": senders[idx::4]} for idx in range(4)]
+
+   print(f"{'workers':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'idle MB':>10}{'loaded MB':>12}{'filtered MB':>14}")
+   for workers in sorted({1, args.workers}):
+      process, base_url = start_server(store_dir, workers, args.port)
+      try:
+         time.sleep(2)
+         idle_memory = proportional_memory(process.pid) / 1e6
+         throughput, median, p95 = run_load(base_url, app, timestamps, args.clients, args.requests)
+         loaded_memory = proportional_memory(process.pid) / 1e6
+         run_load(base_url, app, timestamps, args.clients, args.requests, filter_states)
+         filtered_memory = proportional_memory(process.pid) / 1e6
+      finally:
+         process.terminate()
+         process.wait()
+      print(f"{workers:<10}{throughput:>10.1f}{median * 1000:>10.1f}{p95 * 1000:>10.1f}{idle_memory:>10.1f}{loaded_memory:>12.1f}{filtered_memory:>14.1f}")
+
+
+if __name__ == "__main__":
+
+   main()
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+
+EVENT_TYPES = [
+   "MESSAGE_DELIVERY_ATTEMPT", "MESSAGE_RECEIVED",
+   "MESSAGE_DELIVERY_ATTEMPT", "MESSAGE_RECEIVED",
+   "MESSAGE_INTERNAL", "MESSAGE_INCOMING", "MESSAGE_OUTGOING",
+   "MESSAGE_QUEUED", "MESSAGE_TRANSMITTED", "MESSAGE_HOP", "MESSAGE_DISCARDED"]
+
+MESSAGE_TYPES = ["TRACK", "STATUS", "IMAGE", "TASK"]
+FAILURE_REASONS = ["Out of range", "Queue full", "No route"]
+
+
+def make_events(num_rows=50000, num_platforms=100, num_timestamps=2000, seed=0):
+   """
+   Builds a frame with the same columns as a collected AFSIM comms CSV,
+   after Executor._configure_data. Platforms sit at fixed random locations.
+   """
+
+   rng = np.random.default_rng(seed)
+
+   start = pd.Timestamp("2024-01-01T00:00:00Z").timestamp()
+   event_times = start + np.sort(rng.choice(num_timestamps * 4, num_timestamps, replace=False)) * 0.25
+   timestamps = np.sort(rng.choice(event_times, num_rows))
+
+   names = np.array([f"platform_{idx}" for idx in range(num_platforms)])
+   types = np.array([f"TYPE_{idx % 5}" for idx in range(num_platforms)])
+   latitude = rng.uniform(-80, 80, num_platforms)
+   longitude = rng.uniform(-180, 180, num_platforms)
+   altitude = rng.choice([0, 1e4, 8e5], num_platforms)
+   radius = 6.378e6 + altitude
+   x = radius * np.cos(np.radians(latitude)) * np.cos(np.radians(longitude))
+   y = radius * np.cos(np.radians(latitude)) * np.sin(np.radians(longitude))
+   z = radius * np.sin(np.radians(latitude))
+
+   sender = rng.integers(0, num_platforms, num_rows)
+   receiver = (sender + rng.integers(1, num_platforms, num_rows)) % num_platforms
+   failed = rng.random(num_rows) < 0.15
+
+   frame = pd.DataFrame({
+      "ISODate": pd.to_datetime(timestamps, unit="s", utc=True).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+      "Event_Type": rng.choice(EVENT_TYPES, num_rows),
+      "Message_SerialNumber": rng.integers(0, num_rows // 10 + 1, num_rows),
+      "Message_Originator": names[rng.integers(0, num_platforms, num_rows)],
+      "Message_Type": rng.choice(MESSAGE_TYPES, num_rows),
+      "Message_Size": rng.integers(64, 8192, num_rows),
+      "Message_Priority": rng.integers(0, 3, num_rows),
+      "Message_DataTag": -1,
+      "OldMessage_SerialNumber": -1,
+      "OldMessage_Originator": "unknown",
+      "OldMessage_Type": "Does Not Exist",
+      "OldMessage_Size": -1,
+      "OldMessage_Priority": -1,
+      "OldMessage_DataTag": -1,
+      "Sender_Name": names[sender],
+      "Sender_Type": types[sender],
+      "Sender_BaseType": "WSF_PLATFORM",
+      "SenderLocation_X": x[sender],
+      "SenderLocation_Y": y[sender],
+      "SenderLocation_Z": z[sender],
+      "Sender_Latitude": latitude[sender],
+      "Sender_Longitude": longitude[sender],
+      "Sender_Altitude": altitude[sender],
+      "SenderPart_Name": "radio",
+      "SenderPart_Type": "RADIO",
+      "SenderPart_BaseType": "WSF_COMM",
+      "Receiver_Name": names[receiver],
+      "Receiver_Type": types[receiver],
+      "Receiver_BaseType": "WSF_PLATFORM",
+      "ReceiverLocation_X": x[receiver],
+      "ReceiverLocation_Y": y[receiver],
+      "ReceiverLocation_Z": z[receiver],
+      "Receiver_Latitude": latitude[receiver],
+      "Receiver_Longitude": longitude[receiver],
+      "Receiver_Altitude": altitude[receiver],
+      "ReceiverPart_Name": "radio",
+      "ReceiverPart_Type": "RADIO",
+      "ReceiverPart_BaseType": "WSF_COMM",
+      "SenderToRcvr_Range": np.sqrt((x[sender] - x[receiver])**2 + (y[sender] - y[receiver])**2 + (z[sender] - z[receiver])**2),
+      "CommInteraction_Succeeded": (~failed).astype(int),
+      "CommInteraction_Failed": failed.astype(int),
+      "CommInteraction_FailedStatus": np.where(failed, rng.choice(FAILURE_REASONS, num_rows), "Does Not Exist"),
+      "Queue_Size": rng.integers(0, 32, num_rows)
+   })
+   frame["Timestamp"] = timestamps
+
+   return frame
@@ -0,0 +1,58 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from plotly.io.json import to_json_plotly
+from benchmarks.synthetic_events import make_events
+from inspector_packages.data_store import LinkIndex
+from inspector_packages.elements import FigureFactory, GlobeComms, GlobePlot
+
+
+def measure_globe_frames(frame, binary_arrays, num_frames):
+
+   FigureFactory.binary_arrays = binary_arrays
+   globe_plot = GlobePlot(frame, None, None, "low")
+   globe_comms = GlobeComms()
+
+   external = frame[frame["Event_Type"].isin(["MESSAGE_DELIVERY_ATTEMPT", "MESSAGE_RECEIVED"])]
+   link_index = LinkIndex(external, ["Sender_Name", "SenderPart_Name", "Receiver_Name", "ReceiverPart_Name"])
+
+   encode_times, payload_sizes = [], []
+   for timestamp in link_index.timestamps[:num_frames]:
+      plots, directions = globe_comms.update_external_events(link_index.groups_at(timestamp), "00:00:00.000")
+      figure = globe_plot.build_earth_figure(directions + plots)
+
+      start = time.perf_counter()
+      payload = to_json_plotly(figure)
+      encode_times.append(time.perf_counter() - start)
+      payload_sizes.append(len(payload.encode("utf-8")))
+
+   return statistics.median(encode_times), statistics.mean(payload_sizes)
+
+
+def main():
+
+   parser = argparse.ArgumentParser(description="Globe frame serialization cost for text vs binary typed arrays.")
+   parser.add_argument("--rows", type=int, default=200000)
+   parser.add_argument("--platforms", type=int, default=150)
+   parser.add_argument("--timestamps", type=int, default=500)
+   parser.add_argument("--frames", type=int, default=20)
+   args = parser.parse_args()
+
+   frame = make_events(args.rows, args.platforms, args.timestamps)
+   text_time, text_size = measure_globe_frames(frame, False, args.frames)
+   binary_time, binary_size = measure_globe_frames(frame, True, args.frames)
+
+   print(f"{'encoding':<10}{'serialize ms':>15}{'payload KB':>14}")
+   print(f"{'text':<10}{text_time * 1000:>15.1f}{text_size / 1024:>14.1f}")
+   print(f"{'binary':<10}{binary_time * 1000:>15.1f}{binary_size / 1024:>14.1f}")
+   print(f"serialization {text_time / binary_time:.1f}x faster, payload {text_size / binary_size:.1f}x smaller")
+
+
+if __name__ == "__main__":
+
+   main()
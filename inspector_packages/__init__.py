@@ -1,7 +1,11 @@
 import numpy as np
 import plotly.graph_objects as go
 
+# CommInteraction_FailedStatus of events that did not fail
+NO_FAILURE = "Does Not Exist"
+
 __all__ = [
    "go",
-   "np"
+   "np",
+   "NO_FAILURE"
 ]
\ No newline at end of file
@@ -4,6 +4,9 @@ MAIN_DISPLAY = "main-display"
 DISPLAYED_DATA = "displayed-data"
 FILTER_MEMORY = "filter-memory"
 DISPLAY_MEMORY = "display-memory"
+SESSION_ID = "session-id"
+TIMESTAMPS = "timestamps"
+CURRENT_TIME = "current-time"
 
 GLOBE_GRAPH = "globe-graph"
 CESIUM_EXTERNAL = "cesium-external"
@@ -11,6 +14,12 @@ CESIUM_INTERNAL = "cesium-internal"
 CESIUM_VIEWER = "cesium-viewer"
 CESIUM_CONFIG = "cesium-config"
 CESIUM_CAMERA = "cesium-camera"
+CESIUM_MESSAGE_PATH = "cesium-message-path"
+CESIUM_PLATFORMS = "cesium-platforms"
+CESIUM_VIEW = "cesium-view"
+CESIUM_CLUSTERS = "cesium-clusters"
+CESIUM_ACTIVITY = "cesium-activity"
+CULL_STATS = "cull-stats"
 PLOT_FILTERS = "plot-filters"
 
 PLOTS_AREA = "plots-area"
@@ -20,12 +29,37 @@ SUBPLOT_CATEGORY = "subplot-category"
 BAR_GRAPH_CATEGORY = "bar-graph-category"
 BAR_STACK_CATEGORY = "bar-stack-category"
 NETWORK_LAYOUT = "network-layout"
+NETWORK_SCOPE = "network-scope"
+TIMELINE_GRAPH = "timeline-graph"
+TIMELINE_SPLIT = "timeline-split"
+MESSAGE_GRAPH = "message-graph"
+TRACE_ORIGINATOR = "trace-originator"
+TRACE_SERIAL = "trace-serial"
+TRACE_DETAILS = "trace-details"
+TRACED_MESSAGE = "traced-message"
+HEALTH_GRAPH = "health-graph"
+HEALTH_METRICS = "health-metrics"
+REACH_GRAPH = "reach-graph"
+REACH_DEADLINE = "reach-deadline"
+LINK_METRICS_GRAPH = "link-metrics-graph"
+LINK_SELECT = "link-select"
+SERIES_GRAPH = "series-graph"
+SERIES_COLUMN = "series-column"
+SERIES_METHOD = "series-method"
+SERIES_WIDTH = "series-width"
 
 OPTIONS_ROW = "options-row"
 TIME_LABEL = "time-label"
+TIME_DENSITY = "time-density"
 TIME_SLIDER = "time-slider"
 PREVIOUS_TIME = "previous-time"
 NEXT_TIME = "next-time"
+WINDOW_SIZE = "window-size"
+WINDOW_STRIDE = "window-stride"
+PLATFORM_DISPLAY = "platform-display"
+TRAIL_LENGTH = "trail-length"
+DETAIL_LEVEL = "detail-level"
+HEATMAP_LAYER = "heatmap-layer"
 RADIOS = "radios"
 
 EVENT_TYPE = "event-type"
@@ -43,4 +77,5 @@ RECEIVER_TYPE = "receiver-type"
 RECEIVER_BASETYPE = "receiver-basetype"
 RECEIVER_PART = "receiver-part"
 RECEIVER_PART_TYPE = "receiver-part-type"
-RECEIVER_PART_BASETYPE = "receiver-part-basetype"
\ No newline at end of file
+RECEIVER_PART_BASETYPE = "receiver-part-basetype"
+REGION_FILTER = "region-filter"
\ No newline at end of file
@@ -1,10 +1,14 @@
 import json
+import pandas as pd
 from . import *
 from ..elements import *
+from ..data_store import *
 from inspector_packages import *
 from datetime import datetime
-from dash import no_update, ctx, Input, Output, State
+from dash import Input, Output, State, ClientsideFunction, Patch, ctx, no_update
+from dash.exceptions import PreventUpdate
 from .dash_layout import DashLayout
+from .job_manager import JobManager
 
 
 class DashCallbacks:
@@ -16,54 +20,76 @@ class DashCallbacks:
       resolution=None, 
       classification=None,
       cesium_config=None,
-      use_cesium=False):
+      use_cesium=False,
+      use_map=False,
+      validate_figures=False,
+      text_arrays=False):
+
+      FigureFactory.validate = validate_figures
+      FigureFactory.binary_arrays = not text_arrays
 
       self._df = df
-      self._timestamps = self._df["Timestamp"].unique()
-      self._current_frame = self._df
+      self._views = ViewCache(df)
+      self._tracks = PlatformTracks(df)
+      self._jobs = JobManager()
       self._cesium_config = cesium_config
 
       self._network_plot = NetworkPlot()
       self._globe_comms = GlobeComms()
+
+      # The map's layout and basemap go out once with the page; frames patch only its traces
+      globe_figure = None
+      if use_map and not use_cesium:
+         self._map_plot = MapPlot(df, land_color, ocean_color, resolution)
+         self._map_comms = MapComms()
+         globe_figure = self._map_plot.build_earth_figure([])
+
       self._dashboard = DashLayout(
          df, 
-         self._timestamps, classification, 
+         self._views.get(None).timestamps, classification, 
          self._network_plot.figure_name, 
          cesium_config,
-         use_cesium)
+         use_cesium,
+         self._time_density(self._views.get(None)),
+         globe_figure)
       self._app = self._dashboard.get_app()
 
       if use_cesium:
          self._cesium_globe = CesiumJSGlobe(self._app)
-      else:
+      elif not use_map:
          self._globe_plot = GlobePlot(df, land_color, ocean_color, resolution)
 
-      self._internal_messages = ["MESSAGE_INTERNAL", "MESSAGE_INCOMING", "MESSAGE_OUTGOING"]
-      self._external_messages = ["MESSAGE_DELIVERY_ATTEMPT", "MESSAGE_RECEIVED"]
-
       self._plots_options = {
          "Bar Plot": {"Graph": self._dashboard.initialize_barplot(), "Options": self._dashboard.initialize_barplot_options()},
-         "Network Plot": {"Graph": self._dashboard.initialize_network_plot(), "Options": self._dashboard.initialize_network_options()}
+         "Network Plot": {"Graph": self._dashboard.initialize_network_plot(), "Options": self._dashboard.initialize_network_options()},
+         "Network Health": {"Graph": self._dashboard.initialize_health_plot(), "Options": self._dashboard.initialize_health_options(
+            [{"label": label, "value": metric} for metric, label in NetworkPlot.HEALTH_METRICS.items()])},
+         "Reachability": {"Graph": self._dashboard.initialize_reachability_plot(), "Options": self._dashboard.initialize_reachability_options()},
+         "Link Metrics": {"Graph": self._dashboard.initialize_link_metrics_plot(), "Options": self._dashboard.initialize_link_metrics_options(
+            self._link_options(self._views.get(None).link_metrics))},
+         "Time Series": {"Graph": self._dashboard.initialize_series_plot(), "Options": self._dashboard.initialize_series_options()},
+         "Timeline": {"Graph": self._dashboard.initialize_timeline_plot(), "Options": self._dashboard.initialize_timeline_options()},
+         "Message Analytics": {"Graph": self._dashboard.initialize_message_plot(), "Options": self._dashboard.initialize_message_options()}
       }
 
-      self._filter_options = {
-         "Event_Type": self._df["Event_Type"].unique(),
-         "Message_SerialNumber": self._df["Message_SerialNumber"].unique(),
-         "Message_Originator": self._df["Message_Originator"].unique(),
-         "Message_Type": self._df["Message_Type"].unique(),
-         "Sender_Name": self._df["Sender_Name"].unique(),
-         "Sender_Type": self._df["Sender_Type"].unique(),
-         "Sender_BaseType": self._df["Sender_BaseType"].unique(),
-         "SenderPart_Name": self._df["SenderPart_Name"].unique(),
-         "SenderPart_Type": self._df["SenderPart_Type"].unique(),
-         "SenderPart_BaseType": self._df["SenderPart_BaseType"].unique(),
-         "Receiver_Name": self._df["Receiver_Name"].unique(),
-         "Receiver_Type": self._df["Receiver_Type"].unique(),
-         "Receiver_BaseType": self._df["Receiver_BaseType"].unique(),
-         "ReceiverPart_Name": self._df["ReceiverPart_Name"].unique(),
-         "ReceiverPart_Type": self._df["ReceiverPart_Type"].unique(),
-         "ReceiverPart_BaseType": self._df["ReceiverPart_BaseType"].unique()
-      }
+      self._filter_columns = [
+         "Event_Type",
+         "Message_SerialNumber",
+         "Message_Originator",
+         "Message_Type",
+         "Sender_Name",
+         "Sender_Type",
+         "Sender_BaseType",
+         "SenderPart_Name",
+         "SenderPart_Type",
+         "SenderPart_BaseType",
+         "Receiver_Name",
+         "Receiver_Type",
+         "Receiver_BaseType",
+         "ReceiverPart_Name",
+         "ReceiverPart_Type",
+         "ReceiverPart_BaseType"
+      ]
 
       self._empty_plot = {
          "paper_bgcolor":'rgba(0,0,0,0)',
@@ -86,115 +112,438 @@ class DashCallbacks:
 
       if use_cesium:
          self._define_cesium_filter_callback()
+         self._define_cesium_message_path_callback()
+         self._define_cesium_activity_callback()
+      elif use_map:
+         self._define_map_filter_callback()
       else:
          self._define_filter_callback()
 
       self._define_barplot_callback()
       self._define_network_plot_callback()
+      self._define_health_plot_callback()
+      self._define_reachability_plot_callback()
+      self._define_link_metrics_callback()
+      self._define_link_options_callback()
+      self._define_series_plot_callbacks()
+      self._define_timeline_plot_callback()
+      self._define_message_plot_callback()
+      self._define_message_trace_callback()
       self._define_plot_select_callback()
       self._define_filter_storage_callback()
       self._define_dropdown_options_callback()
-      self._define_time_button_callback()
-      self._define_time_label_callback()
+      self._define_time_navigation_callbacks()
+      self._define_timeline_callback()
+      self._define_session_callback()
 
    @property
    def app(self):
 
       return self._app
 
-   def _get_current_data(self, value):
+   def prebuild(self):
 
-      frame = self._current_frame
+      view = self._views.unfiltered
+      view.prebuild()
+      view.category_counts("Event_Type", "Sender_Name", "Receiver_Name")
 
-      if ctx.triggered_id != TIME_SLIDER:
-         self._timestamps = frame["Timestamp"].unique()
+   def _get_current_data(self, timestamp, window_size, view):
 
-      if ctx.triggered_id != TIME_SLIDER:
-         frame = frame[frame["Timestamp"] == self._timestamps[0]]
-         current_time = datetime.utcfromtimestamp(self._timestamps[0]).strftime("%H:%M:%S.%f")[:-3]
-      else:
-         frame = frame[frame["Timestamp"] == value]
-         current_time = datetime.utcfromtimestamp(value).strftime("%H:%M:%S.%f")[:-3]
-
-      internal = frame[frame["Event_Type"].isin(self._internal_messages)]
-      external = frame[frame["Event_Type"].isin(self._external_messages)]
+      if timestamp is None:
+         timestamp = view.timestamps[0] if len(view.timestamps) != 0 else 0
 
-      return (internal, external, current_time)
+      window_end = timestamp + window_size if window_size else timestamp
 
-   def _filter_dataframe(self):
+      current_time = datetime.utcfromtimestamp(timestamp).strftime("%H:%M:%S.%f")[:-3]
+      if window_end != timestamp:
+         current_time += " - " + datetime.utcfromtimestamp(window_end).strftime("%H:%M:%S.%f")[:-3]
 
-      df = self._df
-      for key, val in self._filter_options.items():
-         if val is not None and len(val) != 0:
-            df = df[df[key].isin(val)]
+      return (timestamp, window_end, current_time)
 
-      return df
+   def _get_view(self, filter_data):
 
-   def _define_time_label_callback(self):
+      return self._views.get(filter_data)
 
-      @self._app.callback(
-         Output(TIME_LABEL, "children"),
-         Input(TIME_SLIDER, "value"),
-         Input(RADIOS, 'value')
-      )
-      def _write_time_label(value, radio_val):
+   def _time_density(self, view):
 
-         current_time = datetime.utcfromtimestamp(value).strftime("%H:%M:%S.%f")[:-3]
+      return TimelinePlot.density_figure(view.frame["Timestamp"].to_numpy(), view.timestamps)
 
-         if radio_val:
-            return f"Current Time: {current_time}"
-         else:
-            return "Plots not tied to time!"
+   def _define_session_callback(self):
 
+      self._app.clientside_callback(
+         ClientsideFunction(
+            namespace='Inspector',
+            function_name='session_id'
+         ),
+         Output(SESSION_ID, 'data'),
+         Input(MAIN_DISPLAY, 'id'),
+         State(SESSION_ID, 'data')
+      )
 
    def _define_barplot_callback(self):
 
       @self._app.callback(
          Output(BAR_GRAPH, "figure"),
-         Input(TIME_SLIDER, "value"),
+         Input(CURRENT_TIME, "data"),
          Input(SUBPLOT_CATEGORY, "value"),
          Input(BAR_GRAPH_CATEGORY, "value"),
          Input(BAR_STACK_CATEGORY, "value"),
          Input(DISPLAY_MEMORY, "data"),
-         Input(RADIOS, 'value')
+         Input(RADIOS, 'value'),
+         Input(WINDOW_SIZE, 'value'),
+         State(SESSION_ID, 'data')
       )
       def update_barplots(
          time_value, subplot_category, 
          bar_graph_category, bar_stack_category,
-         filter_data, radio_val):
+         filter_data, radio_val, window_size, session_id):
 
-         frame = self._current_frame
+         with self._jobs.latest(session_id, BAR_GRAPH) as job:
+            view = self._get_view(filter_data)
+            category_counts = view.category_counts(subplot_category, bar_graph_category, bar_stack_category)
 
-         if radio_val:
-            frame = frame[frame["Timestamp"] == time_value]
+            if radio_val:
+               start, end, _ = self._get_current_data(time_value, window_size, view)
+               counts = category_counts.between(start, end)
+            else:
+               counts = category_counts.total()
 
-         if not frame.empty:
-            return BarPlot.generate_barplots(frame, subplot_category, bar_graph_category, bar_stack_category)
-         else:
-            return go.Figure({"data": None, "layout": self._empty_plot})
+            job.check()
+            if not counts.empty:
+               return BarPlot.generate_barplots(counts, subplot_category, bar_graph_category, bar_stack_category)
+            else:
+               return FigureFactory.build([], self._empty_plot)
 
 
    def _define_network_plot_callback(self):
 
          @self._app.callback(
             Output(self._network_plot.figure_name, "figure"),
-            Input(TIME_SLIDER, "value"),
+            Input(CURRENT_TIME, "data"),
             Input(NETWORK_LAYOUT, "value"),
+            Input(NETWORK_SCOPE, "value"),
             Input(DISPLAY_MEMORY, "data"),
-            Input(RADIOS, 'value')
+            Input(RADIOS, 'value'),
+            Input(WINDOW_SIZE, 'value'),
+            State(SESSION_ID, 'data')
          )
-         def update_network_plot(time_value, network_layout, filter_data, radio_val):
+         def update_network_plot(time_value, network_layout, layout_scope, filter_data, radio_val, window_size, session_id):
 
-            frame = self._current_frame
+            with self._jobs.latest(session_id, self._network_plot.figure_name) as job:
+               view = self._get_view(filter_data)
 
-            if radio_val:
-               frame = frame[frame["Timestamp"] == time_value]
+               if radio_val:
+                  start, end, _ = self._get_current_data(time_value, window_size, view)
+                  frame = view.external_index.frame_between(start, end)
+               else:
+                  frame = view.external_index.frame
+
+               job.check()
+               if frame.empty:
+                  return FigureFactory.build([], self._empty_plot)
+
+               if layout_scope == "Global":
+                  node_positions = view.network_layouts.global_layout(network_layout)
+               else:
+                  node_positions = view.network_layouts.layout(frame, network_layout, session_id)
+
+               return self._network_plot.generate_network_figure(frame, node_positions, self._empty_plot)
+
+
+   def _define_health_plot_callback(self):
+
+      @self._app.callback(
+         Output(HEALTH_GRAPH, "figure"),
+         Input(CURRENT_TIME, "data"),
+         Input(HEALTH_METRICS, "value"),
+         Input(DISPLAY_MEMORY, "data"),
+         State(SESSION_ID, 'data')
+      )
+      def update_health_plot(time_value, metrics, filter_data, session_id):
+
+         with self._jobs.latest(session_id, HEALTH_GRAPH) as job:
+            graph = self._get_view(filter_data).temporal_graph
+            health = graph.health
+
+            if health.empty or not metrics:
+               return FigureFactory.build([], self._empty_plot)
+
+            if "Peak_Betweenness" in metrics:
+               health = health.join(graph.betweenness_series().rename("Peak_Betweenness"), how="outer")
+
+            job.check()
+            return NetworkPlot.health_figure(health, metrics, time_value)
+
+
+   def _define_reachability_plot_callback(self):
+
+      @self._app.callback(
+         Output(REACH_GRAPH, "figure"),
+         Input(CURRENT_TIME, "data"),
+         Input(REACH_DEADLINE, "value"),
+         Input(DISPLAY_MEMORY, "data"),
+         State(SESSION_ID, 'data')
+      )
+      def update_reachability_plot(time_value, deadline, filter_data, session_id):
+
+         with self._jobs.latest(session_id, REACH_GRAPH) as job:
+            view = self._get_view(filter_data)
+            reachability = view.reachability
+
+            if len(reachability.platforms) == 0 or not deadline:
+               return FigureFactory.build([], self._empty_plot)
+
+            start, _, _ = self._get_current_data(time_value, None, view)
+            latency = reachability.latency_matrix(start, deadline)
+
+            job.check()
+            return NetworkPlot.reachability_figure(reachability.platforms, latency, deadline)
+
+
+   def _define_link_metrics_callback(self):
+
+      @self._app.callback(
+         Output(LINK_METRICS_GRAPH, "figure"),
+         Input(CURRENT_TIME, "data"),
+         Input(LINK_SELECT, "value"),
+         Input(DISPLAY_MEMORY, "data"),
+         Input(WINDOW_SIZE, 'value'),
+         State(SESSION_ID, 'data')
+      )
+      def update_link_metrics(time_value, link, filter_data, window_size, session_id):
+
+         with self._jobs.latest(session_id, LINK_METRICS_GRAPH) as job:
+            view = self._get_view(filter_data)
+            if len(view.timestamps) == 0:
+               return FigureFactory.build([], self._empty_plot)
 
-            frame = frame[frame["Event_Type"].isin(self._external_messages)]
-            if not frame.empty:
-               return self._network_plot.generate_network_figure(frame, network_layout, self._empty_plot)
+            window = window_size or LinkMetrics.WINDOW
+            sample = np.unique(np.linspace(0, len(view.timestamps) - 1, 600).astype(np.int64))
+            link = json.loads(link) if link else None
+            series = view.link_metrics.series(view.timestamps[sample], window, link)
+
+            job.check()
+            if series.empty:
+               return FigureFactory.build([], self._empty_plot)
+
+            return LinkMetricsPlot.metrics_figure(series, window, view.link_metrics.reasons, time_value)
+
+
+   def _define_link_options_callback(self):
+
+      # The link dropdown is only mounted while the Link Metrics panel is shown
+      @self._app.callback(
+         Output(LINK_SELECT, "options"),
+         Output(LINK_SELECT, "value"),
+         Input(DISPLAY_MEMORY, "data"),
+         Input(LINK_SELECT, "id"),
+         State(LINK_SELECT, "value")
+      )
+      def update_link_options(filter_data, _, link):
+
+         options = self._link_options(self._get_view(filter_data).link_metrics)
+         if link not in {option["value"] for option in options}:
+            link = None
+
+         return options, link
+
+
+   def _link_options(self, link_metrics):
+
+      options = []
+      for sender, sender_part, receiver, receiver_part in sorted(link_metrics.links):
+         options.append({
+            "label": f"{sender} ({sender_part}) >> {receiver} ({receiver_part})",
+            "value": json.dumps([sender, sender_part, receiver, receiver_part])
+         })
+
+      return options
+
+
+   def _success_rates(self, view, end, window_size):
+
+      return view.link_metrics.success_rates(end, window_size or LinkMetrics.WINDOW)
+
+
+   def _define_series_plot_callbacks(self):
+
+      self._app.clientside_callback(
+         ClientsideFunction(
+            namespace='Inspector',
+            function_name='graph_width'
+         ),
+         Output(SERIES_WIDTH, 'data'),
+         Input(SERIES_GRAPH, 'id')
+      )
+
+      @self._app.callback(
+         Output(SERIES_GRAPH, "figure"),
+         Input(SERIES_COLUMN, "value"),
+         Input(SERIES_METHOD, "value"),
+         Input(DISPLAY_MEMORY, "data"),
+         Input(SERIES_GRAPH, "relayoutData"),
+         Input(SERIES_WIDTH, "data"),
+         State(SESSION_ID, 'data')
+      )
+      def update_series_plot(column, method, filter_data, relayout_data, width, session_id):
+
+         if ctx.triggered_id == SERIES_GRAPH and not any(key.startswith("xaxis") for key in (relayout_data or {})):
+            raise PreventUpdate
+
+         with self._jobs.latest(session_id, SERIES_GRAPH) as job:
+            times, values = self._get_view(filter_data).time_series(column)
+            if times.shape[0] == 0:
+               return FigureFactory.build([], self._empty_plot)
+
+            x_range = self._get_visible_span(relayout_data, times[0], times[-1])
+            lower = np.searchsorted(times, x_range[0], side="left")
+            upper = np.searchsorted(times, x_range[1], side="right")
+            times, values = times[lower:upper], values[lower:upper]
+
+            num_pixels = int(width or 800)
+            if method == "min_max":
+               positions = SeriesDownsampler.min_max(times, values, num_pixels // 2)
             else:
-               return go.Figure({"data": None, "layout": self._empty_plot})
+               positions = SeriesDownsampler.lttb(times, values, num_pixels)
+
+            job.check()
+            return SeriesPlot.series_figure(
+               times[positions], values[positions], column, times.shape[0], x_range, f"{column}-{json.dumps(filter_data, sort_keys=True)}")
+
+
+   def _define_timeline_plot_callback(self):
+
+      @self._app.callback(
+         Output(TIMELINE_GRAPH, "figure"),
+         Input(TIMELINE_SPLIT, "value"),
+         Input(DISPLAY_MEMORY, "data"),
+         Input(TIMELINE_GRAPH, "relayoutData"),
+         State(SESSION_ID, 'data')
+      )
+      def update_timeline_plot(split, filter_data, relayout_data, session_id):
+
+         if ctx.triggered_id == TIMELINE_GRAPH and not any(key.startswith("xaxis") for key in (relayout_data or {})):
+            raise PreventUpdate
+
+         with self._jobs.latest(session_id, TIMELINE_GRAPH) as job:
+            view = self._get_view(filter_data)
+            pyramid = view.time_pyramid
+
+            x_range = self._get_visible_span(relayout_data, pyramid.start, pyramid.end)
+            resolution = pyramid.resolution_for(*x_range)
+            series = pyramid.series(split, x_range[0], x_range[1], resolution)
+
+            job.check()
+            if series.empty:
+               return FigureFactory.build([], self._empty_plot)
+
+            return TimelinePlot.pyramid_figure(series, resolution, x_range, f"{split}-{json.dumps(filter_data, sort_keys=True)}")
+
+
+   def _get_visible_span(self, relayout_data, start, end):
+
+      relayout_data = relayout_data or {}
+
+      if relayout_data.get("xaxis.autorange"):
+         return (start, end)
+
+      x_range = relayout_data.get("xaxis.range")
+      if x_range is None and "xaxis.range[0]" in relayout_data:
+         x_range = [relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"]]
+
+      if x_range is None:
+         return (start, end)
+
+      # Zooming out past the data must not widen the span that gets bucketed
+      lower, upper = (pd.Timestamp(value).timestamp() for value in x_range)
+      lower = min(max(lower, start), end)
+
+      return (lower, max(min(upper, end), lower))
+
+
+   def _define_message_plot_callback(self):
+
+      @self._app.callback(
+         Output(MESSAGE_GRAPH, "figure"),
+         Input(DISPLAY_MEMORY, "data"),
+         State(SESSION_ID, 'data')
+      )
+      def update_message_plot(filter_data, session_id):
+
+         with self._jobs.latest(session_id, MESSAGE_GRAPH) as job:
+            summary = self._get_view(filter_data).message_index.summary
+
+            job.check()
+            if summary.empty:
+               return FigureFactory.build([], self._empty_plot)
+
+            return MessagePlot.summary_figure(summary)
+
+
+   def _define_message_trace_callback(self):
+
+      @self._app.callback(
+         Output(TRACED_MESSAGE, "data"),
+         Output(TRACE_DETAILS, "children"),
+         Input(TRACE_ORIGINATOR, "value"),
+         Input(TRACE_SERIAL, "value"),
+         Input(DISPLAY_MEMORY, "data")
+      )
+      def trace_message(originator, serial_number, filter_data):
+
+         if originator is None or serial_number is None:
+            return None, None
+
+         message = self._get_view(filter_data).message_index.describe(originator, serial_number)
+         traced_message = {"originator": originator, "serial_number": serial_number} if message is not None else None
+
+         return traced_message, "\n".join(MessagePlot.describe_message(message))
+
+
+   def _get_message_links(self, traced_message, view):
+
+      if traced_message is None:
+         return None
+
+      links = view.message_index.links(traced_message["originator"], traced_message["serial_number"])
+
+      return links if not links.empty else None
+
+
+   def _get_platforms(self, time, platform_display, trail_length):
+
+      if platform_display == "Hidden" or len(self._tracks.platforms) == 0:
+         return None, None
+
+      platforms = self._tracks.frame_at(time)
+      trails = None
+      if platform_display == "Trails" and trail_length:
+         _, trails = self._tracks.trails(time, trail_length)
+
+      return platforms, trails
+
+
+   def _get_activity(self, view, heatmap, start, end):
+
+      if not heatmap or heatmap == "Off" or view.frame.empty:
+         return None, None
+
+      layer, scope = heatmap.split("|")
+      if scope == "Mission":
+         return layer, view.activity_grid.counts(layer)
+
+      return layer, view.activity_grid.counts(layer, start, end)
+
+
+   def _get_clusters(self, view, start, end, platforms, culler, eye_distance, fov=None):
+
+      if platforms is None:
+         platforms = self._tracks.frame_at(end, [])
+
+      level = SpatialClusters.level_for(eye_distance, GlobeMethods.EQUATOR_RADIUS, fov)
+      clusters, bundles = view.spatial_clusters(start, end, platforms).at(level)
+
+      return culler.cull_clusters(clusters), culler.cull_bundles(bundles), level
 
 
    def _define_plot_select_callback(self):
@@ -211,131 +560,328 @@ class DashCallbacks:
          return option["Graph"], option["Options"]
 
 
-   def _define_time_button_callback(self):
+   def _define_time_navigation_callbacks(self):
 
-      @self._app.callback(
+      self._app.clientside_callback(
+         ClientsideFunction(
+            namespace='Inspector',
+            function_name='shift_time'
+         ),
          Output(TIME_SLIDER, 'value', allow_duplicate=True),
          Input(PREVIOUS_TIME, 'n_clicks'),
          Input(NEXT_TIME, 'n_clicks'),
          State(TIME_SLIDER, 'value'),
+         State(TIMESTAMPS, 'data'),
+         State(WINDOW_STRIDE, 'value'),
          prevent_initial_call=True
       )
-      def shift_time(previous_time, next_time, current_time):
 
-         if current_time is None:
-            return self._timestamps[0]
+      self._app.clientside_callback(
+         ClientsideFunction(
+            namespace='Inspector',
+            function_name='current_time'
+         ),
+         Output(CURRENT_TIME, 'data'),
+         Input(TIME_SLIDER, 'value'),
+         Input(TIMESTAMPS, 'data')
+      )
 
-         current_idx = np.where(self._timestamps == current_time)[0][0]
+      self._app.clientside_callback(
+         ClientsideFunction(
+            namespace='Inspector',
+            function_name='time_label'
+         ),
+         Output(TIME_LABEL, 'children'),
+         Input(CURRENT_TIME, 'data'),
+         Input(RADIOS, 'value'),
+         Input(WINDOW_SIZE, 'value')
+      )
 
-         if ctx.triggered_id == PREVIOUS_TIME:
-            if current_idx != 0:
-               return self._timestamps[current_idx-1]
-            else:
-               return self._timestamps[0]
 
-         if ctx.triggered_id == NEXT_TIME:
-            if current_idx != self._timestamps.shape[0] - 1:
-               return self._timestamps[current_idx+1]
-            else:
-               return self._timestamps[-1]
+   def _define_timeline_callback(self):
+
+      @self._app.callback(
+         Output(TIMESTAMPS, 'data'),
+         Output(TIME_DENSITY, 'figure'),
+         Output(TIME_SLIDER, 'max'),
+         Output(TIME_SLIDER, 'value'),
+         Input(DISPLAY_MEMORY, 'data'),
+         prevent_initial_call=True
+      )
+      def update_timeline(filter_data):
+
+         view = self._get_view(filter_data)
+
+         return (
+            FigureFactory.typed_array(view.timestamps, np.float64),
+            self._time_density(view),
+            max(len(view.timestamps) - 1, 0),
+            0)
 
 
    def _define_filter_callback(self):
 
       @self._app.callback(
-         [Output(GLOBE_GRAPH, 'figure'),
+         Output(GLOBE_GRAPH, 'figure'),
+         Output(CULL_STATS, 'children'),
          # Output('empty-dataframe-message', 'style'), Output('empty-dataframe-message', 'children'),
-         Output(TIME_SLIDER, 'min'), Output(TIME_SLIDER, 'max'),
-         Output(TIME_SLIDER, 'value'), Output(TIME_SLIDER, 'marks')],
-         Input(TIME_SLIDER, 'value'),
+         Input(CURRENT_TIME, 'data'),
          Input(DISPLAY_MEMORY, "data"),
+         Input(WINDOW_SIZE, 'value'),
+         Input(TRACED_MESSAGE, 'data'),
+         Input(PLATFORM_DISPLAY, 'value'),
+         Input(TRAIL_LENGTH, 'value'),
+         Input(DETAIL_LEVEL, 'value'),
+         Input(HEATMAP_LAYER, 'value'),
+         Input(GLOBE_GRAPH, 'relayoutData'),
+         State(SESSION_ID, 'data')
          # State('empty-dataframe-message', 'style')
       )
-      def filter_frame(value, filter_data):
+      def filter_frame(value, filter_data, window_size, traced_message, platform_display, trail_length, detail_level, heatmap, relayout_data, session_id):
 
-         internal, external, current_time = self._get_current_data(value)
+         camera_eye = (relayout_data or {}).get("scene.camera", {}).get("eye")
+         if ctx.triggered_id == GLOBE_GRAPH and camera_eye is None:
+            raise PreventUpdate
 
-         update = []
-         if not external.empty:
-            transmission_plots, transmission_directions = self._globe_comms.update_external_events(external, current_time)
-            update.extend(transmission_directions)
-            update.extend(transmission_plots)
+         with self._jobs.latest(session_id, GLOBE_GRAPH) as job:
+            view = self._get_view(filter_data)
+            start, end, current_time = self._get_current_data(value, window_size, view)
+            internal = view.internal_index.frame_between(start, end)
+            external = view.external_index.frame_between(start, end)
 
-         if not internal.empty:
-            new_plot = self._globe_comms.update_internal_events(internal, current_time)
-            update.append(new_plot)
-
-         self._globe_plot.set_camera_view(internal, external)
-         fig = self._globe_plot.build_earth_figure(update)
+            # A rotation or zoom keeps the analyst's view; any other change recentres on the data
+            if ctx.triggered_id == GLOBE_GRAPH:
+               camera_view = camera_eye
+            else:
+               camera_view = self._globe_plot.set_camera_view(internal, external)
+            eye = self._globe_plot.camera_eye(camera_view)
+            culler = ViewCuller(eye, fov=np.pi)
+
+            update = []
+            layer, counts = self._get_activity(view, heatmap, start, end)
+            if counts is not None:
+               update.append(self._globe_plot.activity_overlay(view.activity_grid, counts, layer))
+
+            platforms, trails = self._get_platforms(end, platform_display, trail_length)
+            if detail_level == "Clustered":
+               clusters, bundles, level = self._get_clusters(view, start, end, platforms, culler, np.linalg.norm(eye))
+               update.extend(self._globe_comms.update_clusters(clusters, bundles, current_time))
+               external = external.iloc[0:0]
+            elif platforms is not None:
+               platforms, trails = culler.cull_platforms(platforms, trails)
+               update.extend(self._globe_comms.update_platforms(platforms, trails))
+
+            if not external.empty:
+               external_groups = culler.cull_links(view.external_index.groups_between(start, end))
+               success_rates = self._success_rates(view, end, window_size)
+               transmission_plots, transmission_directions = self._globe_comms.update_external_events(external_groups, current_time, success_rates)
+               update.extend(transmission_directions)
+               update.extend(transmission_plots)
+
+            job.check()
+            if not internal.empty:
+               internal_groups = culler.cull_points(view.internal_index.groups_between(start, end))
+               new_plot = self._globe_comms.update_internal_events(internal_groups, current_time)
+               update.append(new_plot)
+
+            links = self._get_message_links(traced_message, view)
+            if links is not None:
+               message_info = "<br>".join(MessagePlot.describe_message(view.message_index.describe(**traced_message)))
+               update.extend(self._globe_comms.update_message_path(links, message_info))
+
+            summary = culler.summary()
+            if detail_level == "Clustered":
+               summary = f"Level {level} | {summary}"
+
+            return self._globe_plot.build_earth_figure(update, camera_view), summary
+
+   def _define_map_filter_callback(self):
 
-         if ctx.triggered_id != TIME_SLIDER and len(self._timestamps) != 0:
-            slider_marks = {}
-            for val in self._timestamps:
-               slider_marks[val] = '' 
-            return fig, self._timestamps[0], self._timestamps[-1], self._timestamps[0], slider_marks
-         else:
-            return fig, no_update, no_update, no_update, no_update
+      @self._app.callback(
+         Output(GLOBE_GRAPH, 'figure'),
+         Output(CULL_STATS, 'children'),
+         Input(CURRENT_TIME, 'data'),
+         Input(DISPLAY_MEMORY, "data"),
+         Input(WINDOW_SIZE, 'value'),
+         Input(TRACED_MESSAGE, 'data'),
+         Input(PLATFORM_DISPLAY, 'value'),
+         Input(TRAIL_LENGTH, 'value'),
+         Input(DETAIL_LEVEL, 'value'),
+         Input(HEATMAP_LAYER, 'value'),
+         Input(GLOBE_GRAPH, 'relayoutData'),
+         State(SESSION_ID, 'data')
+      )
+      def map_frame(value, filter_data, window_size, traced_message, platform_display, trail_length, detail_level, heatmap, relayout_data, session_id):
+
+         # Pan and zoom stay in the browser; only the clustered view follows the zoom
+         span = MapPlot.visible_span(relayout_data)
+         if ctx.triggered_id == GLOBE_GRAPH and (detail_level != "Clustered" or span is None):
+            raise PreventUpdate
+
+         with self._jobs.latest(session_id, GLOBE_GRAPH) as job:
+            view = self._get_view(filter_data)
+            start, end, current_time = self._get_current_data(value, window_size, view)
+            internal = view.internal_index.frame_between(start, end)
+            external = view.external_index.frame_between(start, end)
+
+            update = []
+            layer, counts = self._get_activity(view, heatmap, start, end)
+            if counts is not None:
+               update.append(self._map_plot.activity_overlay(view.activity_grid, counts, layer))
+
+            summary = None
+            platforms, trails = self._get_platforms(end, platform_display, trail_length)
+            if detail_level == "Clustered":
+               if platforms is None:
+                  platforms = self._tracks.frame_at(end, [])
+               level = SpatialClusters.level_for_span(span or 360.0)
+               clusters, bundles = view.spatial_clusters(start, end, platforms).at(level)
+               update.extend(self._map_comms.update_clusters(clusters, bundles, current_time))
+               external = external.iloc[0:0]
+               summary = f"Level {level}"
+            elif platforms is not None:
+               update.extend(self._map_comms.update_platforms(platforms, trails))
+
+            if not external.empty:
+               external_groups = view.external_index.groups_between(start, end)
+               success_rates = self._success_rates(view, end, window_size)
+               transmission_lines, transmission_directions = self._map_comms.update_external_events(external_groups, current_time, success_rates)
+               update.extend(transmission_lines)
+               update.extend(transmission_directions)
+
+            job.check()
+            if not internal.empty:
+               update.append(self._map_comms.update_internal_events(view.internal_index.groups_between(start, end), current_time))
+
+            links = self._get_message_links(traced_message, view)
+            if links is not None:
+               message_info = "<br>".join(MessagePlot.describe_message(view.message_index.describe(**traced_message)))
+               update.extend(self._map_comms.update_message_path(links, message_info))
+
+            figure = Patch()
+            figure["data"] = update
+
+            return figure, summary
 
    def _define_cesium_filter_callback(self):
 
       @self._app.callback(
          [Output(CESIUM_EXTERNAL, 'data'), Output(CESIUM_INTERNAL, 'data'), Output(CESIUM_CAMERA, 'data'),
-         Output(TIME_SLIDER, 'min'), Output(TIME_SLIDER, 'max'),
-         Output(TIME_SLIDER, 'value'), Output(TIME_SLIDER, 'marks')],
-         Input(TIME_SLIDER, 'value'),
+          Output(CESIUM_PLATFORMS, 'data'), Output(CESIUM_CLUSTERS, 'data'), Output(CULL_STATS, 'children')],
+         Input(CURRENT_TIME, 'data'),
          Input(DISPLAY_MEMORY, 'data'),
+         Input(WINDOW_SIZE, 'value'),
+         Input(PLATFORM_DISPLAY, 'value'),
+         Input(TRAIL_LENGTH, 'value'),
+         Input(DETAIL_LEVEL, 'value'),
+         Input(CESIUM_VIEW, 'data'),
+         State(SESSION_ID, 'data')
       )
-      def cesium_globe_callback(value, filter_data):
-
-         internal, external, current_time = self._get_current_data(value)
-
-         external_json = {}
-         if not external.empty:
-            group_idx = 1
-            for transmission, group in external.groupby(["Sender_Name", "SenderPart_Name", "Receiver_Name", "ReceiverPart_Name"]):
-               
-               x, y, z = CesiumJSGlobe.get_line_points(group)
-               
-               external_json[f"group_{group_idx}"] = {
-                  "transmission": list(transmission), 
-                  "info": group.to_dict(),
-                  "line_points": {"x": x, "y": y, "z": z},
-                  "current_time": current_time
+      def cesium_globe_callback(value, filter_data, window_size, platform_display, trail_length, detail_level, cesium_view, session_id):
+
+         with self._jobs.latest(session_id, GLOBE_GRAPH) as job:
+            view = self._get_view(filter_data)
+            start, end, current_time = self._get_current_data(value, window_size, view)
+            internal = view.internal_index.frame_between(start, end)
+            external = view.external_index.frame_between(start, end)
+
+            # A camera move keeps the analyst's view; any other change flies to the data
+            if ctx.triggered_id == CESIUM_VIEW and cesium_view:
+               camera_view = no_update
+               eye = [cesium_view["position"][axis] for axis in "xyz"]
+               culler = ViewCuller.from_camera(cesium_view)
+            else:
+               camera_view = CesiumJSGlobe.set_camera_view(internal, external)
+               eye = [camera_view["x"], camera_view["y"], camera_view["z"]]
+               culler = ViewCuller(
+                  eye,
+                  fov=(cesium_view or {}).get("fov"),
+                  aspect_ratio=(cesium_view or {}).get("aspect_ratio"))
+
+            platforms_json, clusters_json = None, None
+            platforms, trails = self._get_platforms(end, platform_display, trail_length)
+            if detail_level == "Clustered":
+               clusters, bundles, level = self._get_clusters(
+                  view, start, end, platforms, culler, np.linalg.norm(eye), (cesium_view or {}).get("fov"))
+               clusters_json = json.dumps(CesiumJSGlobe.get_clusters(clusters, bundles))
+               external = external.iloc[0:0]
+            elif platforms is not None:
+               platforms_json = json.dumps(CesiumJSGlobe.get_platforms(*culler.cull_platforms(platforms, trails)))
+
+            external_json = {}
+            if not external.empty:
+               success_rates = self._success_rates(view, end, window_size)
+               group_idx = 1
+               for transmission, group in culler.cull_links(view.external_index.groups_between(start, end)):
+                  
+                  x, y, z = CesiumJSGlobe.get_line_points(group)
+                  
+                  external_json[f"group_{group_idx}"] = {
+                     "transmission": list(transmission), 
+                     "info": group.to_dict(),
+                     "line_points": {"x": x, "y": y, "z": z},
+                     "current_time": current_time,
+                     "success_rate": success_rates.get(transmission)
+                     }
+
+                  group_idx += 1
+
+            job.check()
+            internal_json = {}
+            if not internal.empty:
+               for sender, group in culler.cull_points(view.internal_index.groups_between(start, end)):
+                  internal_json[sender] = {
+                     "info": group.to_dict(),
+                     "current_time": current_time
                   }
 
-               group_idx += 1
-
-         internal_json = {}
-         if not internal.empty:
-            for sender, group in internal.groupby("Sender_Name"):
-               internal_json[sender] = {
-                  "info": group.to_dict(),
-                  "current_time": current_time
-               }
-
-         camera_view = CesiumJSGlobe.set_camera_view(internal, external)
-
-         if ctx.triggered_id != TIME_SLIDER and len(self._timestamps) != 0:
-            slider_marks = {}
-            for val in self._timestamps:
-               slider_marks[val] = '' 
-            return [
-               json.dumps(external_json), 
-               json.dumps(internal_json), 
-               json.dumps(camera_view), 
-               self._timestamps[0], 
-               self._timestamps[-1], 
-               self._timestamps[0], 
-               slider_marks]
-         else:
             return [
                json.dumps(external_json), 
                json.dumps(internal_json), 
-               json.dumps(camera_view), 
-               no_update, 
-               no_update, 
-               no_update, 
-               no_update]
+               json.dumps(camera_view) if camera_view is not no_update else no_update,
+               platforms_json,
+               clusters_json,
+               f"Level {level} | {culler.summary()}" if detail_level == "Clustered" else culler.summary()]
+
+
+   def _define_cesium_message_path_callback(self):
+
+      @self._app.callback(
+         Output(CESIUM_MESSAGE_PATH, 'data'),
+         Input(TRACED_MESSAGE, 'data'),
+         Input(DISPLAY_MEMORY, 'data')
+      )
+      def cesium_message_path(traced_message, filter_data):
+
+         links = self._get_message_links(traced_message, self._get_view(filter_data))
+         if links is None:
+            return None
+
+         return json.dumps(CesiumJSGlobe.get_message_path(links))
+
+
+   def _define_cesium_activity_callback(self):
+
+      @self._app.callback(
+         Output(CESIUM_ACTIVITY, 'data'),
+         Input(CURRENT_TIME, 'data'),
+         Input(DISPLAY_MEMORY, 'data'),
+         Input(WINDOW_SIZE, 'value'),
+         Input(HEATMAP_LAYER, 'value')
+      )
+      def cesium_activity(value, filter_data, window_size, heatmap):
+
+         # A whole-mission layer does not change with the time slider
+         if heatmap and heatmap.endswith("|Mission") and ctx.triggered_id in [CURRENT_TIME, WINDOW_SIZE]:
+            raise PreventUpdate
+
+         view = self._get_view(filter_data)
+         start, end, _ = self._get_current_data(value, window_size, view)
+         _, counts = self._get_activity(view, heatmap, start, end)
+         if counts is None:
+            return None
+
+         return CesiumJSGlobe.get_activity_image(view.activity_grid, counts)
 
 
    def _define_filter_storage_callback(self):
@@ -358,6 +904,7 @@ class DashCallbacks:
          Input(RECEIVER_PART, "value"),
          Input(RECEIVER_PART_TYPE, "value"),
          Input(RECEIVER_PART_BASETYPE, "value"),
+         Input(REGION_FILTER, "value"),
          prevent_initial_call=True
       )
       def store_filter_info(
@@ -366,30 +913,21 @@ class DashCallbacks:
          sender_name, sender_type, sender_basetype,
          sender_part, sender_part_type, sender_part_basetype,
          rcvr_name, rcvr_type, rcvr_basetype, 
-         rcvr_part, rcvr_part_type, rcvr_part_basetype):
-
-         self._filter_options["Event_Type"] = evt_type
-         self._filter_options["Message_SerialNumber"] = msg_serial_number
-         self._filter_options["Message_Originator"] = msg_originator
-         self._filter_options["Message_Type"] = msg_type
-         self._filter_options["Sender_Name"] = sender_name
-         self._filter_options["Sender_Type"] = sender_type
-         self._filter_options["Sender_BaseType"] = sender_basetype
-         self._filter_options["SenderPart_Name"] = sender_part
-         self._filter_options["SenderPart_Type"] = sender_part_type
-         self._filter_options["SenderPart_BaseType"] = sender_part_basetype
-         self._filter_options["Receiver_Name"] = rcvr_name
-         self._filter_options["Receiver_Type"] = rcvr_type
-         self._filter_options["Receiver_BaseType"] = rcvr_basetype
-         self._filter_options["ReceiverPart_Name"] = rcvr_part
-         self._filter_options["ReceiverPart_Type"] = rcvr_part_type
-         self._filter_options["ReceiverPart_BaseType"] = rcvr_part_basetype
-
-         self._current_frame = self._filter_dataframe()
-
-         data = {"frame_filtered": True}
-
-         return data
+         rcvr_part, rcvr_part_type, rcvr_part_basetype,
+         region):
+
+         filter_values = [
+            evt_type, 
+            msg_serial_number, msg_originator, msg_type,
+            sender_name, sender_type, sender_basetype,
+            sender_part, sender_part_type, sender_part_basetype,
+            rcvr_name, rcvr_type, rcvr_basetype, 
+            rcvr_part, rcvr_part_type, rcvr_part_basetype]
+
+         filter_options = dict(zip(self._filter_columns, filter_values))
+         filter_options[FilteredView.REGION] = RegionIndex.parse(region)
+
+         return filter_options
 
    
    def _define_dropdown_options_callback(self):
@@ -417,10 +955,12 @@ class DashCallbacks:
       )
       def update_dropdown_options(filter_data):
 
+         view = self._get_view(filter_data)
+
          options = [] 
-         for column in self._filter_options:
-            options.append(self._current_frame[column].unique())
+         for column in self._filter_columns:
+            options.append(view.frame[column].unique())
 
-         options.append(True)
+         options.append(filter_data)
          
          return options
\ No newline at end of file
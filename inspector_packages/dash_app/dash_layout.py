@@ -1,6 +1,8 @@
 from . import *
 import dash_bootstrap_components as dbc
 from dash import dcc, html, Dash
+from ..elements import FigureFactory
+from inspector_packages import *
 
 
 class DashLayout:
@@ -11,14 +13,18 @@ class DashLayout:
       classification, 
       network_plot_name,
       cesium_config=None,
-      use_cesium=False):
+      use_cesium=False,
+      time_density=None,
+      globe_figure=None):
 
       self._df = df
       self._timestamps = timestamps
+      self._time_density = time_density
       self._classification = classification
       self._network_plot_name = network_plot_name
       self._cesium_config = cesium_config
       self._use_cesium = use_cesium
+      self._globe_figure = globe_figure if globe_figure is not None else {"data": [], "layout": {}}
 
       self._app = Dash(
          title=APP_NAME,
@@ -83,14 +89,151 @@ class DashLayout:
    def initialize_network_options(self):
 
       network_options = ["Spring", "Circular", "Shell", "Spectral", "Random"]
+      scope_options = ["Per Timestep", "Global"]
 
       network_dropdowns = dbc.AccordionItem([
          self._create_dropdown("Network Layout", NETWORK_LAYOUT, network_options, False, None, "Spring", False),
+         self._create_dropdown("Layout Scope", NETWORK_SCOPE, scope_options, False, None, "Per Timestep", False),
       ], title="Network Options")
 
       return network_dropdowns
 
 
+   def initialize_timeline_plot(self):
+
+      timeline_plot = dcc.Graph(
+         id=TIMELINE_GRAPH, 
+         config={"scrollZoom": True}, 
+         style={"height": "80vh"})
+
+      return timeline_plot
+
+
+   def initialize_timeline_options(self):
+
+      split_options = [
+         {"label": "Event Type", "value": "Event_Type"},
+         {"label": "Link", "value": "Link"},
+         {"label": "Failure Status", "value": "Failure_Status"}
+      ]
+
+      timeline_dropdowns = dbc.AccordionItem([
+         self._create_dropdown("Split By", TIMELINE_SPLIT, split_options, False, None, "Event_Type", False),
+      ], title="Timeline Options")
+
+      return timeline_dropdowns
+
+
+   def initialize_message_plot(self):
+
+      message_plot = dcc.Graph(
+         id=MESSAGE_GRAPH, 
+         config={"scrollZoom": False}, 
+         style={"height": "80vh"})
+
+      return message_plot
+
+
+   def initialize_message_options(self):
+
+      message_options = dbc.AccordionItem([
+         self._create_dropdown("Trace Originator", TRACE_ORIGINATOR, self._df["Message_Originator"].unique(), False, "Select Originator"),
+         self._create_number_input("Trace Serial Number", TRACE_SERIAL, None),
+         html.Div(id=TRACE_DETAILS, style={'whiteSpace': 'pre-line', 'paddingTop': '10px'})
+      ], title="Message Options")
+
+      return message_options
+
+
+   def initialize_health_plot(self):
+
+      health_plot = dcc.Graph(
+         id=HEALTH_GRAPH, 
+         config={"scrollZoom": True}, 
+         style={"height": "80vh"})
+
+      return health_plot
+
+
+   def initialize_health_options(self, metric_options):
+
+      health_dropdowns = dbc.AccordionItem([
+         self._create_dropdown("Metrics", HEALTH_METRICS, metric_options, True, None, ["Active_Links", "Components", "Mean_Degree"], False),
+      ], title="Network Health Options")
+
+      return health_dropdowns
+
+
+   def initialize_reachability_plot(self):
+
+      reachability_plot = dcc.Graph(
+         id=REACH_GRAPH, 
+         config={"scrollZoom": True}, 
+         style={"height": "80vh"})
+
+      return reachability_plot
+
+
+   def initialize_reachability_options(self):
+
+      reachability_options = dbc.AccordionItem([
+         self._create_number_input("Deadline (s)", REACH_DEADLINE, 30),
+      ], title="Reachability Options")
+
+      return reachability_options
+
+
+   def initialize_link_metrics_plot(self):
+
+      link_metrics_plot = dcc.Graph(
+         id=LINK_METRICS_GRAPH, 
+         config={"scrollZoom": True}, 
+         style={"height": "80vh"})
+
+      return link_metrics_plot
+
+
+   def initialize_link_metrics_options(self, link_options):
+
+      link_metrics_dropdowns = dbc.AccordionItem([
+         self._create_dropdown("Link", LINK_SELECT, link_options, False, "All Links"),
+      ], title="Link Metrics Options")
+
+      return link_metrics_dropdowns
+
+
+   def initialize_series_plot(self):
+
+      series_plot = dcc.Graph(
+         id=SERIES_GRAPH, 
+         config={"scrollZoom": True}, 
+         style={"height": "80vh"})
+
+      return series_plot
+
+
+   def initialize_series_options(self):
+
+      series_options = [
+         {"label": "Event Rate (events/s)", "value": "Event_Rate"},
+         {"label": "Queue Size", "value": "Queue_Size"},
+         {"label": "Sender to Receiver Range", "value": "SenderToRcvr_Range"},
+         {"label": "Message Size", "value": "Message_Size"},
+         {"label": "Message Priority", "value": "Message_Priority"}
+      ]
+      method_options = [
+         {"label": "Largest Triangle (LTTB)", "value": "lttb"},
+         {"label": "Min/Max per Pixel", "value": "min_max"}
+      ]
+
+      series_dropdowns = dbc.AccordionItem([
+         self._create_dropdown("Series", SERIES_COLUMN, series_options, False, None, "Queue_Size", False),
+         self._create_dropdown("Downsampling", SERIES_METHOD, method_options, False, None, "lttb", False),
+      ], title="Time Series Options")
+
+      return series_dropdowns
+
+
    def _set_dash_layout(self):
          
       self._app.layout = dcc.Loading(
@@ -107,6 +250,11 @@ class DashLayout:
             ),
             dcc.Store(id=FILTER_MEMORY),
             dcc.Store(id=DISPLAY_MEMORY),
+            dcc.Store(id=SESSION_ID),
+            dcc.Store(id=TIMESTAMPS, data=FigureFactory.typed_array(self._timestamps, np.float64)),
+            dcc.Store(id=CURRENT_TIME),
+            dcc.Store(id=TRACED_MESSAGE),
+            dcc.Store(id=SERIES_WIDTH),
             *self._add_cesium_elements(),
          ],
          target_components={MAIN_DISPLAY: "children"},
@@ -120,6 +268,11 @@ class DashLayout:
          dcc.Store(id=CESIUM_CAMERA),
          dcc.Store(id=CESIUM_EXTERNAL),
          dcc.Store(id=CESIUM_INTERNAL),
+         dcc.Store(id=CESIUM_MESSAGE_PATH),
+         dcc.Store(id=CESIUM_PLATFORMS),
+         dcc.Store(id=CESIUM_VIEW),
+         dcc.Store(id=CESIUM_CLUSTERS),
+         dcc.Store(id=CESIUM_ACTIVITY),
          html.Div(
             id="tooltip",
             style={
@@ -166,11 +319,14 @@ class DashLayout:
          children=[
             dbc.Col([
                self._create_globe_visual(),
+               self._create_cull_stats(),
+               self._create_time_density(),
                self._create_slider(),
-               self._create_time_buttons()
+               self._create_time_buttons(),
+               self._create_window_options()
             ], width=6),
             dbc.Col([
-               self._create_dropdown("Plots", PLOT_OPTIONS, ["Bar Plot", "Network Plot"], False, False, "Bar Plot", False),
+               self._create_dropdown("Plots", PLOT_OPTIONS, ["Bar Plot", "Network Plot", "Network Health", "Reachability", "Link Metrics", "Time Series", "Timeline", "Message Analytics"], False, False, "Bar Plot", False),
                self._create_plots_area(),
                self._create_time_label(),
                self._create_button_group()
@@ -228,29 +384,51 @@ class DashLayout:
       else:
          return dcc.Graph(
          id=GLOBE_GRAPH, 
+         figure=self._globe_figure,
          config={"scrollZoom": True}, 
          style={'height': '80vh'})
 
 
-   def _create_slider(self):
+   def _create_cull_stats(self):
+
+      cull_stats = html.Div(
+         id=CULL_STATS,
+         style={
+            'textAlign': 'center',
+            'fontSize': 'small',
+            'opacity': '0.7'
+         }
+      )
 
-      slider_marks = {}
-      for val in self._timestamps:
-         slider_marks[val] = '' 
+      return cull_stats
+
+
+   def _create_time_density(self):
+
+      time_density = dcc.Graph(
+         id=TIME_DENSITY,
+         figure=self._time_density,
+         config={"displayModeBar": False, "staticPlot": True},
+         style={'height': '6vh', 'padding': '0 15px'})
+
+      return time_density
+
+
+   def _create_slider(self):
 
       slider = dcc.Slider(
          id=TIME_SLIDER,
-         min=self._timestamps[0], 
-         max=self._timestamps[-1],
-         step=None,
-         marks=eval(str(slider_marks)),
-         value=self._timestamps[0],
+         min=0, 
+         max=max(len(self._timestamps) - 1, 0),
+         step=1,
+         marks=None,
+         value=0,
          dots=False,
          updatemode="mouseup",
          tooltip={
             "placement": "top", 
             "always_visible": True,
-            "transform": "convertToHMS"
+            "transform": "indexToHMS"
          })
 
       return slider
@@ -272,6 +450,45 @@ class DashLayout:
       return buttons
 
 
+   def _create_window_options(self):
+
+      platform_options = [
+         {"label": "Hidden", "value": "Hidden"},
+         {"label": "Markers", "value": "Markers"},
+         {"label": "Markers and Trails", "value": "Trails"}
+      ]
+
+      detail_options = [
+         {"label": "Full Detail", "value": "Full"},
+         {"label": "Clustered by Zoom", "value": "Clustered"}
+      ]
+
+      heatmap_options = [
+         {"label": "Off", "value": "Off"},
+         {"label": "Traffic (Window)", "value": "Traffic|Window"},
+         {"label": "Failures (Window)", "value": "Failures|Window"},
+         {"label": "Traffic (Mission)", "value": "Traffic|Mission"},
+         {"label": "Failures (Mission)", "value": "Failures|Mission"}
+      ]
+
+      window_options = dbc.Row(
+         style={
+            'textAlign': 'center',
+            'paddingBottom': '20px'
+         },
+         children=[
+            dbc.Col(self._create_number_input("Window (s)", WINDOW_SIZE, 0), width=6),
+            dbc.Col(self._create_number_input("Stride (s)", WINDOW_STRIDE, 0), width=6),
+            dbc.Col(self._create_dropdown("Platforms", PLATFORM_DISPLAY, platform_options, False, None, "Markers", False), width=6),
+            dbc.Col(self._create_number_input("Trail (s)", TRAIL_LENGTH, 300), width=6),
+            dbc.Col(self._create_dropdown("Detail", DETAIL_LEVEL, detail_options, False, None, "Full", False), width=6),
+            dbc.Col(self._create_dropdown("Heatmap", HEATMAP_LAYER, heatmap_options, False, None, "Off", False), width=6)
+         ]
+      )
+
+      return window_options
+
+
    def _create_plots_area(self):
 
       bar_plots = dcc.Loading(
@@ -284,7 +501,13 @@ class DashLayout:
          )],
          target_components={
             BAR_GRAPH: "figure",
-            self._network_plot_name: "figure"},
+            self._network_plot_name: "figure",
+            TIMELINE_GRAPH: "figure",
+            MESSAGE_GRAPH: "figure",
+            HEALTH_GRAPH: "figure",
+            REACH_GRAPH: "figure",
+            LINK_METRICS_GRAPH: "figure",
+            SERIES_GRAPH: "figure"},
          type="graph"
       )
          
@@ -361,6 +584,7 @@ class DashLayout:
             self._create_dropdown("Receiver Part", RECEIVER_PART, self._df["ReceiverPart_Name"].unique(), True, "All Receiver Parts"),
             self._create_dropdown("Receiver Part Type", RECEIVER_PART_TYPE, self._df["ReceiverPart_Type"].unique(), True, "All Receiver Part Types"),
             self._create_dropdown("Receiver Part BaseType", RECEIVER_PART_BASETYPE, self._df["ReceiverPart_BaseType"].unique(), True, "All Receiver Part BaseTypes"),
+            self._create_text_input("Region (lat/lon)", REGION_FILTER, "south, west, north, east  or  lat lon; lat lon; ..."),
             ], title="Filter Options")],
             start_collapsed=True
          )
@@ -375,6 +599,42 @@ class DashLayout:
       return subplot_filters 
 
    
+   def _create_number_input(self, label, input_id, value):
+
+      number_input = html.Div(
+         className='labeled-div',
+         style={'gridTemplateColumns': '40% 55%'},
+         children=[
+            html.Label(label),
+            dcc.Input(
+               id=input_id,
+               type="number",
+               min=0,
+               value=value,
+               debounce=True)
+         ]
+      )
+
+      return number_input
+
+
+   def _create_text_input(self, label, input_id, placeholder):
+
+      text_input = html.Div(
+         className='labeled-div',
+         children=[
+            html.Label(label),
+            dcc.Input(
+               id=input_id,
+               type="text",
+               placeholder=placeholder,
+               debounce=True)
+         ]
+      )
+
+      return text_input
+
+
    def _create_dropdown(self, col_name, dropdown_id, options, multi, placeholder=None, value=None, clearable=True):
 
       dropdown = html.Div(
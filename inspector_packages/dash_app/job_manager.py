@@ -0,0 +1,76 @@
+import threading
+from contextlib import contextmanager
+from dash.exceptions import PreventUpdate
+
+
+class Job:
+   """
+   Handle for one callback request. check() raises PreventUpdate once a
+   newer request for the same session and callback has arrived, so heavy
+   callbacks can stop between stages instead of finishing a stale frame.
+   """
+
+   def __init__(self, slot=None, generation=0):
+
+      self._slot = slot
+      self._generation = generation
+
+
+   @property
+   def superseded(self):
+
+      return self._slot is not None and self._slot.generation != self._generation
+
+
+   def check(self):
+
+      if self.superseded:
+         raise PreventUpdate
+
+
+class _JobSlot:
+
+   def __init__(self):
+
+      self.lock = threading.Lock()
+      self.generation = 0
+      self.pending = 0
+
+
+class JobManager:
+   """
+   Coalesces requests to the same callback from the same session. Requests
+   for a key run one at a time; when the running one finishes, every queued
+   request except the newest is dropped without computing.
+   """
+
+   def __init__(self):
+
+      self._lock = threading.Lock()
+      self._slots = {}
+
+
+   @contextmanager
+   def latest(self, session_id, name):
+
+      if session_id is None:
+         yield Job()
+         return
+
+      key = (session_id, name)
+      with self._lock:
+         slot = self._slots.setdefault(key, _JobSlot())
+         slot.generation += 1
+         slot.pending += 1
+         job = Job(slot, slot.generation)
+
+      try:
+         with slot.lock:
+            job.check()
+            yield job
+            job.check()
+      finally:
+         with self._lock:
+            slot.pending -= 1
+            if slot.pending == 0:
+               self._slots.pop(key, None)
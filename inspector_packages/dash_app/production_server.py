@@ -0,0 +1,85 @@
+import gc
+import multiprocessing
+from utils import cli_output
+from inspector_packages.data_store import EventStore
+from .dash_callbacks import DashCallbacks
+
+try:
+   from gunicorn.app.base import BaseApplication
+except ImportError:
+   BaseApplication = None
+
+
+class ProductionServer:
+   """
+   Serves the dashboard from several gunicorn worker processes. The app is
+   built once over a memory-mapped EventStore before the workers fork, so
+   the event columns and the unfiltered view's indices, all built before
+   the fork, are shared by every worker instead of being copied into each.
+   Views for other filter states are still built per worker.
+   """
+
+   def __init__(self, store_dir, workers, host, port, callback_args):
+
+      self._store_dir = str(store_dir)
+      self._callback_args = callback_args
+      self._options = {
+         "bind": f"{host}:{port}",
+         "workers": workers if workers > 0 else multiprocessing.cpu_count(),
+         "worker_class": "gthread",
+         "threads": 4,
+         "timeout": 300,
+         "preload_app": True
+      }
+
+
+   @staticmethod
+   def available():
+
+      return BaseApplication is not None
+
+
+   def create_app(self):
+
+      df = EventStore.load(self._store_dir)
+      callbacks = DashCallbacks(df, **self._callback_args)
+      callbacks.prebuild()
+
+      # Otherwise collections in each worker touch every prebuilt object and copy its pages
+      gc.freeze()
+
+      return callbacks.app.server
+
+
+   def run(self):
+
+      if not self.available():
+         cli_output.FATAL("Production mode requires gunicorn (pip install gunicorn)... exiting!")
+         return False
+
+      cli_output.INFO(f"Serving {self._store_dir} with {self._options['workers']} workers on {self._options['bind']}")
+      _WorkerApplication(self.create_app, self._options).run()
+
+      return True
+
+
+if BaseApplication is not None:
+
+   class _WorkerApplication(BaseApplication):
+
+      def __init__(self, app_factory, options):
+
+         self._app_factory = app_factory
+         self._options = options
+         super().__init__()
+
+
+      def load_config(self):
+
+         for key, value in self._options.items():
+            self.cfg.set(key, value)
+
+
+      def load(self):
+
+         return self._app_factory()
@@ -0,0 +1,37 @@
+from .link_index import LinkIndex
+from .category_counts import CategoryCounts
+from .filtered_view import FilteredView, ViewCache
+from .event_store import EventStore
+from .time_pyramid import TimePyramid
+from .message_index import MessageIndex
+from .temporal_graph import TemporalGraph
+from .temporal_reachability import TemporalReachability
+from .link_metrics import LinkMetrics
+from .series_downsampler import SeriesDownsampler
+from .platform_tracks import PlatformTracks
+from .region_index import RegionIndex
+from .spatial_clusters import SpatialClusters
+from .activity_grid import ActivityGrid
+from .network_layouts import NetworkLayouts
+from .grouped_time_index import GroupedTimeIndex
+
+
+__all__ = [
+   "LinkIndex",
+   "CategoryCounts",
+   "FilteredView",
+   "ViewCache",
+   "EventStore",
+   "TimePyramid",
+   "MessageIndex",
+   "TemporalGraph",
+   "TemporalReachability",
+   "LinkMetrics",
+   "SeriesDownsampler",
+   "PlatformTracks",
+   "RegionIndex",
+   "SpatialClusters",
+   "ActivityGrid",
+   "NetworkLayouts",
+   "GroupedTimeIndex"
+]
@@ -0,0 +1,112 @@
+import numpy as np
+from inspector_packages import NO_FAILURE
+
+
+class ActivityGrid:
+   """
+   Event counts on an equal-area global grid, accumulated over time.
+
+   Cells are bounded by meridians and by parallels evenly spaced in the
+   sine of latitude, so every cell covers the same area of the sphere
+   and counts compare directly between the equator and the poles. Events
+   are placed at their sender's location and counted per time bucket. The
+   buckets are stored as cumulative sums, so the counts for any window are
+   the difference of two rows. Windows snap outward to bucket edges.
+   """
+
+   NUM_ROWS = 64
+   NUM_COLS = 128
+   MAX_BUCKETS = 256
+   LAYERS = ["Traffic", "Failures"]
+
+   def __init__(self, frame, num_rows=None, num_cols=None):
+
+      self._num_rows = num_rows or self.NUM_ROWS
+      self._num_cols = num_cols or self.NUM_COLS
+      num_cells = self._num_rows * self._num_cols
+
+      times = frame["Timestamp"].to_numpy(dtype=np.float64)
+      self._origin = times.min() if times.shape[0] != 0 else 0.0
+      duration = (times.max() - self._origin) if times.shape[0] != 0 else 0.0
+      self._bucket_size = max(duration / self.MAX_BUCKETS, 1.0)
+      num_buckets = int(duration // self._bucket_size) + 1
+
+      cells = self._cells(
+         frame["SenderLocation_X"].to_numpy(dtype=np.float64),
+         frame["SenderLocation_Y"].to_numpy(dtype=np.float64),
+         frame["SenderLocation_Z"].to_numpy(dtype=np.float64))
+      buckets = ((times - self._origin) // self._bucket_size).astype(np.int64)
+      located = cells >= 0
+      failed = frame["CommInteraction_FailedStatus"].to_numpy().astype(str) != NO_FAILURE
+
+      self._cumulative = {}
+      for layer, selected in zip(self.LAYERS, [located, located & failed]):
+         counts = np.bincount(
+            buckets[selected] * num_cells + cells[selected],
+            minlength=num_buckets * num_cells).reshape(num_buckets, num_cells)
+         cumulative = np.zeros((num_buckets + 1, num_cells), dtype=np.int32)
+         np.cumsum(counts, axis=0, out=cumulative[1:])
+         self._cumulative[layer] = cumulative
+
+
+   def counts(self, layer, start=None, end=None):
+      """
+      Counts per cell between ``start`` and ``end`` (the whole mission by
+      default), shaped (rows, cols) from south to north and west to east.
+      """
+
+      cumulative = self._cumulative[layer]
+      num_buckets = cumulative.shape[0] - 1
+      first = 0 if start is None else int(np.clip((start - self._origin) // self._bucket_size, 0, num_buckets))
+      last = num_buckets if end is None else int(np.clip((end - self._origin) // self._bucket_size + 1, first, num_buckets))
+
+      return (cumulative[last] - cumulative[first]).reshape(self._num_rows, self._num_cols)
+
+
+   def row_edges(self):
+      """
+      Latitudes in degrees of the parallels bounding each row.
+      """
+
+      return np.degrees(np.arcsin(np.linspace(-1, 1, self._num_rows + 1)))
+
+
+   def row_centres(self):
+      """
+      Latitudes in degrees halfway through each row's area.
+      """
+
+      return np.degrees(np.arcsin(-1 + (np.arange(self._num_rows) + 0.5) * 2 / self._num_rows))
+
+
+   def col_edges(self):
+
+      return np.linspace(-180, 180, self._num_cols + 1)
+
+
+   def col_centres(self):
+
+      return -180 + (np.arange(self._num_cols) + 0.5) * 360 / self._num_cols
+
+
+   def rows_at(self, latitude):
+
+      return np.clip(
+         np.floor((np.sin(np.radians(latitude)) + 1) / 2 * self._num_rows), 0, self._num_rows - 1).astype(np.int64)
+
+
+   def cols_at(self, longitude):
+
+      return np.clip(np.floor((np.asarray(longitude) + 180) / 360 * self._num_cols), 0, self._num_cols - 1).astype(np.int64)
+
+
+   def _cells(self, x, y, z):
+
+      radius = np.sqrt(x * x + y * y + z * z)
+      known = np.isfinite(radius) & (radius > 0)
+      with np.errstate(divide="ignore", invalid="ignore"):
+         sine = np.where(known, z / radius, 0)
+      rows = np.clip(np.floor((sine + 1) / 2 * self._num_rows), 0, self._num_rows - 1)
+      cols = np.clip(np.floor((np.degrees(np.arctan2(y, x)) + 180) / 360 * self._num_cols), 0, self._num_cols - 1)
+
+      return np.where(known, rows * self._num_cols + cols, -1).astype(np.int64)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+
+class CategoryCounts:
+   """
+   Cumulative event counts for every combination of the given category
+   columns.
+
+   Rows are sorted by (combination, timestamp), so the position of a time
+   inside a combination's block is its cumulative count up to that time.
+   The count over any time range is then a difference of two binary
+   searches per combination instead of a rescan of the frame.
+   """
+
+   def __init__(self, frame, keys):
+
+      self._keys = keys
+      self._build(frame)
+
+
+   def between(self, start, end):
+
+      start_rank = np.searchsorted(self._timestamps, start, side="left")
+      end_rank = np.searchsorted(self._timestamps, end, side="right")
+
+      combo_base = np.arange(self._num_combos, dtype=np.int64) * self._rank_stride
+      lower = np.searchsorted(self._sorted_keys, combo_base + start_rank, side="left")
+      upper = np.searchsorted(self._sorted_keys, combo_base + end_rank, side="left")
+      counts = upper - lower
+
+      present = counts > 0
+      return pd.Series(counts[present], index=self._combos[present])
+
+
+   def at(self, timestamp):
+
+      return self.between(timestamp, timestamp)
+
+
+   def total(self):
+
+      return self.between(-np.inf, np.inf)
+
+
+   def _build(self, frame):
+
+      grouped = frame.groupby(self._keys, sort=False, observed=True)
+      combo_ids = grouped.ngroup().to_numpy()
+      valid = ~np.isnan(combo_ids)
+      combo_ids = combo_ids[valid].astype(np.int64)
+      row_timestamps = frame["Timestamp"].to_numpy()[valid]
+
+      self._combos = grouped.size().index
+      self._num_combos = len(self._combos)
+      self._timestamps = np.unique(row_timestamps)
+      self._rank_stride = self._timestamps.shape[0] + 1
+
+      ranks = np.searchsorted(self._timestamps, row_timestamps)
+      self._sorted_keys = np.sort(combo_ids * self._rank_stride + ranks)
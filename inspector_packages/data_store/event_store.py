@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+
+class EventStore:
+   """
+   Columnar on-disk copy of the event frame. Numeric columns and the codes
+   of text columns are written as .npy files and memory-mapped read-only on
+   load, so every process that loads the same store shares one copy of the
+   data through the page cache.
+   """
+
+   MANIFEST = "manifest.json"
+
+   @classmethod
+   def save(cls, df, directory):
+
+      directory = Path(directory)
+      directory.mkdir(parents=True, exist_ok=True)
+
+      columns = []
+      for idx, column in enumerate(df.columns):
+         series = df[column]
+         file_name = f"{idx:03d}.npy"
+
+         if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            np.save(directory.joinpath(file_name), np.ascontiguousarray(series.to_numpy()))
+            columns.append({"name": column, "kind": "numeric", "file": file_name})
+         else:
+            categorical = pd.Categorical(series)
+            np.save(directory.joinpath(file_name), np.ascontiguousarray(categorical.codes))
+            columns.append({
+               "name": column,
+               "kind": "category",
+               "file": file_name,
+               "categories": categorical.categories.tolist()})
+
+      manifest = {"num_rows": len(df), "columns": columns}
+      with open(directory.joinpath(cls.MANIFEST), "w") as f:
+         json.dump(manifest, f)
+
+      return directory
+
+
+   @classmethod
+   def load(cls, directory):
+
+      directory = Path(directory)
+      with open(directory.joinpath(cls.MANIFEST), "r") as f:
+         manifest = json.load(f)
+
+      data = {}
+      for column in manifest["columns"]:
+         values = np.load(directory.joinpath(column["file"]), mmap_mode="r")
+         if column["kind"] == "category":
+            values = pd.Categorical.from_codes(values, categories=column["categories"], validate=False)
+         data[column["name"]] = values
+
+      return pd.DataFrame(data, copy=False)
+
+
+   @classmethod
+   def exists(cls, directory):
+
+      return Path(directory).joinpath(cls.MANIFEST).is_file()
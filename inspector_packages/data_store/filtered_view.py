@@ -0,0 +1,314 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from .link_index import LinkIndex
+from .category_counts import CategoryCounts
+from .time_pyramid import TimePyramid
+from .message_index import MessageIndex
+from .temporal_graph import TemporalGraph
+from .temporal_reachability import TemporalReachability
+from .link_metrics import LinkMetrics
+from .region_index import RegionIndex
+from .spatial_clusters import SpatialClusters
+from .activity_grid import ActivityGrid
+from .network_layouts import NetworkLayouts
+
+
+class FilteredView:
+   """
+   Everything derived from one filter state: the filtered rows, their
+   timestamps and the indices built over them. Views are immutable once
+   built, so sessions with identical filters can share one.
+
+   A ``Region`` filter option holds polygon vertices rather than column
+   values; it is resolved through the RegionIndex of the unfiltered frame
+   before the column filters are applied.
+   """
+
+   INTERNAL_MESSAGES = ["MESSAGE_INTERNAL", "MESSAGE_INCOMING", "MESSAGE_OUTGOING"]
+   EXTERNAL_MESSAGES = ["MESSAGE_DELIVERY_ATTEMPT", "MESSAGE_RECEIVED"]
+   QUEUED_MESSAGE = "MESSAGE_QUEUED"
+   # The executor fills these columns with -1 on events that do not report them
+   FILLED_COLUMNS = ["Queue_Size", "Message_Size", "Message_Priority"]
+   LINK_KEYS = ["Sender_Name", "SenderPart_Name", "Receiver_Name", "ReceiverPart_Name"]
+   EVENT_RATE = "Event_Rate"
+   INDICES = ["time_pyramid", "message_index", "temporal_graph", "reachability", "link_metrics", "activity_grid", "network_layouts"]
+   REGION = "Region"
+
+   def __init__(self, df, filter_options=None, region_index=None):
+
+      self._filter_options = filter_options or {}
+      self._region_index = region_index
+      self._frame = self._filter_dataframe(df)
+      self._timestamps = np.sort(self._frame["Timestamp"].unique())
+
+      internal = self._frame[self._frame["Event_Type"].isin(self.INTERNAL_MESSAGES)]
+      external = self._frame[self._frame["Event_Type"].isin(self.EXTERNAL_MESSAGES)]
+      self._internal_index = LinkIndex(internal, ["Sender_Name"])
+      self._external_index = LinkIndex(external, self.LINK_KEYS)
+
+      self._category_counts = OrderedDict()
+      self._category_counts_size = 8
+      self._spatial_clusters = OrderedDict()
+      self._spatial_clusters_size = 8
+      self._time_series = {}
+      self._time_pyramid = None
+      self._message_index = None
+      self._temporal_graph = None
+      self._reachability = None
+      self._link_metrics = None
+      self._activity_grid = None
+      self._network_layouts = None
+      self._lock = threading.Lock()
+
+
+   @staticmethod
+   def filter_key(filter_options):
+
+      if not filter_options:
+         return ()
+
+      return tuple(
+         (column, tuple(tuple(vertex) for vertex in values) if column == FilteredView.REGION else tuple(sorted(values, key=str)))
+         for column, values in sorted(filter_options.items())
+         if values is not None and len(values) != 0)
+
+
+   @property
+   def frame(self):
+
+      return self._frame
+
+
+   @property
+   def timestamps(self):
+
+      return self._timestamps
+
+
+   @property
+   def internal_index(self):
+
+      return self._internal_index
+
+
+   @property
+   def external_index(self):
+
+      return self._external_index
+
+
+   @property
+   def time_pyramid(self):
+
+      with self._lock:
+         if self._time_pyramid is None:
+            self._time_pyramid = TimePyramid(self._frame)
+
+      return self._time_pyramid
+
+
+   @property
+   def message_index(self):
+
+      with self._lock:
+         if self._message_index is None:
+            self._message_index = MessageIndex(self._frame)
+
+      return self._message_index
+
+
+   @property
+   def temporal_graph(self):
+
+      with self._lock:
+         if self._temporal_graph is None:
+            self._temporal_graph = TemporalGraph(self._external_index.frame)
+
+      return self._temporal_graph
+
+
+   @property
+   def reachability(self):
+
+      with self._lock:
+         if self._reachability is None:
+            self._reachability = TemporalReachability(self._external_index.frame)
+
+      return self._reachability
+
+
+   @property
+   def link_metrics(self):
+
+      with self._lock:
+         if self._link_metrics is None:
+            queued = self._frame[self._frame["Event_Type"] == self.QUEUED_MESSAGE]
+            self._link_metrics = LinkMetrics(self._external_index.frame, self.LINK_KEYS, queued)
+
+      return self._link_metrics
+
+
+   @property
+   def activity_grid(self):
+
+      with self._lock:
+         if self._activity_grid is None:
+            self._activity_grid = ActivityGrid(self._frame)
+
+      return self._activity_grid
+
+
+   @property
+   def network_layouts(self):
+
+      with self._lock:
+         if self._network_layouts is None:
+            self._network_layouts = NetworkLayouts(self._external_index.frame)
+
+      return self._network_layouts
+
+
+   def prebuild(self):
+      """
+      Builds every lazily built index now rather than on first use.
+      """
+
+      for index in self.INDICES:
+         getattr(self, index)
+
+
+   def category_counts(self, *categories):
+
+      with self._lock:
+         if categories in self._category_counts:
+            self._category_counts.move_to_end(categories)
+            return self._category_counts[categories]
+
+      counts = CategoryCounts(self._frame, list(categories))
+
+      with self._lock:
+         self._category_counts[categories] = counts
+         if len(self._category_counts) > self._category_counts_size:
+            self._category_counts.popitem(last=False)
+
+      return counts
+
+
+   def spatial_clusters(self, start, end, platforms):
+
+      key = (start, end, platforms.shape[0])
+      with self._lock:
+         if key in self._spatial_clusters:
+            self._spatial_clusters.move_to_end(key)
+            return self._spatial_clusters[key]
+
+      clusters = SpatialClusters(platforms, self._external_index.frame_between(start, end))
+
+      with self._lock:
+         self._spatial_clusters[key] = clusters
+         if len(self._spatial_clusters) > self._spatial_clusters_size:
+            self._spatial_clusters.popitem(last=False)
+
+      return clusters
+
+
+   def time_series(self, column):
+
+      with self._lock:
+         if column in self._time_series:
+            return self._time_series[column]
+
+      if column == self.EVENT_RATE:
+         series = self._event_rate()
+      else:
+         order = np.argsort(self._frame["Timestamp"].to_numpy(), kind="stable")
+         times = self._frame["Timestamp"].to_numpy()[order]
+         values = self._frame[column].to_numpy(dtype=np.float64)[order]
+         present = ~np.isnan(values)
+         if column in self.FILLED_COLUMNS:
+            present &= values != -1
+         series = (times[present], values[present])
+
+      with self._lock:
+         self._time_series[column] = series
+
+      return series
+
+
+   def _event_rate(self):
+
+      if self._frame.empty:
+         return (np.empty(0), np.empty(0))
+
+      pyramid = self.time_pyramid
+      counts = pyramid.series("Event_Type", pyramid.start, pyramid.end, 1).sum(axis=1)
+
+      return (counts.index.to_numpy(dtype=np.float64), counts.to_numpy(dtype=np.float64))
+
+
+   def _filter_dataframe(self, df):
+
+      region = self._filter_options.get(self.REGION)
+      if region:
+         region_index = self._region_index or RegionIndex(df)
+         df = df[region_index.mask(region)]
+
+      for key, val in self._filter_options.items():
+         if key != self.REGION and val is not None and len(val) != 0:
+            df = df[df[key].isin(val)]
+
+      return df
+
+
+class ViewCache:
+   """
+   Bounded, thread-safe LRU of FilteredView objects keyed by filter state.
+   Concurrent requests for the same uncached state wait on a single build.
+   The region grid index is built once over the unfiltered frame and
+   shared by every view. The unfiltered view itself is never evicted.
+   """
+
+   def __init__(self, df, max_size=16):
+
+      self._df = df
+      self._region_index = RegionIndex(df)
+      self._unfiltered = FilteredView(df, None, self._region_index)
+      self._max_size = max_size
+      self._views = OrderedDict()
+      self._building = {}
+      self._lock = threading.Lock()
+
+
+   def get(self, filter_options):
+
+      key = FilteredView.filter_key(filter_options)
+      if key == ():
+         return self._unfiltered
+
+      with self._lock:
+         if key in self._views:
+            self._views.move_to_end(key)
+            return self._views[key]
+         build_lock = self._building.setdefault(key, threading.Lock())
+
+      with build_lock:
+         with self._lock:
+            if key in self._views:
+               return self._views[key]
+
+         view = FilteredView(self._df, dict(key), self._region_index)
+
+         with self._lock:
+            self._views[key] = view
+            self._building.pop(key, None)
+            while len(self._views) > self._max_size:
+               self._views.popitem(last=False)
+
+      return view
+
+
+   @property
+   def unfiltered(self):
+
+      return self._unfiltered
@@ -0,0 +1,27 @@
+import numpy as np
+
+
+class GroupedTimeIndex:
+   """
+   Binary search over rows sorted by (group, time), such as the events of
+   each link or the samples of each platform.
+
+   Each row's key is its time offset from the earliest time plus its group
+   id times the full time span, so every group occupies its own band of
+   keys and one searchsorted call answers any number of (group, time)
+   queries at once. Query times are clipped to the span so they never
+   reach into a neighbouring group's band.
+   """
+
+   def __init__(self, groups, times):
+
+      self._origin = times.min() if times.shape[0] != 0 else 0.0
+      self._span = (times.max() - self._origin + 1.0) if times.shape[0] != 0 else 1.0
+      self._keys = groups * self._span + (times - self._origin)
+
+
+   def search(self, groups, times, side="right"):
+
+      offsets = np.clip(np.asarray(times, dtype=np.float64) - self._origin, -0.5, self._span - 0.5)
+
+      return np.searchsorted(self._keys, groups * self._span + offsets, side=side)
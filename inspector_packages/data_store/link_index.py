@@ -0,0 +1,141 @@
+import numpy as np
+
+
+class LinkIndex:
+   """
+   Groups a filtered frame by link once so that every timestamp's groups are
+   contiguous row slices.
+
+   Rows are sorted by (Timestamp, link id). Two offset tables map each unique
+   timestamp to its block of rows and to its block of link groups, so a frame
+   lookup is a binary search followed by slicing. A time window is the row
+   range between two binary searches; its link groups come from a stable
+   sort of that range by link id.
+   """
+
+   def __init__(self, frame, keys):
+
+      self._keys = keys
+      self._build(frame)
+
+
+   @property
+   def frame(self):
+
+      return self._frame
+
+
+   @property
+   def timestamps(self):
+
+      return self._timestamps
+
+
+   def frame_at(self, timestamp):
+
+      position = self._timestamp_position(timestamp)
+      if position is None:
+         return self._frame.iloc[0:0]
+
+      return self._frame.iloc[self._row_offsets[position]:self._row_offsets[position+1]]
+
+
+   def groups_at(self, timestamp):
+
+      position = self._timestamp_position(timestamp)
+      if position is None:
+         return []
+
+      groups = []
+      for group in range(self._group_offsets[position], self._group_offsets[position+1]):
+         start, end = self._group_bounds[group], self._group_bounds[group+1]
+         groups.append((self._link_keys[self._link_ids[start]], self._frame.iloc[start:end]))
+
+      return groups
+
+
+   def frame_between(self, start, end):
+
+      first, last = self._position_range(start, end)
+
+      return self._frame.iloc[self._row_offsets[first]:self._row_offsets[last]]
+
+
+   def groups_between(self, start, end):
+
+      first, last = self._position_range(start, end)
+      if last - first == 1:
+         return self.groups_at(self._timestamps[first])
+
+      row_start, row_end = self._row_offsets[first], self._row_offsets[last]
+      if row_start == row_end:
+         return []
+
+      link_ids = self._link_ids[row_start:row_end]
+      order = np.argsort(link_ids, kind="stable")
+      sorted_ids = link_ids[order]
+      rows = row_start + order
+      bounds = np.r_[np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]]), sorted_ids.shape[0]]
+
+      groups = []
+      for start_row, end_row in zip(bounds[:-1], bounds[1:]):
+         groups.append((self._link_keys[sorted_ids[start_row]], self._frame.iloc[rows[start_row:end_row]]))
+
+      return groups
+
+
+   def _position_range(self, start, end):
+
+      first = np.searchsorted(self._timestamps, start, side="left")
+      last = np.searchsorted(self._timestamps, end, side="right")
+
+      return first, max(first, last)
+
+
+   def _timestamp_position(self, timestamp):
+
+      position = np.searchsorted(self._timestamps, timestamp)
+      if position < self._timestamps.shape[0] and self._timestamps[position] == timestamp:
+         return position
+
+      return None
+
+
+   def _build(self, frame):
+
+      link_ids = frame.groupby(self._keys, sort=True, observed=True).ngroup().to_numpy()
+      valid = ~np.isnan(link_ids)
+      frame = frame[valid]
+      link_ids = link_ids[valid].astype(np.int64)
+      timestamps = frame["Timestamp"].to_numpy()
+
+      order = np.lexsort((link_ids, timestamps))
+      self._frame = frame.iloc[order].assign(Link_ID=link_ids[order])
+      self._link_ids = link_ids[order]
+      sorted_timestamps = timestamps[order]
+
+      num_rows = sorted_timestamps.shape[0]
+      if num_rows == 0:
+         self._timestamps = sorted_timestamps
+         self._row_offsets = np.zeros(1, dtype=np.int64)
+         self._group_offsets = np.zeros(1, dtype=np.int64)
+         self._group_bounds = np.zeros(1, dtype=np.int64)
+         self._link_keys = []
+         return
+
+      new_timestamp = np.r_[True, sorted_timestamps[1:] != sorted_timestamps[:-1]]
+      new_group = new_timestamp | np.r_[True, self._link_ids[1:] != self._link_ids[:-1]]
+
+      timestamp_starts = np.flatnonzero(new_timestamp)
+      group_starts = np.flatnonzero(new_group)
+
+      self._timestamps = sorted_timestamps[timestamp_starts]
+      self._row_offsets = np.r_[timestamp_starts, num_rows]
+      self._group_bounds = np.r_[group_starts, num_rows]
+      self._group_offsets = np.searchsorted(group_starts, self._row_offsets)
+
+      first_rows = self._frame.iloc[np.unique(self._link_ids, return_index=True)[1]]
+      if len(self._keys) == 1:
+         self._link_keys = first_rows[self._keys[0]].tolist()
+      else:
+         self._link_keys = list(first_rows[self._keys].itertuples(index=False, name=None))
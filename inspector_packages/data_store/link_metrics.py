@@ -0,0 +1,226 @@
+import numpy as np
+import pandas as pd
+from inspector_packages import NO_FAILURE
+from .grouped_time_index import GroupedTimeIndex
+
+
+class LinkMetrics:
+   """
+   Rolling per-link delivery statistics over external events.
+
+   Queue sizes are only reported by MESSAGE_QUEUED events, which name the
+   sending platform and comm but not the receiver, so each queue sample is
+   counted against every link leaving that comm.
+
+   Rows are kept sorted by (link, time) next to prefix sums of every
+   measure, so any link's totals over a window are two binary searches and
+   a subtraction. A GroupedTimeIndex over the rows answers a window for
+   every link with one searchsorted call.
+   """
+
+   WINDOW = 60.0
+   ATTEMPT = "MESSAGE_DELIVERY_ATTEMPT"
+   RECEIVED = "MESSAGE_RECEIVED"
+   QUEUE_KEYS = ["Sender_Name", "SenderPart_Name"]
+   MEASURES = ["Attempts", "Successes", "Bytes", "Queue_Size", "Queue_Samples"]
+
+   def __init__(self, frame, keys, queued=None):
+
+      self._keys = keys
+      self._links = {}
+      self._reasons = {}
+      self._build(frame, queued)
+
+
+   @property
+   def links(self):
+
+      return list(self._links)
+
+
+   @property
+   def reasons(self):
+
+      return list(self._reasons)
+
+
+   def window(self, time, window=None):
+
+      window = window or self.WINDOW
+      links = np.arange(len(self._links))
+      lower, upper = self._bounds(links, time - window, time)
+
+      totals = {measure: self._sums[measure][upper] - self._sums[measure][lower] for measure in self.MEASURES}
+      reasons = self._reason_sums[upper] - self._reason_sums[lower]
+
+      metrics = pd.DataFrame({
+         "Attempts": totals["Attempts"],
+         "Success_Rate": self._ratio(totals["Successes"], totals["Attempts"]),
+         "Throughput": totals["Bytes"] / window,
+         "Queue_Size": self._ratio(totals["Queue_Size"], totals["Queue_Samples"])
+      }, index=pd.MultiIndex.from_tuples(self.links, names=self._keys) if self._links else None)
+
+      for code, reason in enumerate(self._reasons):
+         metrics[reason] = reasons[:, code]
+
+      return metrics
+
+
+   def success_rates(self, time, window=None):
+
+      rates = self.window(time, window)["Success_Rate"].dropna()
+
+      return dict(zip(rates.index, rates.to_numpy()))
+
+
+   def series(self, times, window=None, link=None):
+
+      window = window or self.WINDOW
+      times = np.asarray(times, dtype=np.float64)
+
+      if link is None:
+         lower = np.searchsorted(self._times, times - window, side="right")
+         upper = np.searchsorted(self._times, times, side="right")
+         sums, reason_sums = self._time_sums, self._time_reason_sums
+      else:
+         links = np.full(times.shape[0], self._links.get(tuple(link), -1))
+         if links.shape[0] != 0 and links[0] < 0:
+            return pd.DataFrame(index=times)
+         lower, upper = self._bounds(links, times - window, times)
+         sums, reason_sums = self._sums, self._reason_sums
+
+      totals = {measure: sums[measure][upper] - sums[measure][lower] for measure in self.MEASURES}
+      reasons = reason_sums[upper] - reason_sums[lower]
+
+      metrics = pd.DataFrame({
+         "Success_Rate": self._ratio(totals["Successes"], totals["Attempts"]),
+         "Throughput": totals["Bytes"] / window,
+         "Queue_Size": self._ratio(totals["Queue_Size"], totals["Queue_Samples"])
+      }, index=times)
+
+      for code, reason in enumerate(self._reasons):
+         metrics[reason] = reasons[:, code]
+
+      return metrics
+
+
+   def _build(self, frame, queued):
+
+      rows = self._event_rows(frame)
+      queue_rows = self._queue_rows(queued)
+      rows = {name: np.concatenate([values, queue_rows[name]]) for name, values in rows.items()}
+
+      order = np.lexsort((rows["time"], rows["link"]))
+      self._rows = {name: values[order] for name, values in rows.items()}
+
+      self._index()
+
+
+   def _event_rows(self, frame):
+
+      rows = self._blank_rows(frame.shape[0])
+      if frame.shape[0] == 0:
+         return rows
+
+      status = frame["CommInteraction_FailedStatus"].to_numpy().astype(str)
+      failed = status != NO_FAILURE
+      rows["reason"][failed] = self._codes(self._reasons, pd.Index(status[failed]))
+
+      event_types = frame["Event_Type"].to_numpy().astype(str)
+      attempts = event_types == self.ATTEMPT
+      message_size = frame["Message_Size"].to_numpy().astype(np.float64)
+
+      rows["link"] = self._codes(self._links, pd.MultiIndex.from_arrays([frame[key].astype(str) for key in self._keys]))
+      rows["time"] = frame["Timestamp"].to_numpy().astype(np.float64)
+      rows["Attempts"] = attempts.astype(np.float64)
+      rows["Successes"] = (attempts & (frame["CommInteraction_Succeeded"].to_numpy() == 1)).astype(np.float64)
+      # Sizes the collector did not report are filled with -1
+      rows["Bytes"] = np.where((event_types == self.RECEIVED) & (message_size >= 0), message_size, 0)
+
+      return rows
+
+
+   def _queue_rows(self, queued):
+
+      if queued is None or queued.shape[0] == 0 or not self._links:
+         return self._blank_rows(0)
+
+      queued = queued[queued["Queue_Size"].to_numpy(dtype=np.float64) >= 0]
+      samples = pd.DataFrame({key: queued[key].astype(str).to_numpy() for key in self.QUEUE_KEYS})
+      samples["time"] = queued["Timestamp"].to_numpy().astype(np.float64)
+      samples["Queue_Size"] = queued["Queue_Size"].to_numpy().astype(np.float64)
+
+      links = pd.DataFrame(list(self._links), columns=self._keys)[self.QUEUE_KEYS]
+      links["link"] = np.arange(links.shape[0], dtype=np.int64)
+      samples = samples.merge(links, on=self.QUEUE_KEYS)
+
+      rows = self._blank_rows(samples.shape[0])
+      rows["link"] = samples["link"].to_numpy()
+      rows["time"] = samples["time"].to_numpy()
+      rows["Queue_Size"] = samples["Queue_Size"].to_numpy()
+      rows["Queue_Samples"] = np.ones(samples.shape[0])
+
+      return rows
+
+
+   def _blank_rows(self, count):
+
+      return {
+         "link": np.zeros(count, dtype=np.int64),
+         "time": np.zeros(count, dtype=np.float64),
+         "reason": np.full(count, -1, dtype=np.int64),
+         **{measure: np.zeros(count, dtype=np.float64) for measure in self.MEASURES}
+      }
+
+
+   def _index(self):
+
+      rows = self._rows
+      self._search_index = GroupedTimeIndex(rows["link"], rows["time"])
+
+      self._sums = {measure: self._prefix_sum(rows[measure]) for measure in self.MEASURES}
+      self._reason_sums = self._prefix_sum(self._one_hot(rows["reason"]))
+
+      by_time = np.argsort(rows["time"], kind="stable")
+      self._times = rows["time"][by_time]
+      self._time_sums = {measure: self._prefix_sum(rows[measure][by_time]) for measure in self.MEASURES}
+      self._time_reason_sums = self._prefix_sum(self._one_hot(rows["reason"][by_time]))
+
+
+   def _bounds(self, links, start, end):
+
+      return self._search_index.search(links, start), self._search_index.search(links, end)
+
+
+   def _one_hot(self, codes):
+
+      one_hot = np.zeros((codes.shape[0], len(self._reasons)), dtype=np.int64)
+      failed = codes >= 0
+      one_hot[np.flatnonzero(failed), codes[failed]] = 1
+
+      return one_hot
+
+
+   @staticmethod
+   def _prefix_sum(values):
+
+      sums = np.zeros((values.shape[0] + 1,) + values.shape[1:], dtype=values.dtype)
+      np.cumsum(values, axis=0, out=sums[1:])
+
+      return sums
+
+
+   @staticmethod
+   def _ratio(numerator, denominator):
+
+      with np.errstate(divide="ignore", invalid="ignore"):
+         return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+   @staticmethod
+   def _codes(table, values):
+
+      codes, uniques = values.factorize()
+      mapping = np.array([table.setdefault(value, len(table)) for value in uniques], dtype=np.int64)
+
+      return mapping[codes] if mapping.shape[0] != 0 else codes.astype(np.int64)
@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+from inspector_packages import NO_FAILURE
+
+
+class MessageIndex:
+   """
+   Event rows grouped by message (originator, serial number) and ordered by
+   time within each message. One lexsort builds the grouping and a dict
+   maps every message to its group, so a message's path is a slice.
+
+   The per-message summary is reduced over the same groups: latency runs
+   from the first event to the last MESSAGE_RECEIVED, hops count successful
+   delivery attempts, and a message is dropped when it is discarded, fails
+   routing, or never arrives after a failed attempt.
+   """
+
+   KEYS = ["Message_Originator", "Message_SerialNumber"]
+   RECEIVED = "MESSAGE_RECEIVED"
+   ATTEMPT = "MESSAGE_DELIVERY_ATTEMPT"
+   DROPPED = ["MESSAGE_DISCARDED", "MESSAGE_FAILED_ROUTING"]
+   LINK_EVENTS = ["MESSAGE_DELIVERY_ATTEMPT", "MESSAGE_RECEIVED"]
+
+   def __init__(self, frame):
+
+      self._frame = frame
+      self._build()
+
+
+   def __len__(self):
+
+      return len(self._lookup)
+
+
+   def __contains__(self, message):
+
+      return self._key(*message) in self._lookup
+
+
+   @property
+   def summary(self):
+
+      return self._summary
+
+
+   def path(self, originator, serial_number):
+
+      group = self._lookup.get(self._key(originator, serial_number))
+      if group is None:
+         return self._frame.iloc[:0]
+
+      return self._frame.iloc[self._order[self._offsets[group]:self._offsets[group + 1]]]
+
+
+   def links(self, originator, serial_number):
+
+      path = self.path(originator, serial_number)
+
+      return path[path["Event_Type"].isin(self.LINK_EVENTS)]
+
+
+   def describe(self, originator, serial_number):
+
+      group = self._lookup.get(self._key(originator, serial_number))
+
+      return None if group is None else self._summary.iloc[group]
+
+
+   @staticmethod
+   def _key(originator, serial_number):
+
+      return (str(originator), int(serial_number))
+
+
+   def _build(self):
+
+      frame = self._frame
+      num_rows = frame.shape[0]
+
+      codes, originators = pd.factorize(frame["Message_Originator"].astype(str), sort=True)
+      serials = frame["Message_SerialNumber"].to_numpy().astype(np.int64)
+      times = frame["Timestamp"].to_numpy()
+
+      self._order = np.lexsort((times, serials, codes))
+      codes, serials, times = codes[self._order], serials[self._order], times[self._order]
+
+      boundaries = np.ones(num_rows, dtype=bool)
+      boundaries[1:] = (codes[1:] != codes[:-1]) | (serials[1:] != serials[:-1])
+      starts = np.flatnonzero(boundaries)
+      self._offsets = np.append(starts, num_rows)
+
+      keys = zip(originators.take(codes[starts]).tolist(), serials[starts].tolist())
+      self._lookup = {key: group for group, key in enumerate(keys)}
+
+      self._summary = self._summarize(starts, originators.take(codes[starts]), serials[starts], times)
+
+
+   def _summarize(self, starts, originators, serials, times):
+
+      frame = self._frame
+      num_rows = frame.shape[0]
+      columns = ["Originator", "Serial_Number", "Message_Type", "Start", "End", "Events",
+         "Attempts", "Hops", "Delivered", "Latency", "Dropped", "Drop_Platform", "Drop_Reason"]
+
+      if num_rows == 0:
+         return pd.DataFrame(columns=columns)
+
+      event_types = frame["Event_Type"].to_numpy().astype(str)[self._order]
+      succeeded = frame["CommInteraction_Succeeded"].to_numpy()[self._order] == 1
+      positions = np.arange(num_rows)
+
+      received = event_types == self.RECEIVED
+      attempts = event_types == self.ATTEMPT
+      discarded = np.isin(event_types, self.DROPPED)
+      failed = attempts & ~succeeded
+
+      last_received = np.maximum.reduceat(np.where(received, times, -np.inf), starts)
+      delivered = np.isfinite(last_received)
+      first_discard = np.minimum.reduceat(np.where(discarded, positions, num_rows), starts)
+      last_failure = np.maximum.reduceat(np.where(failed, positions, -1), starts)
+
+      drop_row = np.where(first_discard < num_rows, first_discard, np.where(delivered, -1, last_failure))
+      dropped = drop_row >= 0
+
+      drop_rows = self._order[drop_row[dropped]]
+      drop_platform = np.full(starts.shape[0], None, dtype=object)
+      drop_reason = np.full(starts.shape[0], None, dtype=object)
+      drop_platform[dropped] = frame["Sender_Name"].to_numpy()[drop_rows].astype(str)
+      reasons = frame["CommInteraction_FailedStatus"].to_numpy()[drop_rows].astype(str)
+      drop_reason[dropped] = np.where(reasons == NO_FAILURE, event_types[drop_row[dropped]], reasons)
+
+      summary = pd.DataFrame({
+         "Originator": originators,
+         "Serial_Number": serials,
+         "Message_Type": frame["Message_Type"].to_numpy()[self._order[starts]],
+         "Start": times[starts],
+         "End": times[self._offsets[1:] - 1],
+         "Events": np.diff(self._offsets),
+         "Attempts": np.add.reduceat(attempts, starts),
+         "Hops": np.add.reduceat(attempts & succeeded, starts),
+         "Delivered": delivered,
+         "Latency": np.where(delivered, last_received - times[starts], np.nan),
+         "Dropped": dropped,
+         "Drop_Platform": drop_platform,
+         "Drop_Reason": drop_reason
+      })
+
+      return summary
@@ -0,0 +1,102 @@
+import threading
+import networkx as nx
+from collections import OrderedDict
+
+
+class NetworkLayouts:
+   """
+   Node positions for the network plot, owned by one filtered view.
+
+   The view's whole-mission topology is extracted once, so the global layout
+   for each algorithm is computed once and then looked up. Layouts of
+   single windows are cached by their node and edge sets. Spring layouts
+   are warm-started from the positions last drawn in the same session, so
+   one analyst's stepping never moves another analyst's nodes. Those
+   layouts are cached per session for the same reason.
+   """
+
+   SEED = 7
+   CACHE_SIZE = 64
+   SESSIONS = 16
+
+   def __init__(self, frame):
+
+      nodes, edges = self._topology(frame)
+      self._global_nodes = nodes
+      self._global_edges = edges
+      self._global_layouts = {}
+      self._layouts = OrderedDict()
+      self._positions = OrderedDict()
+      self._lock = threading.Lock()
+
+
+   def global_layout(self, network_layout):
+
+      with self._lock:
+         if network_layout in self._global_layouts:
+            return self._global_layouts[network_layout]
+
+      node_positions = self._compute(network_layout, self._global_nodes, self._global_edges)
+
+      with self._lock:
+         self._global_layouts[network_layout] = node_positions
+
+      return node_positions
+
+
+   def layout(self, frame, network_layout, session_id=None):
+
+      nodes, edges = self._topology(frame)
+      warm_started = network_layout == "Spring"
+      layout_key = (network_layout, session_id if warm_started else None, nodes, edges)
+
+      with self._lock:
+         if layout_key in self._layouts:
+            self._layouts.move_to_end(layout_key)
+            return self._layouts[layout_key]
+         previous_positions = dict(self._positions.get(session_id, {})) if warm_started else {}
+
+      node_positions = self._compute(network_layout, nodes, edges, previous_positions)
+
+      with self._lock:
+         self._layouts[layout_key] = node_positions
+         if len(self._layouts) > self.CACHE_SIZE:
+            self._layouts.popitem(last=False)
+         if warm_started:
+            self._positions.setdefault(session_id, {}).update(node_positions)
+            self._positions.move_to_end(session_id)
+            if len(self._positions) > self.SESSIONS:
+               self._positions.popitem(last=False)
+
+      return node_positions
+
+
+   @staticmethod
+   def _topology(frame):
+
+      transmissions = frame[["Sender_Name", "Receiver_Name"]].drop_duplicates()
+      edges = frozenset(zip(transmissions["Sender_Name"], transmissions["Receiver_Name"]))
+      nodes = frozenset(transmissions["Sender_Name"]).union(transmissions["Receiver_Name"])
+
+      return nodes, edges
+
+
+   def _compute(self, network_layout, nodes, edges, previous_positions=None):
+
+      G = nx.Graph()
+      G.add_nodes_from(sorted(nodes))
+      G.add_edges_from(sorted(edges))
+
+      if network_layout == "Spring":
+         warm_start = {node: previous_positions[node] for node in G if node in (previous_positions or {})}
+         node_positions = nx.spring_layout(G, pos=warm_start if warm_start else None, seed=self.SEED)
+      elif network_layout == "Circular":
+         node_positions = nx.circular_layout(G)
+      elif network_layout == "Shell":
+         node_positions = nx.shell_layout(G)
+      elif network_layout == "Spectral":
+         node_positions = nx.spectral_layout(G)
+      elif network_layout == "Random":
+         node_positions = nx.random_layout(G, seed=self.SEED)
+
+      return node_positions
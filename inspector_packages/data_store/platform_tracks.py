@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+from .grouped_time_index import GroupedTimeIndex
+from ..elements.globe_methods import GlobeMethods
+
+
+class PlatformTracks:
+   """
+   Position history of every platform, gathered from the sender and
+   receiver location columns of the event rows.
+
+   Samples are deduplicated per (platform, time) and stored in compact
+   arrays sorted by platform and then time, with each platform's samples
+   in one contiguous slice. A GroupedTimeIndex finds the bracketing
+   samples of all platforms at any number of times with one searchsorted
+   call. ECEF positions between samples are interpolated along the great
+   circle and the reported latitude, longitude and altitude linearly, the
+   longitude the short way round. Both are held at the first or last
+   sample outside a platform's track.
+   """
+
+   ENDPOINTS = {
+      "Sender": ["SenderLocation_X", "SenderLocation_Y", "SenderLocation_Z",
+                 "Sender_Latitude", "Sender_Longitude", "Sender_Altitude"],
+      "Receiver": ["ReceiverLocation_X", "ReceiverLocation_Y", "ReceiverLocation_Z",
+                   "Receiver_Latitude", "Receiver_Longitude", "Receiver_Altitude"]
+   }
+
+   def __init__(self, frame):
+
+      names, times, samples = [], [], []
+      for endpoint, columns in self.ENDPOINTS.items():
+         names.append(frame[f"{endpoint}_Name"].to_numpy().astype(str))
+         times.append(frame["Timestamp"].to_numpy(dtype=np.float64))
+         samples.append(frame[columns].to_numpy(dtype=np.float64))
+
+      names = np.concatenate(names)
+      times = np.concatenate(times)
+      samples = np.concatenate(samples)
+
+      known = np.isfinite(times) & np.isfinite(samples).all(axis=1)
+      self._platforms, codes = np.unique(names[known], return_inverse=True)
+      times, samples = times[known], samples[known]
+
+      order = np.lexsort((times, codes))
+      codes, times, samples = codes[order], times[order], samples[order]
+      distinct = np.ones(codes.shape[0], dtype=bool)
+      distinct[1:] = (codes[1:] != codes[:-1]) | (times[1:] != times[:-1])
+
+      self._codes = codes[distinct]
+      self._times = times[distinct]
+      self._positions = np.ascontiguousarray(samples[distinct, :3])
+      self._geodetic = np.ascontiguousarray(samples[distinct, 3:])
+      self._offsets = np.searchsorted(self._codes, np.arange(self._platforms.shape[0] + 1))
+      self._search_index = GroupedTimeIndex(self._codes, self._times)
+
+
+   @property
+   def platforms(self):
+
+      return self._platforms
+
+
+   @property
+   def start(self):
+
+      return self._times.min() if self._times.shape[0] != 0 else None
+
+
+   @property
+   def end(self):
+
+      return self._times.max() if self._times.shape[0] != 0 else None
+
+
+   def positions(self, times, platforms=None):
+      """
+      ECEF positions of ``platforms`` (all platforms by default) at each of
+      ``times``, shaped (platforms, times, 3).
+      """
+
+      times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+      codes = self._platform_codes(platforms)
+      if codes.shape[0] == 0 or times.shape[0] == 0:
+         return np.empty((codes.shape[0], times.shape[0], 3))
+
+      before, after, fraction = self._bracket(codes, times)
+
+      return GlobeMethods.slerp(self._positions[before], self._positions[after], fraction)
+
+
+   def trails(self, time, length, num_points=32, platforms=None):
+      """
+      Each platform's path over the ``length`` seconds up to ``time``,
+      sampled at ``num_points`` evenly spaced times, plus the exact samples
+      that fall inside the span so turns are not cut off.
+      """
+
+      times = np.linspace(time - length, time, num_points)
+      inside = self._times[(self._times > time - length) & (self._times < time)]
+      times = np.union1d(times, inside) if inside.shape[0] <= 4 * num_points else times
+
+      return times, self.positions(times, platforms)
+
+
+   def active(self, time, platforms=None):
+      """
+      Whether ``time`` falls inside each platform's first and last sample.
+      """
+
+      codes = self._platform_codes(platforms)
+      first = self._times[self._offsets[codes]]
+      last = self._times[self._offsets[codes + 1] - 1]
+
+      return (first <= time) & (time <= last)
+
+
+   def frame_at(self, time, platforms=None):
+
+      codes = self._platform_codes(platforms)
+      before, after, fraction = self._bracket(codes, np.array([time], dtype=np.float64))
+      before, after, fraction = before[:, 0], after[:, 0], fraction[:, 0]
+
+      positions = GlobeMethods.slerp(self._positions[before], self._positions[after], fraction)
+      start, end = self._geodetic[before], self._geodetic[after]
+      change = end - start
+      change[:, 1] = (change[:, 1] + 180) % 360 - 180
+      latitude, longitude, altitude = (start + fraction[:, None] * change).T
+
+      return pd.DataFrame({
+         "Platform": self._platforms[codes],
+         "X": positions[:, 0],
+         "Y": positions[:, 1],
+         "Z": positions[:, 2],
+         "Latitude": latitude,
+         "Longitude": (longitude + 180) % 360 - 180,
+         "Altitude": altitude,
+         "Active": self.active(time, platforms)
+      })
+
+
+   def _platform_codes(self, platforms):
+
+      if platforms is None:
+         return np.arange(self._platforms.shape[0])
+
+      platforms = np.asarray(platforms).astype(str)
+      codes = np.searchsorted(self._platforms, platforms)
+      known = codes < self._platforms.shape[0]
+      known[known] = self._platforms[codes[known]] == platforms[known]
+
+      return codes[known]
+
+
+   def _bracket(self, codes, times):
+      """
+      Sample indices before and after each of ``times`` for each platform
+      in ``codes``, and the fraction of the way between them, all shaped
+      (codes, times).
+      """
+
+      upper = self._search_index.search(codes[:, None], times[None, :])
+
+      first = self._offsets[codes][:, None]
+      last = self._offsets[codes + 1][:, None] - 1
+      after = np.clip(upper, first, last)
+      before = np.clip(upper - 1, first, last)
+
+      t0, t1 = self._times[before], self._times[after]
+      with np.errstate(divide="ignore", invalid="ignore"):
+         fraction = np.where(t1 > t0, (times[None, :] - t0) / (t1 - t0), 0.0)
+
+      return before, after, np.clip(fraction, 0.0, 1.0)
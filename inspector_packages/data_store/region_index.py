@@ -0,0 +1,198 @@
+import re
+import numpy as np
+
+
+class RegionIndex:
+   """
+   Grid index of the sender and receiver latitude/longitude of every event
+   row, used to select the rows whose link touches a region.
+
+   Rows are bucketed into fixed-size lat/lon cells and kept grouped by cell
+   (positions sorted by cell id next to per-cell offsets), one grid per link
+   end. A region query classifies the cells rather than the rows: a cell
+   whose centre lies deeper inside or outside the polygon than half its
+   diagonal is taken or skipped whole, and only the rows of cells that the
+   polygon's edge passes through are tested point by point.
+
+   Regions are polygons of [latitude, longitude] vertices. Longitudes may
+   run past 180 so a region can cross the antimeridian; a point matches if
+   it lies inside at its longitude or at its longitude plus 360.
+   """
+
+   CELL_SIZE = 1.0
+   ENDPOINTS = {
+      "Sender": ["Sender_Latitude", "Sender_Longitude"],
+      "Receiver": ["Receiver_Latitude", "Receiver_Longitude"]
+   }
+
+   def __init__(self, frame, cell_size=None):
+
+      self._cell_size = cell_size or self.CELL_SIZE
+      self._num_rows = int(np.ceil(180 / self._cell_size))
+      self._num_cols = int(np.ceil(360 / self._cell_size))
+      self._num_cells = self._num_rows * self._num_cols
+      self._size = frame.shape[0]
+
+      self._grids = {}
+      for endpoint, columns in self.ENDPOINTS.items():
+         latitude = frame[columns[0]].to_numpy(dtype=np.float64)
+         longitude = frame[columns[1]].to_numpy(dtype=np.float64)
+         cells = self._cells(latitude, longitude)
+
+         order = np.argsort(cells, kind="stable")
+         offsets = np.searchsorted(cells[order], np.arange(-1, self._num_cells + 1))
+         self._grids[endpoint] = {
+            "latitude": latitude[order],
+            "longitude": longitude[order],
+            "positions": order,
+            "offsets": offsets[1:]
+         }
+
+
+   @property
+   def size(self):
+
+      return self._size
+
+
+   @staticmethod
+   def parse(text):
+      """
+      Reads a region typed as four numbers, "south, west, north, east", or
+      as three or more "latitude longitude" pairs. Returns the polygon's
+      vertices, or None if the text does not describe a valid region.
+      """
+
+      if not text:
+         return None
+
+      numbers = [float(number) for number in re.findall(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?", text)]
+
+      if len(numbers) == 4:
+         south, west, north, east = numbers
+         if east < west:
+            east += 360
+         vertices = [[south, west], [south, east], [north, east], [north, west]]
+      elif len(numbers) >= 6 and len(numbers) % 2 == 0:
+         vertices = [list(pair) for pair in zip(numbers[0::2], numbers[1::2])]
+         longitudes = [vertex[1] for vertex in vertices]
+         if max(longitudes) - min(longitudes) > 180:
+            for vertex in vertices:
+               vertex[1] += 360 if vertex[1] < 0 else 0
+      else:
+         return None
+
+      latitudes = np.array([vertex[0] for vertex in vertices])
+      longitudes = np.array([vertex[1] for vertex in vertices])
+      if np.any(np.abs(latitudes) > 90) or np.any(longitudes < -180) or np.any(longitudes > 540):
+         return None
+      if np.ptp(latitudes) == 0 or np.ptp(longitudes) == 0:
+         return None
+
+      return vertices
+
+
+   def mask(self, region):
+      """
+      Boolean mask over the indexed rows that is True where the sender or
+      the receiver lies inside ``region``.
+      """
+
+      mask = np.zeros(self._size, dtype=bool)
+      if region is None or len(region) < 3:
+         mask[:] = True
+         return mask
+
+      polygon = np.asarray(region, dtype=np.float64)
+      inside_cells, edge_cells = self._classify_cells(polygon)
+
+      for grid in self._grids.values():
+         mask[grid["positions"][self._slices(grid["offsets"], inside_cells)]] = True
+
+         candidates = self._slices(grid["offsets"], edge_cells)
+         candidates = candidates[~mask[grid["positions"][candidates]]]
+         latitude, longitude = grid["latitude"][candidates], grid["longitude"][candidates]
+         inside = self._contains(polygon, latitude, longitude) | self._contains(polygon, latitude, longitude + 360)
+         mask[grid["positions"][candidates[inside]]] = True
+
+      return mask
+
+
+   def _cells(self, latitude, longitude):
+
+      known = np.isfinite(latitude) & np.isfinite(longitude)
+      rows = np.clip(np.floor((np.where(known, latitude, 0) + 90) / self._cell_size), 0, self._num_rows - 1)
+      cols = np.floor((np.where(known, longitude, 0) + 180) / self._cell_size) % self._num_cols
+
+      return np.where(known, rows * self._num_cols + cols, -1).astype(np.int64)
+
+
+   def _classify_cells(self, polygon):
+
+      south, north = polygon[:, 0].min(), polygon[:, 0].max()
+      west, east = polygon[:, 1].min(), polygon[:, 1].max()
+
+      rows = np.arange(
+         max(int(np.floor((south + 90) / self._cell_size)), 0),
+         min(int(np.floor((north + 90) / self._cell_size)), self._num_rows - 1) + 1)
+      cols = np.arange(
+         int(np.floor((west + 180) / self._cell_size)),
+         int(np.floor((east + 180) / self._cell_size)) + 1)
+
+      centre_lat = (rows + 0.5) * self._cell_size - 90
+      centre_lon = (cols + 0.5) * self._cell_size - 180
+      centre_lat, centre_lon = np.meshgrid(centre_lat, centre_lon, indexing="ij")
+      cells = (rows[:, None] * self._num_cols + cols[None, :] % self._num_cols).ravel()
+      centre_lat, centre_lon = centre_lat.ravel(), centre_lon.ravel()
+
+      inside = self._contains(polygon, centre_lat, centre_lon)
+      clear = self._edge_distance(polygon, centre_lat, centre_lon) > self._cell_size * np.sqrt(0.5)
+
+      return np.unique(cells[inside & clear]), np.unique(cells[~clear])
+
+
+   @staticmethod
+   def _slices(offsets, cells):
+
+      starts, ends = offsets[cells], offsets[cells + 1]
+      lengths = ends - starts
+      total = lengths.sum()
+      if total == 0:
+         return np.empty(0, dtype=np.int64)
+
+      shifts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+
+      return shifts + np.arange(total)
+
+
+   @staticmethod
+   def _contains(polygon, latitude, longitude):
+
+      inside = np.zeros(latitude.shape[0], dtype=bool)
+      lat_a, lon_a = polygon[:, 0], polygon[:, 1]
+      lat_b, lon_b = np.roll(lat_a, -1), np.roll(lon_a, -1)
+
+      for y1, x1, y2, x2 in zip(lat_a, lon_a, lat_b, lon_b):
+         if y1 == y2:
+            continue
+         crosses = (y1 > latitude) != (y2 > latitude)
+         x_cross = x1 + (latitude - y1) * (x2 - x1) / (y2 - y1)
+         inside ^= crosses & (longitude < x_cross)
+
+      return inside
+
+
+   @staticmethod
+   def _edge_distance(polygon, latitude, longitude):
+
+      distance = np.full(latitude.shape[0], np.inf)
+      start = polygon
+      end = np.roll(polygon, -1, axis=0)
+
+      for (y1, x1), (y2, x2) in zip(start, end):
+         dy, dx = y2 - y1, x2 - x1
+         length = dy * dy + dx * dx
+         t = np.clip(((latitude - y1) * dy + (longitude - x1) * dx) / length, 0, 1) if length > 0 else 0
+         distance = np.minimum(distance, np.hypot(latitude - (y1 + t * dy), longitude - (x1 + t * dx)))
+
+      return distance
@@ -0,0 +1,66 @@
+import numpy as np
+
+
+class SeriesDownsampler:
+   """
+   Picks which points of a long, time-sorted series to draw.
+
+   ``lttb`` is Largest-Triangle-Three-Buckets: each bucket keeps the point
+   forming the largest triangle with the previously kept point and the
+   next bucket's mean, which follows the visual shape of the line.
+   ``min_max`` keeps the lowest and highest point of each equal-width
+   time bucket, so no spike is lost. Both return sorted row positions.
+   """
+
+   @staticmethod
+   def lttb(times, values, num_points):
+
+      num_rows = times.shape[0]
+      if num_points >= num_rows or num_points < 3:
+         return np.arange(num_rows)
+
+      edges = np.linspace(1, num_rows - 1, num_points - 1).astype(np.int64)
+      sums_t = np.add.reduceat(times[1:num_rows - 1], edges[:-1] - 1)
+      sums_v = np.add.reduceat(values[1:num_rows - 1], edges[:-1] - 1)
+      sizes = np.diff(edges)
+      mean_t = np.append(sums_t / sizes, times[-1])
+      mean_v = np.append(sums_v / sizes, values[-1])
+
+      selected = np.empty(num_points, dtype=np.int64)
+      selected[0], selected[-1] = 0, num_rows - 1
+      previous = 0
+      for bucket in range(num_points - 2):
+         start, end = edges[bucket], edges[bucket + 1]
+         bucket_t, bucket_v = times[start:end], values[start:end]
+         areas = np.abs(
+            (times[previous] - mean_t[bucket + 1]) * (bucket_v - values[previous]) -
+            (times[previous] - bucket_t) * (mean_v[bucket + 1] - values[previous]))
+         previous = start + int(np.argmax(areas))
+         selected[bucket + 1] = previous
+
+      return selected
+
+
+   @staticmethod
+   def min_max(times, values, num_buckets):
+
+      num_rows = times.shape[0]
+      if 2 * num_buckets >= num_rows or num_rows == 0:
+         return np.arange(num_rows)
+
+      edges = np.linspace(times[0], times[-1], num_buckets + 1)
+      buckets = np.clip(np.searchsorted(edges, times, side="right") - 1, 0, num_buckets - 1)
+      new_bucket = np.r_[True, buckets[1:] != buckets[:-1]]
+      starts = np.flatnonzero(new_bucket)
+      groups = np.cumsum(new_bucket) - 1
+      lowest = np.minimum.reduceat(values, starts)[groups]
+      highest = np.maximum.reduceat(values, starts)[groups]
+
+      _, first_low = np.unique(buckets[values == lowest], return_index=True)
+      _, first_high = np.unique(buckets[values == highest], return_index=True)
+      positions = np.concatenate([
+         np.flatnonzero(values == lowest)[first_low],
+         np.flatnonzero(values == highest)[first_high],
+         [0, num_rows - 1]])
+
+      return np.unique(positions)
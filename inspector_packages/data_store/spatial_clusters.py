@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+from inspector_packages import NO_FAILURE
+
+
+class SpatialClusters:
+   """
+   Level-of-detail aggregation of one time window's platforms and external
+   link events on a hierarchical latitude/longitude grid.
+
+   The grid starts from 90 degree cells and halves the cell size at every
+   level. Each point (platform positions and both ends of every link event)
+   is quantized once at the finest level; the cell of any coarser level
+   is the finest cell's row and column shifted right, so every level
+   comes from the same quantization. At a level, platforms in the same cell
+   merge into one cluster at the cell's centroid, and link events whose
+   ends fall in the same pair of cells merge into one bundle carrying the
+   link and event counts and the share of events without a failure.
+   Results are cached per level.
+   """
+
+   BASE_SIZE = 90.0
+   MAX_LEVEL = 12
+   CELLS_ACROSS = 12
+   SENDER = ["SenderLocation_X", "SenderLocation_Y", "SenderLocation_Z"]
+   RECEIVER = ["ReceiverLocation_X", "ReceiverLocation_Y", "ReceiverLocation_Z"]
+
+   def __init__(self, platforms, links):
+
+      self._platform_names = platforms["Platform"].to_numpy().astype(str)
+      self._num_platforms = self._platform_names.shape[0]
+      self._num_links = links.shape[0]
+
+      self._link_ids = links["Link_ID"].to_numpy() if "Link_ID" in links else np.arange(self._num_links)
+      self._succeeded = links["CommInteraction_FailedStatus"].to_numpy().astype(str) == NO_FAILURE
+
+      positions = np.concatenate([
+         platforms[["X", "Y", "Z"]].to_numpy(dtype=np.float64),
+         links[self.SENDER].to_numpy(dtype=np.float64),
+         links[self.RECEIVER].to_numpy(dtype=np.float64)]).reshape(-1, 3)
+
+      self._positions = positions
+      self._rows, self._cols = self._quantize(positions)
+      self._levels = {}
+
+
+   @classmethod
+   def level_for(cls, eye_distance, radius, fov=None):
+      """
+      Grid level whose cells split the ground visible from ``eye_distance``
+      into about CELLS_ACROSS cells: the horizon bounds the view from far
+      away and the field of view bounds it close in.
+      """
+
+      altitude = max(eye_distance - radius, 1.0)
+      horizon = np.degrees(np.arccos(min(radius / max(eye_distance, radius), 1.0)))
+      footprint = np.degrees(altitude * np.tan((fov or np.radians(60)) / 2) / radius)
+
+      return cls.level_for_span(2 * min(horizon, footprint))
+
+
+   @classmethod
+   def level_for_span(cls, span):
+      """
+      Grid level whose cells split a view ``span`` degrees across into
+      about CELLS_ACROSS cells.
+      """
+
+      cell_size = span / cls.CELLS_ACROSS
+
+      return int(np.clip(np.round(np.log2(cls.BASE_SIZE / max(cell_size, 1e-9))), 0, cls.MAX_LEVEL))
+
+
+   def at(self, level):
+
+      level = int(np.clip(level, 0, self.MAX_LEVEL))
+      if level not in self._levels:
+         self._levels[level] = self._aggregate(level)
+
+      return self._levels[level]
+
+
+   def _aggregate(self, level):
+
+      shift = self.MAX_LEVEL - level
+      cells = (self._rows >> shift) * (4 << level) + (self._cols >> shift)
+      keys, labels = np.unique(cells, return_inverse=True)
+      centroids = self._centroids(labels, keys.shape[0])
+
+      platform_cells = labels[:self._num_platforms]
+      sender_cells = labels[self._num_platforms:self._num_platforms + self._num_links]
+      receiver_cells = labels[self._num_platforms + self._num_links:]
+
+      return self._clusters(platform_cells, centroids), self._bundles(sender_cells, receiver_cells, centroids)
+
+
+   def _clusters(self, platform_cells, centroids):
+
+      if self._num_platforms == 0:
+         return pd.DataFrame(columns=["X", "Y", "Z", "Count", "Platforms"])
+
+      order = np.argsort(platform_cells, kind="stable")
+      cells, starts, counts = np.unique(platform_cells[order], return_index=True, return_counts=True)
+      names = np.split(self._platform_names[order], starts[1:])
+
+      return pd.DataFrame({
+         "X": centroids[cells, 0],
+         "Y": centroids[cells, 1],
+         "Z": centroids[cells, 2],
+         "Count": counts,
+         "Platforms": [", ".join(group[:8]) + (f" (+{len(group) - 8} more)" if len(group) > 8 else "") for group in names]
+      })
+
+
+   def _bundles(self, sender_cells, receiver_cells, centroids):
+
+      columns = ["From_X", "From_Y", "From_Z", "To_X", "To_Y", "To_Z", "Links", "Events", "Success_Rate"]
+      between = sender_cells != receiver_cells
+      if not between.any():
+         return pd.DataFrame(columns=columns)
+
+      low = np.minimum(sender_cells, receiver_cells)[between]
+      high = np.maximum(sender_cells, receiver_cells)[between]
+      events = pd.DataFrame({
+         "low": low,
+         "high": high,
+         "link": self._link_ids[between],
+         "succeeded": self._succeeded[between]
+      })
+      bundles = events.groupby(["low", "high"], sort=False).agg(
+         Links=("link", "nunique"),
+         Events=("succeeded", "size"),
+         Success_Rate=("succeeded", "mean")).reset_index()
+
+      start, end = centroids[bundles["low"].to_numpy()], centroids[bundles["high"].to_numpy()]
+      for idx, axis in enumerate("XYZ"):
+         bundles[f"From_{axis}"] = start[:, idx]
+         bundles[f"To_{axis}"] = end[:, idx]
+
+      return bundles[columns]
+
+
+   def _centroids(self, labels, num_cells):
+
+      radius = np.linalg.norm(self._positions, axis=1)
+      with np.errstate(divide="ignore", invalid="ignore"):
+         units = np.nan_to_num(self._positions / radius[:, None])
+
+      direction = np.stack([np.bincount(labels, units[:, axis], num_cells) for axis in range(3)], axis=1)
+      mean_radius = np.bincount(labels, radius, num_cells) / np.maximum(np.bincount(labels, minlength=num_cells), 1)
+      with np.errstate(divide="ignore", invalid="ignore"):
+         direction = np.nan_to_num(direction / np.linalg.norm(direction, axis=1, keepdims=True))
+
+      return direction * mean_radius[:, None]
+
+
+   def _quantize(self, positions):
+
+      x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
+      latitude = np.degrees(np.arctan2(z, np.hypot(x, y)))
+      longitude = np.degrees(np.arctan2(y, x))
+
+      cell_size = self.BASE_SIZE / (1 << self.MAX_LEVEL)
+      rows = np.clip(np.floor((latitude + 90) / cell_size), 0, (2 << self.MAX_LEVEL) - 1).astype(np.int64)
+      cols = np.clip(np.floor((longitude + 180) / cell_size), 0, (4 << self.MAX_LEVEL) - 1).astype(np.int64)
+
+      return rows, cols
@@ -0,0 +1,310 @@
+import threading
+import networkx as nx
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+
+
+class TemporalGraph:
+   """
+   Undirected communication graph whose links switch on when a transmission
+   succeeds and stay on for ``hold`` seconds after the last one.
+
+   Successive transmissions on a link are merged into activation intervals,
+   and the interval starts and ends are swept once in time order. Each
+   change updates degrees and connected components for just the link that
+   appeared or dropped out (see _ActiveGraph).
+   Betweenness is too costly to sweep, so it is computed on demand for a
+   time and cached by the set of active links.
+   """
+
+   HOLD = 10.0
+
+   def __init__(self, frame, hold=None):
+
+      self._hold = self.HOLD if hold is None else hold
+      self._betweenness = OrderedDict()
+      self._betweenness_size = 64
+      self._lock = threading.Lock()
+
+      self._build_intervals(frame)
+      self._sweep()
+
+
+   @property
+   def nodes(self):
+
+      return self._nodes
+
+
+   @property
+   def intervals(self):
+
+      return pd.DataFrame({
+         "Source": self._nodes[self._edges[self._interval_edges, 0]],
+         "Target": self._nodes[self._edges[self._interval_edges, 1]],
+         "Start": self._starts,
+         "End": self._ends
+      })
+
+
+   @property
+   def health(self):
+
+      return self._health
+
+
+   def edges_at(self, time):
+
+      upper = np.searchsorted(self._starts, time, side="right")
+      active = self._interval_edges[:upper][self._ends[:upper] > time]
+
+      return self._edges[np.unique(active)]
+
+
+   def degree_at(self, time):
+
+      edges = self.edges_at(time)
+      degree = np.bincount(edges.ravel(), minlength=self._nodes.shape[0])
+
+      return dict(zip(self._nodes[degree > 0], degree[degree > 0]))
+
+
+   def betweenness_at(self, time):
+
+      edges = self.edges_at(time)
+      key = edges.tobytes()
+
+      with self._lock:
+         if key in self._betweenness:
+            self._betweenness.move_to_end(key)
+            return self._betweenness[key]
+
+      G = nx.Graph()
+      G.add_edges_from(self._nodes[edges].tolist())
+      betweenness = nx.betweenness_centrality(G, k=min(G.number_of_nodes(), 64) or None, seed=7)
+
+      with self._lock:
+         self._betweenness[key] = betweenness
+         if len(self._betweenness) > self._betweenness_size:
+            self._betweenness.popitem(last=False)
+
+      return betweenness
+
+
+   def betweenness_series(self, num_samples=60):
+
+      if self._health.empty:
+         return pd.Series(dtype=np.float64)
+
+      times = np.unique(np.linspace(self._health.index[0], self._health.index[-1], num_samples))
+      peaks = [max(self.betweenness_at(time).values(), default=0.0) for time in times]
+
+      return pd.Series(peaks, index=times)
+
+
+   def _build_intervals(self, frame):
+
+      frame = frame[frame["CommInteraction_Succeeded"].to_numpy() == 1]
+      senders = frame["Sender_Name"].to_numpy().astype(str)
+      receivers = frame["Receiver_Name"].to_numpy().astype(str)
+      times = frame["Timestamp"].to_numpy()
+
+      links = senders != receivers
+      senders, receivers, times = senders[links], receivers[links], times[links]
+
+      self._nodes, codes = np.unique(np.concatenate([senders, receivers]), return_inverse=True)
+      codes = codes.reshape(2, -1)
+      pairs = np.sort(codes, axis=0)
+
+      self._edges, edge_ids = np.unique(pairs.T, axis=0, return_inverse=True)
+      self._edges = self._edges.reshape(-1, 2)
+      edge_ids = edge_ids.ravel()
+
+      order = np.lexsort((times, edge_ids))
+      edge_ids, times = edge_ids[order], times[order]
+
+      new_interval = np.ones(times.shape[0], dtype=bool)
+      new_interval[1:] = (edge_ids[1:] != edge_ids[:-1]) | (times[1:] - times[:-1] > self._hold)
+      first = np.flatnonzero(new_interval)
+      last = np.append(first[1:], times.shape[0])[:first.shape[0]] - 1
+
+      by_start = np.argsort(times[first], kind="stable")
+      self._interval_edges = edge_ids[first][by_start]
+      self._starts = times[first][by_start]
+      self._ends = times[last][by_start] + self._hold
+
+
+   def _sweep(self):
+
+      columns = ["Active_Links", "Active_Nodes", "Components", "Largest_Component", "Mean_Degree", "Max_Degree"]
+
+      change_times = np.concatenate([self._starts, self._ends])
+      change_edges = np.concatenate([self._interval_edges, self._interval_edges])
+      change_signs = np.concatenate([np.ones(self._starts.shape[0], dtype=np.int64), -np.ones(self._ends.shape[0], dtype=np.int64)])
+
+      order = np.lexsort((-change_signs, change_times))
+      change_times, change_edges, change_signs = change_times[order], change_edges[order], change_signs[order]
+      changes = np.ones(change_times.shape[0], dtype=bool)
+      changes[1:] = change_times[1:] != change_times[:-1]
+      bounds = np.append(np.flatnonzero(changes), change_times.shape[0])
+
+      graph = _ActiveGraph(self._nodes.shape[0])
+      active = [0] * self._edges.shape[0]
+      sources, targets = self._edges[change_edges, 0].tolist(), self._edges[change_edges, 1].tolist()
+      change_edges, change_signs = change_edges.tolist(), change_signs.tolist()
+
+      rows = []
+      for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+         for idx in range(start, end):
+            edge, sign = change_edges[idx], change_signs[idx]
+            active[edge] += sign
+            if sign > 0 and active[edge] == 1:
+               graph.add(sources[idx], targets[idx])
+            elif sign < 0 and active[edge] == 0:
+               graph.remove(sources[idx], targets[idx])
+
+         rows.append((
+            graph.links,
+            graph.nodes,
+            len(graph.members),
+            graph.largest / graph.nodes if graph.nodes else 0.0,
+            2 * graph.links / graph.nodes if graph.nodes else 0.0,
+            graph.max_degree))
+
+      self._health = pd.DataFrame(rows, index=change_times[bounds[:-1]], columns=columns)
+
+
+class _ActiveGraph:
+   """
+   Degrees and connected components of the currently active links, updated
+   one link at a time.
+
+   A new link merges two components by relabelling the smaller one. When a
+   link drops out, searches from both of its ends run in lockstep until
+   they meet, or until one side runs out. A side that runs out is a new
+   component, so the work is bounded by the smaller side of a split.
+   Histograms of degrees and component sizes keep the maxima current.
+   """
+
+   def __init__(self, num_nodes):
+
+      self.adjacent = [set() for _ in range(num_nodes)]
+      self.label = [-1] * num_nodes
+      self.members = {}
+      self.links = 0
+      self.nodes = 0
+      self.max_degree = 0
+      self.largest = 0
+      self._degree_counts = [0] * (num_nodes + 1)
+      self._size_counts = [0] * (num_nodes + 1)
+      self._next_label = 0
+
+
+   def add(self, u, v):
+
+      for node in (u, v):
+         if not self.adjacent[node]:
+            self.nodes += 1
+            self._new_component({node})
+
+      self.adjacent[u].add(v)
+      self.adjacent[v].add(u)
+      self.links += 1
+      self._degree_changed(u, 1)
+      self._degree_changed(v, 1)
+
+      self._merge(self.label[u], self.label[v])
+
+
+   def remove(self, u, v):
+
+      self.adjacent[u].discard(v)
+      self.adjacent[v].discard(u)
+      self.links -= 1
+      self._degree_changed(u, -1)
+      self._degree_changed(v, -1)
+
+      split = self._separated(u, v)
+      if split is not None:
+         self._resize(self.label[u], len(self.members[self.label[u]]) - len(split))
+         self.members[self.label[u]] -= split
+         self._new_component(split)
+
+      for node in (u, v):
+         if not self.adjacent[node]:
+            self.nodes -= 1
+            self._resize(self.label[node], 0)
+            del self.members[self.label[node]]
+            self.label[node] = -1
+
+      while self.largest and self._size_counts[self.largest] == 0:
+         self.largest -= 1
+
+
+   def _separated(self, u, v):
+
+      # Most dropped links in a busy network close a triangle
+      if not self.adjacent[u].isdisjoint(self.adjacent[v]):
+         return None
+
+      seen = ({u}, {v})
+      frontier = ([u], [v])
+      while True:
+         for side in (0, 1):
+            if not frontier[side]:
+               return seen[side]
+
+            for neighbour in self.adjacent[frontier[side].pop()]:
+               if neighbour in seen[1 - side]:
+                  return None
+               if neighbour not in seen[side]:
+                  seen[side].add(neighbour)
+                  frontier[side].append(neighbour)
+
+
+   def _new_component(self, nodes):
+
+      label = self._next_label
+      self._next_label += 1
+      self.members[label] = nodes
+      for node in nodes:
+         self.label[node] = label
+
+      self._size_counts[len(nodes)] += 1
+      self.largest = max(self.largest, len(nodes))
+
+
+   def _merge(self, kept, merged):
+
+      if kept == merged:
+         return
+      if len(self.members[kept]) < len(self.members[merged]):
+         kept, merged = merged, kept
+
+      self._resize(kept, len(self.members[kept]) + len(self.members[merged]))
+      self._resize(merged, 0)
+      for node in self.members[merged]:
+         self.label[node] = kept
+      self.members[kept] |= self.members.pop(merged)
+
+
+   def _resize(self, label, size):
+
+      self._size_counts[len(self.members[label])] -= 1
+      if size:
+         self._size_counts[size] += 1
+         self.largest = max(self.largest, size)
+
+
+   def _degree_changed(self, node, step):
+
+      # Degrees move by one, so the maximum moves by at most one
+      degree = len(self.adjacent[node])
+      self._degree_counts[degree - step] -= 1
+      self._degree_counts[degree] += 1
+
+      if degree > self.max_degree:
+         self.max_degree = degree
+      elif self._degree_counts[self.max_degree] == 0:
+         self.max_degree -= 1
@@ -0,0 +1,104 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+
+
+class TemporalReachability:
+   """
+   Earliest-arrival reachability over the directed links that successfully
+   carried a transmission, taken in time order so a path only uses a link
+   after the message has reached its sender.
+
+   Every source is swept at once. Each platform keeps a packed bitset of
+   the sources that have reached it, and a link ORs its sender's set into
+   its receiver's. Because links are taken in time order, the first time a
+   bit is set is that pair's earliest arrival. Links sharing a timestamp
+   are repeated until no bit changes, which allows relays within a single
+   time step.
+   """
+
+   def __init__(self, frame):
+
+      self._matrices = OrderedDict()
+      self._matrices_size = 16
+      self._lock = threading.Lock()
+
+      self._build(frame)
+
+
+   @property
+   def platforms(self):
+
+      return self._platforms
+
+
+   def latency_matrix(self, start, deadline):
+
+      key = (start, deadline)
+      with self._lock:
+         if key in self._matrices:
+            self._matrices.move_to_end(key)
+            return self._matrices[key]
+
+      latency = self._earliest_arrival(start, start + deadline) - start
+
+      with self._lock:
+         self._matrices[key] = latency
+         if len(self._matrices) > self._matrices_size:
+            self._matrices.popitem(last=False)
+
+      return latency
+
+
+   def _build(self, frame):
+
+      frame = frame[frame["CommInteraction_Succeeded"].to_numpy() == 1]
+      senders = frame["Sender_Name"].to_numpy().astype(str)
+      receivers = frame["Receiver_Name"].to_numpy().astype(str)
+      times = frame["Timestamp"].to_numpy()
+
+      self._platforms, codes = np.unique(np.concatenate([senders, receivers]), return_inverse=True)
+      codes = codes.reshape(2, -1)
+
+      links = codes[0] != codes[1]
+      order = np.argsort(times[links], kind="stable")
+      self._senders = codes[0][links][order]
+      self._receivers = codes[1][links][order]
+      self._times = times[links][order]
+
+
+   def _earliest_arrival(self, start, end):
+
+      num_platforms = self._platforms.shape[0]
+      arrival = np.full((num_platforms, num_platforms), np.inf)
+      np.fill_diagonal(arrival, start)
+      reached_by = np.packbits(np.eye(num_platforms, dtype=bool), axis=1)
+      num_reached = num_platforms
+
+      lower = np.searchsorted(self._times, start, side="left")
+      upper = np.searchsorted(self._times, end, side="right")
+      times = self._times[lower:upper]
+
+      changes = np.ones(times.shape[0], dtype=bool)
+      changes[1:] = times[1:] != times[:-1]
+      bounds = np.append(np.flatnonzero(changes), times.shape[0]) + lower
+
+      for first, last in zip(bounds[:-1], bounds[1:]):
+         time = self._times[first]
+         senders, receivers = self._senders[first:last], self._receivers[first:last]
+         targets = np.unique(receivers)
+
+         while True:
+            before = reached_by[targets]
+            np.bitwise_or.at(reached_by, receivers, reached_by[senders])
+            gained = np.unpackbits(reached_by[targets] & ~before, axis=1, count=num_platforms)
+            destinations, sources = np.nonzero(gained)
+            if destinations.shape[0] == 0:
+               break
+            arrival[targets[destinations], sources] = time
+            num_reached += destinations.shape[0]
+
+         if num_reached == num_platforms * num_platforms:
+            break
+
+      return arrival.T
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+
+class TimePyramid:
+   """
+   Event counts pre-aggregated into fixed time buckets at several
+   resolutions, split by event type, link and failure status.
+
+   Each level stores only the non-empty (bucket, category) cells, sorted by
+   bucket, so a query over any time span is two binary searches and a
+   bincount. Coarser levels are summed from the finest one rather than
+   rescanning the frame.
+   """
+
+   RESOLUTIONS = [1, 10, 60]
+   SPLITS = ["Event_Type", "Link", "Failure_Status"]
+
+   def __init__(self, frame):
+
+      self._build(frame)
+
+
+   @property
+   def start(self):
+
+      return self._origin
+
+
+   @property
+   def end(self):
+
+      return self._end
+
+
+   def resolution_for(self, start, end, max_buckets=600):
+
+      for resolution in self.RESOLUTIONS:
+         if (end - start) / resolution <= max_buckets:
+            return resolution
+
+      return self.RESOLUTIONS[-1]
+
+
+   def series(self, split, start, end, resolution, top=10):
+
+      buckets, codes, counts = self._levels[split][resolution]
+      categories = self._categories[split]
+
+      first_bucket = int(np.floor((start - self._origin) / resolution))
+      last_bucket = int(np.floor((end - self._origin) / resolution))
+      lower = np.searchsorted(buckets, first_bucket, side="left")
+      upper = np.searchsorted(buckets, last_bucket, side="right")
+
+      buckets, codes, counts = buckets[lower:upper], codes[lower:upper], counts[lower:upper]
+      bucket_times = self._origin + resolution * np.arange(max(first_bucket, 0), max(last_bucket, -1) + 1)
+
+      totals = np.bincount(codes, weights=counts, minlength=len(categories))
+      present = np.flatnonzero(totals)
+      ranked = present[np.argsort(-totals[present], kind="stable")]
+      shown, hidden = ranked[:top], ranked[top:]
+
+      rows = buckets - max(first_bucket, 0)
+      columns = np.full(len(categories), len(shown), dtype=np.int64)
+      columns[shown] = np.arange(len(shown))
+
+      table = np.zeros((bucket_times.shape[0], len(shown) + 1), dtype=np.int64)
+      np.add.at(table, (rows, columns[codes]), counts)
+
+      names = [categories[code] for code in shown]
+      if len(hidden) != 0:
+         names.append("Other")
+      else:
+         table = table[:, :-1]
+
+      return pd.DataFrame(table, index=bucket_times, columns=names)
+
+
+   def _build(self, frame):
+
+      timestamps = frame["Timestamp"].to_numpy()
+      self._origin = np.floor(timestamps.min()) if timestamps.shape[0] != 0 else 0.0
+      self._end = timestamps.max() if timestamps.shape[0] != 0 else 0.0
+      fine_buckets = np.floor(timestamps - self._origin).astype(np.int64)
+
+      split_values = {
+         "Event_Type": frame["Event_Type"].astype(str),
+         "Link": frame["Sender_Name"].astype(str) + " >> " + frame["Receiver_Name"].astype(str),
+         "Failure_Status": frame["CommInteraction_FailedStatus"].astype(str)
+      }
+
+      self._categories = {}
+      self._levels = {}
+      for split, values in split_values.items():
+         codes, categories = pd.factorize(values, sort=True)
+         self._categories[split] = categories.tolist()
+         self._levels[split] = self._aggregate(fine_buckets, codes, len(categories))
+
+
+   def _aggregate(self, fine_buckets, codes, num_categories):
+
+      levels = {}
+      cell_buckets, cell_codes = fine_buckets, codes.astype(np.int64)
+      cell_counts = np.ones(fine_buckets.shape[0], dtype=np.int64)
+      previous = 1
+      for resolution in self.RESOLUTIONS:
+         keys = (cell_buckets // (resolution // previous)) * max(num_categories, 1) + cell_codes
+         unique_keys, inverse = np.unique(keys, return_inverse=True)
+         cell_counts = np.bincount(inverse, weights=cell_counts, minlength=unique_keys.shape[0]).astype(np.int64)
+         cell_buckets, cell_codes = np.divmod(unique_keys, max(num_categories, 1))
+         levels[resolution] = (cell_buckets, cell_codes, cell_counts)
+         previous = resolution
+
+      return levels
@@ -1,9 +1,17 @@
 from .network_plot import NetworkPlot
 from .bar_plot import BarPlot
 from .globe_plot import GlobePlot
+from .map_plot import MapPlot
 from .globe_comms import GlobeComms
+from .map_comms import MapComms
 from .globe_methods import GlobeMethods
 from .cesium_globe import CesiumJSGlobe
+from .figure_factory import FigureFactory
+from .timeline_plot import TimelinePlot
+from .message_plot import MessagePlot
+from .link_metrics_plot import LinkMetricsPlot
+from .series_plot import SeriesPlot
+from .view_culler import ViewCuller
 
 
 __all__ = [
@@ -11,6 +19,14 @@ __all__ = [
    "BarPlot",
    "GlobePlot",
    "GlobeComms",
+   "MapPlot",
+   "MapComms",
    "CesiumJSGlobe",
-   "GlobeMethods"
+   "GlobeMethods",
+   "FigureFactory",
+   "TimelinePlot",
+   "MessagePlot",
+   "LinkMetricsPlot",
+   "SeriesPlot",
+   "ViewCuller"
 ]
\ No newline at end of file
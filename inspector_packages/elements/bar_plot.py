@@ -1,44 +1,58 @@
+import plotly.colors
+import pandas as pd
 from inspector_packages import *
-from plotly.subplots import make_subplots
+from .figure_factory import FigureFactory
 
 class BarPlot:
 
+   COLORWAY = plotly.colors.qualitative.Plotly
+
    @staticmethod
-   def generate_barplots(frame, subplot_category, bar_graph_category, bar_stack_category):
-            
+   def generate_barplots(counts, subplot_category, bar_graph_category, bar_stack_category):
+
+      subplots = counts.index.get_level_values(0).unique()
+      stacks = counts.index.get_level_values(2).unique()
+      stack_colors = {stack: BarPlot.COLORWAY[idx % len(BarPlot.COLORWAY)] for idx, stack in enumerate(stacks)}
+
       num_cols = 2
-      quotient, remainder = divmod(len(frame[subplot_category].unique()), num_cols)
+      quotient, remainder = divmod(len(subplots), num_cols)
       num_rows = quotient + remainder
 
-      fig = make_subplots(
+      layout = FigureFactory.subplot_grid(
          rows=num_rows if num_rows >= 3 else 3,
          cols=num_cols,
-         subplot_titles=frame[subplot_category].unique().astype(str),
+         titles=subplots.astype(str).tolist(),
       )
 
-      subplot_grp = 1
-      for idx, category in enumerate(frame[subplot_category].unique()):
-         row, col = divmod(idx, num_cols)
-         bar_data = frame[frame[subplot_category] == category]
-         for _, stack_category in enumerate(bar_data[bar_stack_category].unique()):
-            stack = bar_data[bar_data[bar_stack_category] == stack_category]
-            series = stack[bar_graph_category].value_counts()
-            fig.append_trace(
-               go.Bar(
-                  x=series.index,
-                  y=series.values,
-                  customdata=series.to_list(),
-                  hovertemplate=f'{stack_category}' + ' - %{customdata}<extra></extra>',
-                  offsetgroup=subplot_grp
-               ),
-               row+1, col+1
-            )
-         subplot_grp += 1
-
-      fig.update_layout(
-         barmode='stack', 
+      table = pd.DataFrame({
+         "count": counts.values, 
+         "base": (counts.groupby(level=[0, 1], sort=False, observed=True).cumsum() - counts).values
+      }, index=counts.index)
+
+      traces = []
+      for idx, (category, bar_data) in enumerate(table.groupby(level=0, sort=False, observed=True)):
+         axis = idx + 1 if idx != 0 else ''
+         bars = bar_data.index.get_level_values(1)
+         stack_labels = bar_data.index.get_level_values(2)
+         traces.append(
+            {
+               "type": "bar",
+               "x": bars,
+               "y": bar_data["count"].values,
+               "base": bar_data["base"].values,
+               "marker": {"color": [stack_colors[stack] for stack in stack_labels]},
+               "customdata": list(zip(stack_labels, bar_data["count"].values)),
+               "hovertemplate": '%{customdata[0]} - %{customdata[1]}<extra></extra>',
+               "offsetgroup": idx + 1,
+               "xaxis": f"x{axis}",
+               "yaxis": f"y{axis}"
+            }
+         )
+
+      layout.update(
+         barmode='overlay', 
          paper_bgcolor='rgba(0,0,0,0)', 
          plot_bgcolor='rgba(0,0,0,0)',
          showlegend=False)
 
-      return fig
\ No newline at end of file
+      return FigureFactory.build(traces, layout)
@@ -1,9 +1,13 @@
+import io
 import sys
+import base64
 import warnings
 import subprocess
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from PIL import Image
+from matplotlib import colormaps
 from flask import make_response
 from dash import Input, Output, State, ClientsideFunction
 from .globe_methods import GlobeMethods
@@ -13,7 +17,11 @@ from ..dash_app import (
    CESIUM_INTERNAL, 
    CESIUM_VIEWER, 
    GLOBE_GRAPH, 
-   CESIUM_CAMERA)
+   CESIUM_CAMERA,
+   CESIUM_MESSAGE_PATH,
+   CESIUM_PLATFORMS,
+   CESIUM_CLUSTERS,
+   CESIUM_ACTIVITY)
 
 
 class CesiumJSGlobe:
@@ -96,6 +104,73 @@ class CesiumJSGlobe:
             return {"x": camera_zoom, "y": 0, "z": 0}
  
 
+   @staticmethod
+   def get_message_path(links):
+
+      return {"segments": GlobeMethods.get_link_segments(links)}
+
+
+   @staticmethod
+   def get_platforms(platforms, trails=None):
+
+      return {
+         "names": platforms["Platform"].tolist(),
+         "positions": platforms[["X", "Y", "Z"]].to_numpy().ravel().tolist(),
+         "active": platforms["Active"].tolist(),
+         "trail_points": trails.shape[1] if trails is not None else 0,
+         "trails": trails.ravel().tolist() if trails is not None else []
+      }
+
+
+   @staticmethod
+   def get_clusters(clusters, bundles):
+
+      bundle_lines = []
+      for bundle in bundles.itertuples():
+         start = np.array([bundle.From_X, bundle.From_Y, bundle.From_Z])
+         end = np.array([bundle.To_X, bundle.To_Y, bundle.To_Z])
+         if GlobeMethods.los_hits_horizon(start, end):
+            x, y, z = GlobeMethods.get_curve_points_on_sphere(start, end, 10)
+         else:
+            x, y, z = GlobeMethods.get_points_on_line_segment(start, end, 1)
+
+         bundle_lines.append({
+            "x": x, "y": y, "z": z,
+            "links": int(bundle.Links),
+            "events": int(bundle.Events),
+            "success_rate": float(bundle.Success_Rate)
+         })
+
+      return {
+         "positions": clusters[["X", "Y", "Z"]].to_numpy(dtype=np.float64).ravel().tolist(),
+         "counts": clusters["Count"].astype(int).tolist(),
+         "bundles": bundle_lines
+      }
+
+
+   @staticmethod
+   def get_activity_image(grid, counts, width=512, height=256):
+      """
+      Equal-area ``counts`` resampled to an equirectangular RGBA image and
+      encoded as a PNG data URL for a single-tile imagery layer.
+      """
+
+      latitude = 90 - (np.arange(height) + 0.5) * 180 / height
+      longitude = -180 + (np.arange(width) + 0.5) * 360 / width
+      grid_rows = grid.rows_at(latitude)
+      grid_cols = grid.cols_at(longitude)
+
+      cells = counts[grid_rows[:, None], grid_cols[None, :]]
+      heat = np.log1p(cells) / max(np.log1p(counts.max()), 1.0)
+      rgba = colormaps["YlOrRd"](heat)
+      rgba[..., 3] = np.where(cells > 0, 0.35 + 0.5 * heat, 0)
+
+      buffer = io.BytesIO()
+      Image.fromarray(np.rint(rgba * 255).astype(np.uint8), mode="RGBA").save(buffer, format="PNG")
+
+      return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
    def _add_cesium_feature(self, app):
 
       app.config.external_scripts.extend(self._offline_external_scripts)
@@ -139,6 +214,42 @@ class CesiumJSGlobe:
          Input(CESIUM_VIEWER, 'data')
       )
 
+      app.clientside_callback(
+         ClientsideFunction(
+            namespace='Cesium',
+            function_name='message_path'
+         ),
+         Input(CESIUM_MESSAGE_PATH, 'data'),
+         Input(CESIUM_VIEWER, 'data')
+      )
+
+      app.clientside_callback(
+         ClientsideFunction(
+            namespace='Cesium',
+            function_name='platforms'
+         ),
+         Input(CESIUM_PLATFORMS, 'data'),
+         Input(CESIUM_VIEWER, 'data')
+      )
+
+      app.clientside_callback(
+         ClientsideFunction(
+            namespace='Cesium',
+            function_name='clusters'
+         ),
+         Input(CESIUM_CLUSTERS, 'data'),
+         Input(CESIUM_VIEWER, 'data')
+      )
+
+      app.clientside_callback(
+         ClientsideFunction(
+            namespace='Cesium',
+            function_name='activity'
+         ),
+         Input(CESIUM_ACTIVITY, 'data'),
+         Input(CESIUM_VIEWER, 'data')
+      )
+
       @app.server.route("/world")
       def get_world_image():
 
@@ -0,0 +1,88 @@
+import base64
+from inspector_packages import *
+
+
+class FigureFactory:
+   """
+   Assembles figures as plain dictionaries that Dash can serialize directly.
+
+   Plotly's graph objects validate every property of every trace on
+   construction. The figures built here go straight back to the browser, so
+   validation only runs when ``validate`` is switched on for debugging.
+
+   Numeric trace data can also be emitted as Plotly's binary typed arrays,
+   which skips decimal text encoding and shrinks the response.
+   """
+
+   validate = False
+   binary_arrays = True
+
+   TYPED_ARRAY_CODES = {
+      "int8": "i1", "uint8": "u1",
+      "int16": "i2", "uint16": "u2",
+      "int32": "i4", "uint32": "u4",
+      "float32": "f4", "float64": "f8"
+   }
+
+   @staticmethod
+   def build(data, layout):
+
+      if FigureFactory.validate:
+         return go.Figure({"data": data, "layout": layout})
+
+      return {"data": data, "layout": layout}
+
+
+   @staticmethod
+   def typed_array(values, dtype=np.float32):
+
+      values = np.ascontiguousarray(values, dtype=dtype)
+
+      if not FigureFactory.binary_arrays or values.size == 0:
+         return values
+
+      typed_array = {
+         "dtype": FigureFactory.TYPED_ARRAY_CODES[values.dtype.name],
+         "bdata": base64.b64encode(values).decode("ascii")
+      }
+
+      if values.ndim > 1:
+         typed_array["shape"] = ", ".join(str(size) for size in values.shape)
+
+      return typed_array
+
+
+   @staticmethod
+   def subplot_grid(rows, cols, titles):
+
+      horizontal_spacing = 0.2 / cols
+      vertical_spacing = 0.3 / rows
+      width = (1 - horizontal_spacing * (cols - 1)) / cols
+      height = (1 - vertical_spacing * (rows - 1)) / rows
+
+      layout = {"annotations": []}
+      for idx in range(rows * cols):
+         row, col = divmod(idx, cols)
+         axis = idx + 1 if idx != 0 else ''
+         x_domain = [col * (width + horizontal_spacing), col * (width + horizontal_spacing) + width]
+         y_domain = [1 - row * (height + vertical_spacing) - height, 1 - row * (height + vertical_spacing)]
+
+         layout[f"xaxis{axis}"] = {"domain": x_domain, "anchor": f"y{axis}"}
+         layout[f"yaxis{axis}"] = {"domain": y_domain, "anchor": f"x{axis}"}
+
+         if idx < len(titles):
+            layout["annotations"].append(
+               {
+                  "text": titles[idx],
+                  "x": sum(x_domain) / 2,
+                  "y": y_domain[1],
+                  "xref": "paper",
+                  "yref": "paper",
+                  "xanchor": "center",
+                  "yanchor": "bottom",
+                  "showarrow": False,
+                  "font": {"size": 16}
+               }
+            )
+
+      return layout
@@ -1,6 +1,8 @@
 import sys
 import numpy as np
+from inspector_packages import NO_FAILURE
 from .globe_methods import GlobeMethods
+from .figure_factory import FigureFactory
 
 
 class GlobeComms:
@@ -26,22 +28,26 @@ class GlobeComms:
       ]
 
 
-   def update_external_events(self, external_df, current_time):
+   def update_external_events(self, external_groups, current_time, success_rates=None):
 
+      success_rates = success_rates or {}
       transmissions, transmission_directions = [], []
-      for transmission, group in external_df.groupby(["Sender_Name", "SenderPart_Name", "Receiver_Name", "ReceiverPart_Name"]):
+      for transmission, group in external_groups:
 
-         transmission_info, success = self._transmission_info_text(current_time, transmission, group)
+         success_rate = success_rates.get(transmission)
+         transmission_info, success = self._transmission_info_text(current_time, transmission, group, success_rate)
          line_data = self._create_transmission_line(group)
-         marker_colors = self._marker_color(len(line_data["x"])-2, success)
+         rgb = self._transmission_result[success]["rgb"] if success_rate is None else self.success_rate_rgb(success_rate)
+         line_color = f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
+         marker_colors = self._marker_color(len(line_data["x"])-2, rgb)
 
          transmissions.append(
             {
                "type": "scatter3d",
                "name": "external",
-               "x": line_data["x"],
-               "y": line_data["y"],
-               "z": line_data["z"],
+               "x": FigureFactory.typed_array(line_data["x"]),
+               "y": FigureFactory.typed_array(line_data["y"]),
+               "z": FigureFactory.typed_array(line_data["z"]),
                "mode": "lines+markers",
                "customdata": [transmission_info] * len(line_data["x"]),
                "hovertemplate":'%{customdata}',
@@ -53,7 +59,7 @@ class GlobeComms:
                "line": 
                {
                   "width": 1,
-                  "color": self._transmission_result[success]["color_name"]
+                  "color": line_color
                },
                "opacity": 1,
                "showlegend": False
@@ -65,17 +71,17 @@ class GlobeComms:
                {
                   "type": "cone",
                   "name": "transmission_direction",
-                  "x": line_data["arrows"]["arrow_x"],
-                  "y": line_data["arrows"]["arrow_y"],
-                  "z": line_data["arrows"]["arrow_z"],
-                  "u": line_data["arrows"]["u"],
-                  "v": line_data["arrows"]["v"],
-                  "w": line_data["arrows"]["w"],
+                  "x": FigureFactory.typed_array(line_data["arrows"]["arrow_x"]),
+                  "y": FigureFactory.typed_array(line_data["arrows"]["arrow_y"]),
+                  "z": FigureFactory.typed_array(line_data["arrows"]["arrow_z"]),
+                  "u": FigureFactory.typed_array(line_data["arrows"]["u"]),
+                  "v": FigureFactory.typed_array(line_data["arrows"]["v"]),
+                  "w": FigureFactory.typed_array(line_data["arrows"]["w"]),
                   "sizemode": "scaled",
                   "sizeref": line_data["arrows"]["scaling"],
                   "colorscale": [
-                     [0, self._transmission_result[success]["color_name"]],
-                     [1, self._transmission_result[success]["color_name"]],
+                     [0, line_color],
+                     [1, line_color],
                   ],
                   "showscale": False,
                   "customdata": [transmission_info] * len(line_data["arrows"]["arrow_x"]),
@@ -86,47 +92,26 @@ class GlobeComms:
       return transmissions, transmission_directions
 
 
-   def update_internal_events(self, internal_df, current_time):
+   def update_internal_events(self, internal_groups, current_time):
 
       x, y, z = [], [], []
       internal_events = []
       internal_colors = []
-      for sender, group in internal_df.groupby("Sender_Name"):
+      for sender, group in internal_groups:
          x.append(group["SenderLocation_X"].values[0])
          y.append(group["SenderLocation_Y"].values[0])
          z.append(group["SenderLocation_Z"].values[0])
 
-         event_info = '' 
-         event_info = f'Time (H:M:S): {current_time}<br>'
-         event_info += f'Platform: {sender}<br>'
-         event_num = 0
-         for _, row in group.iterrows():
-            event_num += 1
-            event_info += f'\
-{event_num}. Event Type: {row["Event_Type"]}<br> \
-   Platform Parts: {row["SenderPart_Name"]} >> {row["ReceiverPart_Name"]}<br> \
-   Message Type: {row["Message_Type"]}<br> \
-   Message Number: {row["Message_SerialNumber"]}<br> \
-   Message Originator: {row["Message_Originator"]}<br>'
-         event_info += '<extra></extra>' 
+         event_info, event_color = self._internal_event_info(sender, group, current_time)
          internal_events.append(event_info)
-
-         if not group[group["Event_Type"] == "MESSAGE_OUTGOING"].empty and \
-            not group[group["Event_Type"] == "MESSAGE_INCOMING"].empty:
-            internal_colors.append('goldenrod')
-         elif not group[group["Event_Type"] == "MESSAGE_OUTGOING"].empty:
-            internal_colors.append('cornflowerblue')
-         elif not group[group["Event_Type"] == "MESSAGE_INCOMING"].empty:
-            internal_colors.append('mediumspringgreen')
-         else:
-            internal_colors.append('salmon')
+         internal_colors.append(event_color)
 
       updated_plot = {
          "type": "scatter3d",
          "name": "internal",
-         "x": x,
-         "y": y,
-         "z": z,
+         "x": FigureFactory.typed_array(x),
+         "y": FigureFactory.typed_array(y),
+         "z": FigureFactory.typed_array(z),
          "mode": "markers",
          "customdata": internal_events,
          "hovertemplate":'%{customdata}',
@@ -142,7 +127,227 @@ class GlobeComms:
       return updated_plot
 
 
-   def _transmission_info_text(self, current_time, transmission, group):
+   def update_message_path(self, links, message_info):
+
+      path_plots = []
+      segments = GlobeMethods.get_link_segments(links)
+      for result in self._transmission_result:
+         x, y, z = [], [], []
+         for segment in segments:
+            if segment["result"] == result:
+               x.extend(segment["x"] + [np.nan])
+               y.extend(segment["y"] + [np.nan])
+               z.extend(segment["z"] + [np.nan])
+
+         if len(x) == 0:
+            continue
+
+         path_plots.append(
+            {
+               "type": "scatter3d",
+               "name": "message_path",
+               "x": FigureFactory.typed_array(x),
+               "y": FigureFactory.typed_array(y),
+               "z": FigureFactory.typed_array(z),
+               "mode": "lines",
+               "hovertemplate": message_info + '<extra></extra>',
+               "line":
+               {
+                  "width": 6,
+                  "color": self._transmission_result[result]["color_name"]
+               },
+               "opacity": 1,
+               "showlegend": False
+            }
+         )
+
+      hops = links.drop_duplicates("Sender_Name")
+      path_plots.append(
+         {
+            "type": "scatter3d",
+            "name": "message_hops",
+            "x": FigureFactory.typed_array(hops["SenderLocation_X"].to_numpy()),
+            "y": FigureFactory.typed_array(hops["SenderLocation_Y"].to_numpy()),
+            "z": FigureFactory.typed_array(hops["SenderLocation_Z"].to_numpy()),
+            "mode": "markers",
+            "text": hops["Sender_Name"].astype(str).tolist(),
+            "hovertemplate": '%{text}<extra></extra>',
+            "marker": {"size": 7, "color": "gold"},
+            "showlegend": False
+         }
+      )
+
+      return path_plots
+
+
+   def update_platforms(self, platforms, trails=None):
+
+      platform_plots = []
+      if trails is not None:
+         separators = np.full((trails.shape[0], 1, 3), np.nan)
+         points = np.concatenate([trails, separators], axis=1).reshape(-1, 3)
+         platform_plots.append(
+            {
+               "type": "scatter3d",
+               "name": "platform_trails",
+               "x": FigureFactory.typed_array(points[:, 0]),
+               "y": FigureFactory.typed_array(points[:, 1]),
+               "z": FigureFactory.typed_array(points[:, 2]),
+               "mode": "lines",
+               "hoverinfo": "skip",
+               "line": {"width": 2, "color": "rgba(218, 165, 32, 0.6)"},
+               "showlegend": False
+            }
+         )
+
+      platform_plots.append(
+         {
+            "type": "scatter3d",
+            "name": "platforms",
+            "x": FigureFactory.typed_array(platforms["X"].to_numpy()),
+            "y": FigureFactory.typed_array(platforms["Y"].to_numpy()),
+            "z": FigureFactory.typed_array(platforms["Z"].to_numpy()),
+            "mode": "markers",
+            "customdata": self._platform_info(platforms),
+            "hovertemplate": '%{customdata}',
+            "marker":
+            {
+               "size": 3,
+               "color": np.where(platforms["Active"].to_numpy(), "goldenrod", "lightgray").tolist()
+            },
+            "showlegend": False
+         }
+      )
+
+      return platform_plots
+
+
+   def update_clusters(self, clusters, bundles, current_time):
+
+      cluster_plots = []
+      if not bundles.empty:
+         x, y, z, rates, bundle_info = [], [], [], [], []
+         for bundle in bundles.itertuples():
+            start = np.array([bundle.From_X, bundle.From_Y, bundle.From_Z])
+            end = np.array([bundle.To_X, bundle.To_Y, bundle.To_Z])
+            if GlobeMethods.los_hits_horizon(start, end):
+               line_x, line_y, line_z = GlobeMethods.get_curve_points_on_sphere(start, end, 10)
+            else:
+               line_x, line_y, line_z = GlobeMethods.get_points_on_line_segment(start, end, 1)
+
+            info = f'Time (H:M:S): {current_time}<br>' \
+               f'Links: {bundle.Links:,}<br>' \
+               f'Events: {bundle.Events:,}<br>' \
+               f'Success Ratio: {bundle.Success_Rate:.0%}<extra></extra>'
+
+            x.extend(line_x + [np.nan])
+            y.extend(line_y + [np.nan])
+            z.extend(line_z + [np.nan])
+            rates.extend([bundle.Success_Rate] * (len(line_x) + 1))
+            bundle_info.extend([info] * (len(line_x) + 1))
+
+         fail = self._transmission_result["Fail"]["rgb"]
+         success = self._transmission_result["Success"]["rgb"]
+         cluster_plots.append(
+            {
+               "type": "scatter3d",
+               "name": "link_bundles",
+               "x": FigureFactory.typed_array(x),
+               "y": FigureFactory.typed_array(y),
+               "z": FigureFactory.typed_array(z),
+               "mode": "lines",
+               "customdata": bundle_info,
+               "hovertemplate": '%{customdata}',
+               "line":
+               {
+                  "width": 3,
+                  "color": FigureFactory.typed_array(rates),
+                  "cmin": 0,
+                  "cmax": 1,
+                  "colorscale": [
+                     [0, f"rgb({fail[0]}, {fail[1]}, {fail[2]})"],
+                     [1, f"rgb({success[0]}, {success[1]}, {success[2]})"]
+                  ]
+               },
+               "showlegend": False
+            }
+         )
+
+      if not clusters.empty:
+         counts = clusters["Count"].to_numpy()
+         cluster_plots.append(
+            {
+               "type": "scatter3d",
+               "name": "platform_clusters",
+               "x": FigureFactory.typed_array(clusters["X"].to_numpy()),
+               "y": FigureFactory.typed_array(clusters["Y"].to_numpy()),
+               "z": FigureFactory.typed_array(clusters["Z"].to_numpy()),
+               "mode": "markers+text",
+               "text": [f"{count}" if count > 1 else "" for count in counts],
+               "textposition": "top center",
+               "customdata": [
+                  f'{row.Count} Platform(s)<br>{row.Platforms}<extra></extra>'
+                  for row in clusters.itertuples()],
+               "hovertemplate": '%{customdata}',
+               "marker":
+               {
+                  "size": FigureFactory.typed_array(3 + 2 * np.log2(counts)),
+                  "color": "goldenrod"
+               },
+               "showlegend": False
+            }
+         )
+
+      return cluster_plots
+
+
+   def success_rate_rgb(self, success_rate):
+
+      fail = np.array(self._transmission_result["Fail"]["rgb"])
+      success = np.array(self._transmission_result["Success"]["rgb"])
+
+      return np.rint(fail + success_rate * (success - fail)).astype(int).tolist()
+
+
+   def _internal_event_info(self, sender, group, current_time):
+
+      event_info = f'Time (H:M:S): {current_time}<br>'
+      event_info += f'Platform: {sender}<br>'
+      event_num = 0
+      for _, row in group.iterrows():
+         event_num += 1
+         event_info += f'\
+{event_num}. Event Type: {row["Event_Type"]}<br> \
+   Platform Parts: {row["SenderPart_Name"]} >> {row["ReceiverPart_Name"]}<br> \
+   Message Type: {row["Message_Type"]}<br> \
+   Message Number: {row["Message_SerialNumber"]}<br> \
+   Message Originator: {row["Message_Originator"]}<br>'
+      event_info += '<extra></extra>' 
+
+      if not group[group["Event_Type"] == "MESSAGE_OUTGOING"].empty and \
+         not group[group["Event_Type"] == "MESSAGE_INCOMING"].empty:
+         event_color = 'goldenrod'
+      elif not group[group["Event_Type"] == "MESSAGE_OUTGOING"].empty:
+         event_color = 'cornflowerblue'
+      elif not group[group["Event_Type"] == "MESSAGE_INCOMING"].empty:
+         event_color = 'mediumspringgreen'
+      else:
+         event_color = 'salmon'
+
+      return event_info, event_color
+
+
+   def _platform_info(self, platforms):
+
+      return [
+         f'Platform: {row.Platform}<br>'
+         f'Latitude: {row.Latitude:.4f}<br>'
+         f'Longitude: {row.Longitude:.4f}<br>'
+         f'Altitude (m): {row.Altitude:,.0f}<extra></extra>'
+         for row in platforms.itertuples()]
+
+
+   def _transmission_info_text(self, current_time, transmission, group, success_rate=None):
 
       sender, sender_part, receiver, receiver_part = transmission
 
@@ -159,9 +364,11 @@ class GlobeComms:
    Message Type: {row["Message_Type"]}<br> \
    Message Number: {row["Message_SerialNumber"]}<br> \
    Message Originator: {row["Message_Originator"]}<br>'
-         if row["CommInteraction_FailedStatus"] != "Does Not Exist":
+         if row["CommInteraction_FailedStatus"] != NO_FAILURE:
             transmission_result = "Fail"
             transmission_info += f'    Failure Reason: {row["CommInteraction_FailedStatus"]}<br>'
+      if success_rate is not None:
+         transmission_info += f'<b>Rolling Success Rate: {success_rate:.0%}</b><br>'
       transmission_info += '<extra></extra>' 
 
       return transmission_info, transmission_result
@@ -233,9 +440,8 @@ class GlobeComms:
       return line_data
 
 
-   def _marker_color(self, num_markers, success):
+   def _marker_color(self, num_markers, rgb):
 
-      rgb = self._transmission_result[success]["rgb"]
       marker_color = f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}"
       marker_visibility = [f"{marker_color}, 1)"] + [f"{marker_color}, 0)"] * num_markers + [f"{marker_color}, 1)"]
 
@@ -1,4 +1,5 @@
 import numpy as np
+from inspector_packages import NO_FAILURE
 
 class GlobeMethods:
 
@@ -19,25 +20,47 @@ class GlobeMethods:
           A list of tuples, where each tuple is (x, y, z) coordinates of a point on the curve.
       """
 
-      # Calculate the angle between the two points
-      vector_dot = np.dot(point1, point2)
-      vector_magnitudes_mult = np.linalg.norm(point1) * np.linalg.norm(point2)
-      angle = np.arccos(vector_dot / vector_magnitudes_mult)
+      points = GlobeMethods.slerp(point1, point2, np.linspace(0, 1, num_points + 1))
 
-      # Generate points along the great-circle curve
-      x, y, z = [], [], []
-      for i in range(num_points+1):
-          t = i / num_points
-          new_angle = angle * t
-          sin_angle = np.sin(new_angle)
-          sin_remaining_angle = np.sin(angle - new_angle)
-          
-          new_point = (sin_remaining_angle * point1 + sin_angle * point2) / np.sin(angle)
-          x.append(new_point[0])
-          y.append(new_point[1])
-          z.append(new_point[2])
+      return points[:, 0].tolist(), points[:, 1].tolist(), points[:, 2].tolist()
 
-      return x, y, z
+
+   @staticmethod
+   def slerp(start, end, fraction):
+      """
+      Points ``fraction`` of the way from ``start`` to ``end`` along the
+      great circle between them, with the radius interpolated linearly.
+      Points are arrays ending in 3 and broadcast against ``fraction``.
+      Coincident directions and points at the centre fall back to linear
+      interpolation.
+      """
+
+      start = np.asarray(start, dtype=np.float64)
+      end = np.asarray(end, dtype=np.float64)
+      fraction = np.asarray(fraction, dtype=np.float64)
+      shape = np.broadcast_shapes(start.shape[:-1], end.shape[:-1], fraction.shape)
+      start = np.broadcast_to(start, shape + (3,))
+      end = np.broadcast_to(end, shape + (3,))
+      fraction = np.broadcast_to(fraction, shape)
+
+      start_radius = np.linalg.norm(start, axis=-1)
+      end_radius = np.linalg.norm(end, axis=-1)
+      radius = start_radius + fraction * (end_radius - start_radius)
+
+      with np.errstate(divide="ignore", invalid="ignore"):
+         start_unit = start / start_radius[..., None]
+         end_unit = end / end_radius[..., None]
+         angle = np.arccos(np.clip((start_unit * end_unit).sum(axis=-1), -1.0, 1.0))
+         sine = np.sin(angle)
+         curved = sine > 1e-9
+         start_weight = np.where(curved, np.sin((1 - fraction) * angle) / sine, 1 - fraction)
+         end_weight = np.where(curved, np.sin(fraction * angle) / sine, fraction)
+         direction = start_weight[..., None] * start_unit + end_weight[..., None] * end_unit
+         points = direction / np.linalg.norm(direction, axis=-1, keepdims=True) * radius[..., None]
+
+      at_centre = ((start_radius == 0) | (end_radius == 0))[..., None]
+
+      return np.where(at_centre, start + fraction[..., None] * (end - start), points)
 
 
    @staticmethod
@@ -64,4 +87,23 @@ class GlobeMethods:
          closest_point = sender_location + t * diff
          return np.linalg.norm(closest_point) <= GlobeMethods.EQUATOR_RADIUS
       else:
-         return False
\ No newline at end of file
+         return False
+
+   @staticmethod
+   def get_link_segments(links, num_points=20):
+
+      sender_locations = links[["SenderLocation_X", "SenderLocation_Y", "SenderLocation_Z"]].to_numpy(dtype=np.float64)
+      receiver_locations = links[["ReceiverLocation_X", "ReceiverLocation_Y", "ReceiverLocation_Z"]].to_numpy(dtype=np.float64)
+      failed = links["CommInteraction_FailedStatus"].to_numpy().astype(str) != NO_FAILURE
+
+      segments = []
+      for sender_location, receiver_location, fail in zip(sender_locations, receiver_locations, failed):
+         if np.allclose(sender_location, receiver_location):
+            continue
+         if GlobeMethods.los_hits_horizon(sender_location, receiver_location):
+            x, y, z = GlobeMethods.get_curve_points_on_sphere(sender_location, receiver_location, num_points)
+         else:
+            x, y, z = GlobeMethods.get_points_on_line_segment(sender_location, receiver_location, 1)
+         segments.append({"result": "Fail" if fail else "Success", "x": x, "y": y, "z": z})
+
+      return segments
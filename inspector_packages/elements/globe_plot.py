@@ -3,30 +3,25 @@ from pathlib import Path
 import pandas as pd
 from inspector_packages import *
 from .globe_methods import GlobeMethods
+from .figure_factory import FigureFactory
 
 
 class GlobePlot:
 
    def __init__(self, df, land_color, ocean_color, resolution):
 
-      self._camera_view = {"x": 3, "y": 0, "z": 0}
-
       self._current_file = Path(__file__) 
 
       self._set_earth_surface(land_color, ocean_color, resolution)
       self._set_axes_attributes(df)
 
 
-   def build_earth_figure(self, traces):
+   def build_earth_figure(self, traces, camera_view=None):
 
-      fig = go.Figure(
-         {
-            "data": [self._earth_surface] + traces,
-            "layout": self._globe_layout()
-         }
-      )
+      if camera_view is None:
+         camera_view = {"x": 3, "y": 0, "z": 0}
 
-      return fig
+      return FigureFactory.build([self._earth_surface] + traces, self._globe_layout(camera_view))
 
 
    def set_camera_view(self, internal_df, external_df):
@@ -49,9 +44,44 @@ class GlobePlot:
             camera_vector = camera_location / np.linalg.norm(camera_location)
             camera_zoom = 2 * points_df.apply(lambda x: np.linalg.norm(x), axis=1).max() / self._axes_range[1]
             camera_center = camera_zoom * camera_vector
-            self._camera_view = {"x": camera_center[0], "y": camera_center[1], "z": camera_center[2]}
+            camera_view = {"x": camera_center[0], "y": camera_center[1], "z": camera_center[2]}
          except RuntimeWarning as e:
-            self._camera_view = {"x": camera_zoom, "y": 0, "z": 0}
+            camera_view = {"x": camera_zoom, "y": 0, "z": 0}
+
+      return camera_view
+
+
+   def camera_eye(self, camera_view):
+
+      return np.array([camera_view["x"], camera_view["y"], camera_view["z"]]) * self._axes_range[1]
+
+
+   def activity_overlay(self, grid, counts, layer):
+
+      # Cell centres, closed off at the poles and wrapped around the antimeridian
+      latitude = np.radians(np.r_[-90, grid.row_centres(), 90])
+      longitude = np.radians(np.r_[grid.col_centres(), grid.col_centres()[0] + 360])
+
+      cells = np.vstack([counts[:1], counts, counts[-1:]])
+      cells = np.hstack([cells, cells[:, :1]])
+      heat = np.log1p(cells) / max(np.log1p(cells.max()), 1.0)
+
+      scale = 1.004
+      return {
+         "type": "surface",
+         "name": f"{layer} Heatmap",
+         "x": FigureFactory.typed_array(scale * GlobeMethods.EQUATOR_RADIUS * np.outer(np.cos(latitude), np.cos(longitude))),
+         "y": FigureFactory.typed_array(scale * GlobeMethods.EQUATOR_RADIUS * np.outer(np.cos(latitude), np.sin(longitude))),
+         "z": FigureFactory.typed_array(scale * GlobeMethods.POLAR_RADIUS * np.outer(np.sin(latitude), np.ones(longitude.shape[0]))),
+         "surfacecolor": FigureFactory.typed_array(heat),
+         "customdata": cells.tolist(),
+         "hovertemplate": f"{layer}: " + "%{customdata:,}<extra></extra>",
+         "colorscale": "YlOrRd",
+         "cmin": 0,
+         "cmax": 1,
+         "opacityscale": [[0, 0], [0.01, 0], [0.02, 0.35], [1, 0.85]],
+         "showscale": False
+      }
 
 
    def _load_earth_data(self, land_color=None, ocean_color=None, resolution=None):
@@ -86,10 +116,10 @@ class GlobePlot:
       self._earth_surface = {
          "type": "surface",
          "name": "Earth Surface",
-         "x": self._earth_x,
-         "y": self._earth_y,
-         "z": self._earth_z,
-         "surfacecolor": self._earth_image,
+         "x": FigureFactory.typed_array(self._earth_x),
+         "y": FigureFactory.typed_array(self._earth_y),
+         "z": FigureFactory.typed_array(self._earth_z),
+         "surfacecolor": FigureFactory.typed_array(self._earth_image),
          "colorscale": self._earth_colorscale,
          "hoverinfo": "none",
          "showscale": False,
@@ -125,7 +155,7 @@ class GlobePlot:
       }
 
 
-   def _globe_layout(self):
+   def _globe_layout(self, camera_view):
 
       globe_layout = {
          "scene":
@@ -135,7 +165,7 @@ class GlobePlot:
             "zaxis": self._axes_attributes,
             "aspectmode": "cube",
             "camera": {
-               "eye": self._camera_view
+               "eye": camera_view
             }
          }
       }
@@ -0,0 +1,83 @@
+import plotly.colors
+from inspector_packages import *
+from .figure_factory import FigureFactory
+
+
+class LinkMetricsPlot:
+
+   COLORWAY = plotly.colors.qualitative.Plotly
+
+   @staticmethod
+   def metrics_figure(series, window, reasons, current_time=None):
+
+      layout = FigureFactory.subplot_grid(
+         rows=2,
+         cols=2,
+         titles=["Success Rate", "Throughput (bytes/s)", "Mean Queue Size", f"Failures per {window:g} s"])
+
+      times = FigureFactory.typed_array(series.index.to_numpy() * 1000, np.float64)
+      panels = [("Success_Rate", ""), ("Throughput", "2"), ("Queue_Size", "3")]
+
+      traces = []
+      for column, axis in panels:
+         traces.append(
+            {
+               "type": "scatter",
+               "mode": "lines",
+               "name": column,
+               "x": times,
+               "y": FigureFactory.typed_array(series[column].to_numpy(), np.float64),
+               "line": {"color": "steelblue"},
+               "connectgaps": False,
+               "hovertemplate": "%{y}<extra></extra>",
+               "showlegend": False,
+               "xaxis": f"x{axis}",
+               "yaxis": f"y{axis}"
+            }
+         )
+
+      for idx, reason in enumerate(reasons):
+         traces.append(
+            {
+               "type": "scatter",
+               "mode": "lines",
+               "name": reason,
+               "x": times,
+               "y": FigureFactory.typed_array(series[reason].to_numpy(), np.int32),
+               "stackgroup": "failures",
+               "line": {"color": LinkMetricsPlot.COLORWAY[idx % len(LinkMetricsPlot.COLORWAY)], "width": 0},
+               "hovertemplate": f"{reason}: " + "%{y}<extra></extra>",
+               "xaxis": "x4",
+               "yaxis": "y4"
+            }
+         )
+
+      for axis in ["", "2", "3", "4"]:
+         layout[f"xaxis{axis}"]["type"] = "date"
+         if axis:
+            layout[f"xaxis{axis}"]["matches"] = "x"
+      layout["yaxis"]["range"] = [0, 1.05]
+      layout["yaxis"]["tickformat"] = ".0%"
+
+      if current_time is not None:
+         layout["shapes"] = [
+            {
+               "type": "line",
+               "xref": f"x{axis}",
+               "yref": f"y{axis} domain",
+               "x0": current_time * 1000,
+               "x1": current_time * 1000,
+               "y0": 0,
+               "y1": 1,
+               "line": {"color": "darkred", "width": 1, "dash": "dot"}
+            }
+            for axis in ["", "2", "3", "4"]
+         ]
+
+      layout.update(
+         paper_bgcolor='rgba(0,0,0,0)',
+         plot_bgcolor='rgba(0,0,0,0)',
+         uirevision="link-metrics",
+         legend={"orientation": "h", "y": -0.1})
+
+      return FigureFactory.build(traces, layout)
@@ -0,0 +1,314 @@
+import numpy as np
+from inspector_packages import NO_FAILURE
+from .globe_comms import GlobeComms
+from .globe_methods import GlobeMethods
+from .figure_factory import FigureFactory
+
+
+class MapComms(GlobeComms):
+   """
+   Communication traces for the flat map, drawn from the latitude and
+   longitude columns.
+
+   Every kind of item is batched into a handful of WebGL scatter traces
+   rather than one trace per link. Links follow great circles sampled in
+   3D and are broken where they cross the antimeridian, so no segment is
+   drawn across the whole map. Link lines are grouped into one trace per
+   tenth of success rate, and a marker at each link's midpoint points from
+   sender to receiver and carries its hover text.
+   """
+
+   SAMPLES = 25
+   RATE_STEPS = 10
+   ENDPOINTS = ["Sender_Latitude", "Sender_Longitude", "Receiver_Latitude", "Receiver_Longitude"]
+
+   def update_external_events(self, external_groups, current_time, success_rates=None):
+
+      if len(external_groups) == 0:
+         return [], []
+
+      success_rates = success_rates or {}
+      endpoints, rates, transmission_info = [], [], []
+      for transmission, group in external_groups:
+
+         success_rate = success_rates.get(transmission)
+         info, success = self._transmission_info_text(current_time, transmission, group, success_rate)
+         endpoints.append(group[self.ENDPOINTS].to_numpy(dtype=np.float64)[0])
+         rates.append(success_rate if success_rate is not None else float(success == "Success"))
+         transmission_info.append(info)
+
+      endpoints = np.array(endpoints)
+      lat, lon = self.great_circles(*endpoints.T)
+
+      return (
+         self._rate_lines(lat, lon, rates, "external", 1.5),
+         [self._link_markers(lat, lon, rates, transmission_info, "transmission_direction", "triangle-up")])
+
+
+   def update_internal_events(self, internal_groups, current_time):
+
+      lat, lon = [], []
+      internal_events = []
+      internal_colors = []
+      for sender, group in internal_groups:
+         lat.append(group["Sender_Latitude"].values[0])
+         lon.append(group["Sender_Longitude"].values[0])
+
+         event_info, event_color = self._internal_event_info(sender, group, current_time)
+         internal_events.append(event_info)
+         internal_colors.append(event_color)
+
+      return {
+         "type": "scattergl",
+         "name": "internal",
+         "x": FigureFactory.typed_array(lon),
+         "y": FigureFactory.typed_array(lat),
+         "mode": "markers",
+         "customdata": internal_events,
+         "hovertemplate": '%{customdata}',
+         "marker": {"size": 7, "color": internal_colors},
+         "showlegend": False
+      }
+
+
+   def update_message_path(self, links, message_info):
+
+      endpoints = links[self.ENDPOINTS].to_numpy(dtype=np.float64)
+      failed = links["CommInteraction_FailedStatus"].to_numpy().astype(str) != NO_FAILURE
+      moved = ~np.isclose(endpoints[:, :2], endpoints[:, 2:]).all(axis=1)
+
+      path_plots = []
+      for result, selected in [("Success", moved & ~failed), ("Fail", moved & failed)]:
+         if not selected.any():
+            continue
+
+         lon, lat = self.split_antimeridian(*self.great_circles(*endpoints[selected].T))
+         path_plots.append(
+            {
+               "type": "scattergl",
+               "name": "message_path",
+               "x": FigureFactory.typed_array(lon),
+               "y": FigureFactory.typed_array(lat),
+               "mode": "lines",
+               "hovertemplate": message_info + '<extra></extra>',
+               "line": {"width": 4, "color": self._transmission_result[result]["color_name"]},
+               "showlegend": False
+            }
+         )
+
+      hops = links.drop_duplicates("Sender_Name")
+      path_plots.append(
+         {
+            "type": "scattergl",
+            "name": "message_hops",
+            "x": FigureFactory.typed_array(hops["Sender_Longitude"].to_numpy()),
+            "y": FigureFactory.typed_array(hops["Sender_Latitude"].to_numpy()),
+            "mode": "markers",
+            "text": hops["Sender_Name"].astype(str).tolist(),
+            "hovertemplate": '%{text}<extra></extra>',
+            "marker": {"size": 9, "color": "gold"},
+            "showlegend": False
+         }
+      )
+
+      return path_plots
+
+
+   def update_platforms(self, platforms, trails=None):
+
+      platform_plots = []
+      if trails is not None and trails.shape[0] != 0:
+         lon, lat = self.split_antimeridian(*self.lat_lon(trails))
+         platform_plots.append(
+            {
+               "type": "scattergl",
+               "name": "platform_trails",
+               "x": FigureFactory.typed_array(lon),
+               "y": FigureFactory.typed_array(lat),
+               "mode": "lines",
+               "hoverinfo": "skip",
+               "line": {"width": 2, "color": "rgba(218, 165, 32, 0.6)"},
+               "showlegend": False
+            }
+         )
+
+      platform_plots.append(
+         {
+            "type": "scattergl",
+            "name": "platforms",
+            "x": FigureFactory.typed_array(platforms["Longitude"].to_numpy()),
+            "y": FigureFactory.typed_array(platforms["Latitude"].to_numpy()),
+            "mode": "markers",
+            "customdata": self._platform_info(platforms),
+            "hovertemplate": '%{customdata}',
+            "marker":
+            {
+               "size": 6,
+               "color": np.where(platforms["Active"].to_numpy(), "goldenrod", "lightgray").tolist()
+            },
+            "showlegend": False
+         }
+      )
+
+      return platform_plots
+
+
+   def update_clusters(self, clusters, bundles, current_time):
+
+      cluster_plots = []
+      if not bundles.empty:
+         start_lat, start_lon = self.lat_lon(bundles[["From_X", "From_Y", "From_Z"]].to_numpy(dtype=np.float64))
+         end_lat, end_lon = self.lat_lon(bundles[["To_X", "To_Y", "To_Z"]].to_numpy(dtype=np.float64))
+         lat, lon = self.great_circles(start_lat, start_lon, end_lat, end_lon)
+         rates = bundles["Success_Rate"].to_numpy(dtype=np.float64)
+         bundle_info = [
+            f'Time (H:M:S): {current_time}<br>'
+            f'Links: {bundle.Links:,}<br>'
+            f'Events: {bundle.Events:,}<br>'
+            f'Success Ratio: {bundle.Success_Rate:.0%}<extra></extra>'
+            for bundle in bundles.itertuples()]
+
+         cluster_plots.extend(self._rate_lines(lat, lon, rates, "link_bundles", 3))
+         cluster_plots.append(self._link_markers(lat, lon, rates, bundle_info, "link_bundle_info", "circle"))
+
+      if not clusters.empty:
+         lat, lon = self.lat_lon(clusters[["X", "Y", "Z"]].to_numpy(dtype=np.float64))
+         counts = clusters["Count"].to_numpy()
+         cluster_plots.append(
+            {
+               "type": "scattergl",
+               "name": "platform_clusters",
+               "x": FigureFactory.typed_array(lon),
+               "y": FigureFactory.typed_array(lat),
+               "mode": "markers+text",
+               "text": [f"{count}" if count > 1 else "" for count in counts],
+               "textposition": "top center",
+               "customdata": [
+                  f'{row.Count} Platform(s)<br>{row.Platforms}<extra></extra>'
+                  for row in clusters.itertuples()],
+               "hovertemplate": '%{customdata}',
+               "marker":
+               {
+                  "size": FigureFactory.typed_array(6 + 2 * np.log2(counts)),
+                  "color": "goldenrod"
+               },
+               "showlegend": False
+            }
+         )
+
+      return cluster_plots
+
+
+   @staticmethod
+   def lat_lon(points):
+      """
+      Geocentric latitude and longitude in degrees of ECEF ``points`` (any
+      shape ending in 3).
+      """
+
+      x, y, z = points[..., 0], points[..., 1], points[..., 2]
+
+      return np.degrees(np.arctan2(z, np.hypot(x, y))), np.degrees(np.arctan2(y, x))
+
+
+   @classmethod
+   def great_circles(cls, start_lat, start_lon, end_lat, end_lon):
+      """
+      Latitudes and longitudes of SAMPLES points along the great circle
+      between each pair of endpoints, shaped (links, SAMPLES).
+      """
+
+      start = cls._unit_vectors(start_lat, start_lon)[:, None, :]
+      end = cls._unit_vectors(end_lat, end_lon)[:, None, :]
+
+      return cls.lat_lon(GlobeMethods.slerp(start, end, np.linspace(0, 1, cls.SAMPLES)))
+
+
+   @staticmethod
+   def split_antimeridian(lat, lon):
+      """
+      Flattens paths shaped (paths, points) into longitude and latitude
+      arrays separated by NaN gaps. A step between two points that crosses
+      the antimeridian ends at the map's edge and resumes from the other
+      edge at the interpolated latitude.
+      """
+
+      num_paths = lat.shape[0]
+      step = np.diff(lon, axis=1)
+      crossing = np.abs(step) > 180
+      edge = np.where(lon[:, :-1] > 0, 180.0, -180.0)
+      unwrapped = lon[:, 1:] - np.sign(step) * 360
+      with np.errstate(divide="ignore", invalid="ignore"):
+         fraction = np.nan_to_num((edge - lon[:, :-1]) / (unwrapped - lon[:, :-1]))
+      edge_lat = lat[:, :-1] + fraction * np.diff(lat, axis=1)
+      gap = np.full(edge.shape, np.nan)
+
+      # Each step keeps its first point, then adds edge, gap, edge when it crosses
+      steps_lon = np.stack([lon[:, :-1], edge, gap, -edge], axis=-1).reshape(num_paths, -1)
+      steps_lat = np.stack([lat[:, :-1], edge_lat, gap, edge_lat], axis=-1).reshape(num_paths, -1)
+      keep = np.stack([np.ones(crossing.shape, dtype=bool), crossing, crossing, crossing], axis=-1).reshape(num_paths, -1)
+
+      ends = np.full((num_paths, 1), np.nan)
+      path_lon = np.hstack([steps_lon, lon[:, -1:], ends])
+      path_lat = np.hstack([steps_lat, lat[:, -1:], ends])
+      keep = np.hstack([keep, np.ones((num_paths, 2), dtype=bool)])
+
+      return path_lon[keep], path_lat[keep]
+
+
+   @staticmethod
+   def _unit_vectors(lat, lon):
+
+      lat, lon = np.radians(np.asarray(lat, dtype=np.float64)), np.radians(np.asarray(lon, dtype=np.float64))
+
+      return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+   def _rate_lines(self, lat, lon, rates, name, width):
+
+      line_plots = []
+      steps = np.rint(np.asarray(rates, dtype=np.float64) * self.RATE_STEPS).astype(np.int64)
+      for step in np.unique(steps):
+         path_lon, path_lat = self.split_antimeridian(lat[steps == step], lon[steps == step])
+         rgb = self.success_rate_rgb(step / self.RATE_STEPS)
+         line_plots.append(
+            {
+               "type": "scattergl",
+               "name": name,
+               "x": FigureFactory.typed_array(path_lon),
+               "y": FigureFactory.typed_array(path_lat),
+               "mode": "lines",
+               "hoverinfo": "skip",
+               "line": {"width": width, "color": f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"},
+               "showlegend": False
+            }
+         )
+
+      return line_plots
+
+
+   def _link_markers(self, lat, lon, rates, info, name, symbol):
+
+      # Heading of each path at its midpoint, clockwise from north on the map
+      middle = self.SAMPLES // 2
+      d_lon = (lon[:, middle + 1] - lon[:, middle - 1] + 180) % 360 - 180
+      d_lat = lat[:, middle + 1] - lat[:, middle - 1]
+      colors = [f"rgb({r}, {g}, {b})" for r, g, b in (self.success_rate_rgb(rate) for rate in rates)]
+
+      return {
+         "type": "scattergl",
+         "name": name,
+         "x": FigureFactory.typed_array(lon[:, middle]),
+         "y": FigureFactory.typed_array(lat[:, middle]),
+         "mode": "markers",
+         "customdata": info,
+         "hovertemplate": '%{customdata}',
+         "marker":
+         {
+            "symbol": symbol,
+            "size": 9,
+            "angle": FigureFactory.typed_array(np.degrees(np.arctan2(d_lon, d_lat))),
+            "color": colors
+         },
+         "showlegend": False
+      }
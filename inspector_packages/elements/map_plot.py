@@ -0,0 +1,112 @@
+import io
+import base64
+from PIL import Image, ImageColor
+from inspector_packages import *
+from .globe_plot import GlobePlot
+from .figure_factory import FigureFactory
+
+
+class MapPlot(GlobePlot):
+   """
+   Flat equirectangular counterpart of the Plotly globe.
+
+   The basemap is the same earth_data image, colored once into a PNG that
+   sits below the axes as a layout image, so nothing is fetched from a tile
+   server. It is sent with the page; each frame only replaces the data
+   traces. The layout keeps the analyst's pan and zoom between updates.
+   """
+
+   @staticmethod
+   def visible_span(relayout_data):
+      """
+      Degrees of longitude across the map after a pan or zoom, the whole
+      world after a reset, or None when the relayout did not move the axes.
+      """
+
+      relayout_data = relayout_data or {}
+      if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+         return min(abs(relayout_data["xaxis.range[1]"] - relayout_data["xaxis.range[0]"]), 360.0)
+      if "xaxis.range" in relayout_data:
+         return min(abs(relayout_data["xaxis.range"][1] - relayout_data["xaxis.range"][0]), 360.0)
+      if relayout_data.get("xaxis.autorange"):
+         return 360.0
+
+      return None
+
+
+   def activity_overlay(self, grid, counts, layer):
+
+      heat = np.log1p(counts) / max(np.log1p(counts.max()), 1.0)
+
+      return {
+         "type": "heatmap",
+         "name": f"{layer} Heatmap",
+         "x": FigureFactory.typed_array(grid.col_edges()),
+         "y": FigureFactory.typed_array(grid.row_edges()),
+         "z": FigureFactory.typed_array(np.where(counts > 0, heat, np.nan)),
+         "customdata": counts.tolist(),
+         "hovertemplate": f"{layer}: " + "%{customdata:,}<extra></extra>",
+         "colorscale": "YlOrRd",
+         "zmin": 0,
+         "zmax": 1,
+         "opacity": 0.7,
+         "showscale": False
+      }
+
+
+   def build_earth_figure(self, traces, camera_view=None):
+
+      return FigureFactory.build(traces, self._globe_layout(camera_view))
+
+
+   def _set_earth_surface(self, land_color, ocean_color, resolution):
+
+      self._load_earth_data(land_color, ocean_color, resolution)
+
+      # Image rows run west to east and its columns north to south
+      positions = [position for position, _ in self._earth_colorscale]
+      colors = np.array([ImageColor.getrgb(color)[:3] for _, color in self._earth_colorscale], dtype=np.float64)
+      values = self._earth_image.T
+      rgb = np.stack([np.interp(values, positions, colors[:, channel]) for channel in range(3)], axis=-1)
+
+      buffer = io.BytesIO()
+      Image.fromarray(np.rint(rgb).astype(np.uint8), mode="RGB").save(buffer, format="PNG")
+
+      self._earth_surface = {
+         "source": "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii"),
+         "xref": "x",
+         "yref": "y",
+         "x": -180,
+         "y": 90,
+         "sizex": 360,
+         "sizey": 180,
+         "sizing": "stretch",
+         "layer": "below"
+      }
+
+
+   def _set_axes_attributes(self, df):
+
+      self._axes_attributes = {
+         "showgrid": False,
+         "zeroline": False,
+         "ticksuffix": "°",
+         "constrain": "domain"
+      }
+
+
+   def _globe_layout(self, camera_view):
+
+      map_layout = {
+         "xaxis": {**self._axes_attributes, "range": [-180, 180]},
+         "yaxis": {**self._axes_attributes, "range": [-90, 90], "scaleanchor": "x"},
+         "margin": {"l": 40, "r": 10, "t": 10, "b": 30},
+         "dragmode": "pan",
+         "hovermode": "closest",
+         "images": [self._earth_surface],
+         "uirevision": "map",
+         "paper_bgcolor": 'rgba(0,0,0,0)',
+         "plot_bgcolor": 'rgba(0,0,0,0)'
+      }
+
+      return map_layout
@@ -0,0 +1,94 @@
+import pandas as pd
+from inspector_packages import *
+from .figure_factory import FigureFactory
+
+
+class MessagePlot:
+
+   OUTCOMES = {"Delivered": "mediumturquoise", "Dropped": "darkred", "In Flight": "goldenrod"}
+
+   @staticmethod
+   def summary_figure(summary, num_bins=40, top=15):
+
+      layout = FigureFactory.subplot_grid(
+         rows=2,
+         cols=2,
+         titles=["End-to-End Latency (s)", "Hops per Delivered Message", "Message Outcome", "Drops by Platform"])
+
+      delivered = summary[summary["Delivered"]]
+      outcomes = pd.Series({
+         "Delivered": int(summary["Delivered"].sum()),
+         "Dropped": int((summary["Dropped"] & ~summary["Delivered"]).sum()),
+         "In Flight": int((~summary["Dropped"] & ~summary["Delivered"]).sum())
+      })
+      hops = delivered["Hops"].value_counts().sort_index()
+      drops = summary.loc[summary["Dropped"], "Drop_Platform"].value_counts().head(top)
+
+      traces = [
+         {
+            "type": "histogram",
+            "x": FigureFactory.typed_array(delivered["Latency"].to_numpy(), np.float64),
+            "nbinsx": num_bins,
+            "marker": {"color": "steelblue"},
+            "hovertemplate": "%{x} s: %{y}<extra></extra>",
+            "xaxis": "x",
+            "yaxis": "y"
+         },
+         {
+            "type": "bar",
+            "x": FigureFactory.typed_array(hops.index.to_numpy(), np.int32),
+            "y": FigureFactory.typed_array(hops.to_numpy(), np.int32),
+            "marker": {"color": "steelblue"},
+            "hovertemplate": "%{x} hops: %{y}<extra></extra>",
+            "xaxis": "x2",
+            "yaxis": "y2"
+         },
+         {
+            "type": "bar",
+            "x": outcomes.index.tolist(),
+            "y": FigureFactory.typed_array(outcomes.to_numpy(), np.int32),
+            "marker": {"color": [MessagePlot.OUTCOMES[outcome] for outcome in outcomes.index]},
+            "hovertemplate": "%{x}: %{y}<extra></extra>",
+            "xaxis": "x3",
+            "yaxis": "y3"
+         },
+         {
+            "type": "bar",
+            "x": drops.index.tolist(),
+            "y": FigureFactory.typed_array(drops.to_numpy(), np.int32),
+            "marker": {"color": MessagePlot.OUTCOMES["Dropped"]},
+            "hovertemplate": "%{x}: %{y}<extra></extra>",
+            "xaxis": "x4",
+            "yaxis": "y4"
+         }
+      ]
+
+      layout["xaxis2"]["dtick"] = 1
+      layout.update(
+         paper_bgcolor='rgba(0,0,0,0)',
+         plot_bgcolor='rgba(0,0,0,0)',
+         bargap=0.1,
+         showlegend=False)
+
+      return FigureFactory.build(traces, layout)
+
+
+   @staticmethod
+   def describe_message(message):
+
+      if message is None:
+         return ["Message not found in the filtered data."]
+
+      description = [
+         f"{message['Originator']} #{message['Serial_Number']} ({message['Message_Type']})",
+         f"{message['Events']} events, {message['Attempts']} delivery attempts, {message['Hops']} hops"
+      ]
+
+      if message["Delivered"]:
+         description.append(f"Delivered after {message['Latency']:.3f} s")
+      if message["Dropped"]:
+         description.append(f"Dropped at {message['Drop_Platform']}: {message['Drop_Reason']}")
+      if not message["Delivered"] and not message["Dropped"]:
+         description.append("Not delivered")
+
+      return description
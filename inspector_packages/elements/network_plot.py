@@ -1,9 +1,20 @@
 import sys
-import networkx as nx
+import pandas as pd
 from inspector_packages import *
+from .figure_factory import FigureFactory
 
 class NetworkPlot:
 
+   HEALTH_METRICS = {
+      "Active_Links": "Active Links",
+      "Active_Nodes": "Active Platforms",
+      "Components": "Connected Components",
+      "Largest_Component": "Largest Component Share",
+      "Mean_Degree": "Mean Degree",
+      "Max_Degree": "Max Degree",
+      "Peak_Betweenness": "Peak Betweenness"
+   }
+
    def __init__(self):
 
       self._figure_name = "network-graph"
@@ -28,42 +39,36 @@ class NetworkPlot:
       return self._figure_name
 
 
-   def generate_network_figure(self, frame, network_layout, empty_plot):
-
-      node_positions = self._get_network_layout(frame, network_layout)
+   def generate_network_figure(self, frame, node_positions, empty_plot):
 
-      node_x, node_y, node_text, nodes_visited = {}, {}, {}, []
-      nodes_traces, edge_traces, directions = [], [], []
-      two_way_transmissions = []
-      for transmission, group in frame.groupby(["Sender_Name", "Receiver_Name"]):
+      edges = self._aggregate_edges(frame)
+      node_types = self._get_node_types(frame)
 
-         sender, receiver = transmission[0], transmission[1]
-         sender_type = group["Sender_Type"].iloc[0]
-         receiver_type = group["Receiver_Type"].iloc[0]
+      node_x, node_y, node_text, nodes_visited = {}, {}, {}, set()
+      nodes_traces, edge_paths = [], {}
+      arrows = {"points": [], "angles": [], "text": []}
+      two_way_transmissions = set()
+      for (sender, receiver), edge in edges.items():
 
-         self._set_node_info(node_x, node_y, node_text, node_positions, nodes_visited, sender, sender_type)
-         self._set_node_info(node_x, node_y, node_text, node_positions, nodes_visited, receiver, receiver_type)
+         self._set_node_info(node_x, node_y, node_text, node_positions, nodes_visited, sender, node_types[sender])
+         self._set_node_info(node_x, node_y, node_text, node_positions, nodes_visited, receiver, node_types[receiver])
 
-         two_way = frame[(frame["Sender_Name"] == receiver) & (frame["Receiver_Name"] == sender)]
-         if not two_way.empty:
-            if (sender, receiver) not in two_way_transmissions and (receiver, sender) not in two_way_transmissions:
-               two_way_transmissions.append((sender, receiver))
+         if edge["Two_Way"]:
+            two_way_transmissions.add((min(sender, receiver), max(sender, receiver)))
             continue
 
-         edge_width = self._get_edge_width(group.shape[0])
-         arrow_text = self._get_arrow_text(group)
+         edge_width = self._get_edge_width(edge["Count"])
+         path = [node_positions[sender], node_positions[receiver]]
 
-         edge_traces.append(self._add_edge(node_positions[sender], node_positions[receiver], edge_width))
-         directions.append(self._add_direction(node_positions[sender], node_positions[receiver], [arrow_text, arrow_text]))
+         self._add_edge(edge_paths, path, edge_width)
+         self._add_direction(arrows, path, edge["Arrow_Text"])
 
-      for sender, receiver in two_way_transmissions:
+      for sender, receiver in sorted(two_way_transmissions):
 
-         way1 = frame[(frame["Sender_Name"] == sender) & (frame["Receiver_Name"] == receiver)]
-         way2 = frame[(frame["Sender_Name"] == receiver) & (frame["Receiver_Name"] == sender)]
-         edge_width1 = self._get_edge_width(way1.shape[0])
-         arrow_text1 = self._get_arrow_text(way1)
-         edge_width2 = self._get_edge_width(way2.shape[0])
-         arrow_text2 = self._get_arrow_text(way2)
+         way1 = edges[(sender, receiver)]
+         way2 = edges[(receiver, sender)]
+         edge_width1 = self._get_edge_width(way1["Count"])
+         edge_width2 = self._get_edge_width(way2["Count"])
 
          pos1 = node_positions[sender]
          pos2 = node_positions[receiver]
@@ -71,15 +76,11 @@ class NetworkPlot:
          sender_to_rcvr = self._find_points_on_curve(pos1, pos2, center1)
          rcvr_to_sender = self._find_points_on_curve(pos2, pos1, center2)
 
-         for i in range(len(sender_to_rcvr)-1):
-            edge_traces.append(self._add_edge(sender_to_rcvr[i], sender_to_rcvr[i+1], edge_width1))
-            directions.append(self._add_direction(sender_to_rcvr[i], sender_to_rcvr[i+1], [arrow_text1, arrow_text1]))
-         edge_traces.append(self._add_edge(sender_to_rcvr[-1], pos2, edge_width1))
+         self._add_edge(edge_paths, sender_to_rcvr + [pos2], edge_width1)
+         self._add_direction(arrows, sender_to_rcvr, way1["Arrow_Text"])
 
-         for i in range(len(rcvr_to_sender)-1):
-            edge_traces.append(self._add_edge(rcvr_to_sender[i], rcvr_to_sender[i+1], edge_width2))
-            directions.append(self._add_direction(rcvr_to_sender[i], rcvr_to_sender[i+1], [arrow_text2, arrow_text2]))
-         edge_traces.append(self._add_edge(rcvr_to_sender[-1], pos1, edge_width2))
+         self._add_edge(edge_paths, rcvr_to_sender + [pos1], edge_width2)
+         self._add_direction(arrows, rcvr_to_sender, way2["Arrow_Text"])
 
 
       for platform_type in node_x:
@@ -89,31 +90,135 @@ class NetworkPlot:
             platform_type, 
             node_text[platform_type]))
 
-      fig =  go.Figure({"data": nodes_traces + edge_traces + directions, "layout": empty_plot})
+      edge_traces = self._edge_traces(edge_paths)
+      directions = self._direction_traces(arrows)
+
+      layout = dict(empty_plot, yaxis=dict(empty_plot.get("yaxis", {}), scaleanchor="x"))
+      return FigureFactory.build(nodes_traces + edge_traces + directions, layout)
+
+
+   @staticmethod
+   def health_figure(health, metrics, current_time=None):
+
+      layout = FigureFactory.subplot_grid(
+         rows=len(metrics),
+         cols=1,
+         titles=[NetworkPlot.HEALTH_METRICS[metric] for metric in metrics])
+
+      traces = []
+      for idx, metric in enumerate(metrics):
+         axis = idx + 1 if idx != 0 else ''
+         series = health[metric].dropna()
+         traces.append(
+            {
+               "type": "scatter",
+               "mode": "lines",
+               "x": FigureFactory.typed_array(series.index.to_numpy() * 1000, np.float64),
+               "y": FigureFactory.typed_array(series.to_numpy(), np.float64),
+               "line": {"shape": "linear" if metric == "Peak_Betweenness" else "hv", "color": "steelblue"},
+               "hovertemplate": "%{y}<extra></extra>",
+               "xaxis": f"x{axis}",
+               "yaxis": f"y{axis}"
+            }
+         )
+         layout[f"xaxis{axis}"]["type"] = "date"
+         if idx != 0:
+            layout[f"xaxis{axis}"]["matches"] = "x"
+         layout[f"yaxis{axis}"].update(fixedrange=True, rangemode="tozero")
+
+      if current_time is not None:
+         layout["shapes"] = [
+            {
+               "type": "line",
+               "xref": "x",
+               "yref": "paper",
+               "x0": current_time * 1000,
+               "x1": current_time * 1000,
+               "y0": 0,
+               "y1": 1,
+               "line": {"color": "darkred", "width": 1, "dash": "dot"}
+            }
+         ]
+
+      layout.update(
+         paper_bgcolor='rgba(0,0,0,0)',
+         plot_bgcolor='rgba(0,0,0,0)',
+         hovermode="x",
+         uirevision="health",
+         showlegend=False)
+
+      return FigureFactory.build(traces, layout)
+
+
+   @staticmethod
+   def reachability_figure(platforms, latency, deadline, max_platforms=300):
+
+      reached = np.isfinite(latency)
+      num_pairs = reached.shape[0] * (reached.shape[0] - 1)
+      share = (reached.sum() - np.trace(reached)) / num_pairs if num_pairs > 0 else 0.0
+      order = np.argsort(-(reached.sum(axis=0) + reached.sum(axis=1)), kind="stable")[:max_platforms]
+      latency = np.where(reached, latency, np.nan)[np.ix_(order, order)]
+      platforms = platforms[order].tolist()
+
+      title = f"Earliest arrival within {deadline:g} s: {share:.1%} of pairs reachable"
+      if len(order) < reached.shape[0]:
+         title += f" (busiest {len(order)} of {reached.shape[0]} platforms)"
+
+      heatmap = {
+         "type": "heatmap",
+         "x": platforms,
+         "y": platforms,
+         "z": FigureFactory.typed_array(latency),
+         "zmin": 0,
+         "zmax": deadline,
+         "colorscale": "Viridis",
+         "colorbar": {"title": {"text": "Latency (s)"}},
+         "hovertemplate": "%{y} >> %{x}: %{z:.2f} s<extra></extra>"
+      }
 
-      return fig
-         
+      layout = {
+         "title": {"text": title},
+         "paper_bgcolor": 'rgba(0,0,0,0)',
+         "plot_bgcolor": 'rgba(0,0,0,0)',
+         "xaxis": {"title": {"text": "Destination"}, "showticklabels": len(platforms) <= 60},
+         "yaxis": {"title": {"text": "Source"}, "showticklabels": len(platforms) <= 60, "autorange": "reversed"}
+      }
+
+      return FigureFactory.build([heatmap], layout)
+
+
+   def _aggregate_edges(self, frame):
 
-   def _get_network_layout(self, frame, network_layout):
+      breakdown = frame.groupby(["Sender_Name", "Receiver_Name", "Message_Type"], observed=True).size().unstack(fill_value=0)
+      counts = breakdown.to_numpy()
+      senders = breakdown.index.get_level_values(0)
+      receivers = breakdown.index.get_level_values(1)
 
-      transmissions = frame[["Sender_Name", "Receiver_Name"]].drop_duplicates()
-      edges = [(row["Sender_Name"], row["Receiver_Name"]) for _, row in transmissions.iterrows()]
-      G = nx.Graph()
-      G.add_edges_from(edges)
+      reverse = pd.MultiIndex.from_arrays([receivers, senders])
+      msg_types = breakdown.columns.to_numpy()
+      type_order = np.argsort(-counts, axis=1, kind="stable")
 
-      if network_layout == "Spring":
-         node_positions = nx.spring_layout(G)
-      elif network_layout == "Circular":
-         node_positions = nx.circular_layout(G)
-      elif network_layout == "Shell":
-         node_positions = nx.shell_layout(G)
-      elif network_layout == "Spectral":
-         node_positions = nx.spectral_layout(G)
-      elif network_layout == "Random":
-         node_positions = nx.random_layout(G)
+      arrow_text = []
+      for row, (sender, receiver) in enumerate(breakdown.index):
+         order = type_order[row][counts[row, type_order[row]] > 0]
+         arrow_text.append(self._get_arrow_text(sender, receiver, zip(msg_types[order], counts[row, order])))
 
-      return node_positions
+      edges = {}
+      for transmission, count, two_way, text in zip(breakdown.index, counts.sum(axis=1), reverse.isin(breakdown.index), arrow_text):
+         edges[transmission] = {"Count": count, "Two_Way": two_way, "Arrow_Text": text}
 
+      return edges
+
+
+   def _get_node_types(self, frame):
+
+      senders = frame.drop_duplicates("Sender_Name")
+      receivers = frame.drop_duplicates("Receiver_Name")
+      node_types = dict(zip(receivers["Receiver_Name"], receivers["Receiver_Type"]))
+      node_types.update(zip(senders["Sender_Name"], senders["Sender_Type"]))
+
+      return node_types
+         
 
    def _get_edge_width(self, num):
 
@@ -127,63 +232,88 @@ class NetworkPlot:
       return edge_width
 
 
-   def _get_arrow_text(self, df):
+   def _get_arrow_text(self, sender, receiver, msg_type_counts):
 
-      msg_type_counts = df["Message_Type"].value_counts().to_dict()
-      arrow_text = f'{df["Sender_Name"].iloc[0]} >> {df["Receiver_Name"].iloc[0]}<br>'
-      for msg_type, count in msg_type_counts.items():
+      arrow_text = f'{sender} >> {receiver}<br>'
+      for msg_type, count in msg_type_counts:
          arrow_text += f'{msg_type}: {count}<br>'
       arrow_text += '<extra></extra>'
 
       return arrow_text
 
 
-   def _add_edge(self, start, end, edge_width):
-
-      edge = {
-         "type": "scatter",
-         "name": "edge",
-         "x": [start[0], end[0]],
-         "y": [start[1], end[1]],
-         "mode": "lines",
-         "hoverinfo": "none",
-         "zorder": 1,
-         "line": 
-         {
-            "width": edge_width,
-            "color": "black"
-         },
-         "showlegend": False
-      }
+   def _add_edge(self, edge_paths, points, edge_width):
 
-      return edge
+      edge_paths.setdefault(edge_width, []).append(np.array(points))
 
    
-   def _add_direction(self, start, end, text):
+   def _add_direction(self, arrows, points, text):
+
+      points = np.array(points)
+      starts, ends = points[:-1], points[1:]
+      vectors = ends - starts
+      angles = np.degrees(np.arctan2(vectors[:, 0], vectors[:, 1]))
+
+      for fraction in (0.25, 0.75):
+         arrows["points"].append(starts + fraction * vectors)
+         arrows["angles"].append(angles)
+         arrows["text"].extend([text] * starts.shape[0])
+
 
-      arrow_start = start + 0.25 * (end - start)
-      arrow_end = start + 0.75 * (end - start)
+   def _edge_traces(self, edge_paths):
+
+      edge_traces = []
+      separator = np.full((1, 2), np.nan)
+      for edge_width, paths in sorted(edge_paths.items()):
+         segments = np.concatenate([np.concatenate((path, separator)) for path in paths])
+         edge_traces.append(
+            {
+               "type": "scatter",
+               "name": "edge",
+               "x": FigureFactory.typed_array(segments[:, 0]),
+               "y": FigureFactory.typed_array(segments[:, 1]),
+               "mode": "lines",
+               "hoverinfo": "none",
+               "zorder": 1,
+               "line": 
+               {
+                  "width": edge_width,
+                  "color": "black"
+               },
+               "showlegend": False
+            }
+         )
+
+      return edge_traces
+
+
+   def _direction_traces(self, arrows):
+
+      if len(arrows["points"]) == 0:
+         return []
+
+      points = np.concatenate(arrows["points"])
 
       direction = {
          "type": "scatter",
          "name": "network",
-         "x": [arrow_start[0], arrow_end[0]], 
-         "y": [arrow_start[1], arrow_end[1]],
+         "x": FigureFactory.typed_array(points[:, 0]), 
+         "y": FigureFactory.typed_array(points[:, 1]),
          "mode": "markers",
          "zorder": 1,
-         "customdata": text,
+         "customdata": arrows["text"],
          "hovertemplate":'%{customdata}',
          "marker":
          {
             "size": 15,
             "color": "black",
             "symbol": "arrow-up",
-            "angleref": "previous"
+            "angle": FigureFactory.typed_array(np.concatenate(arrows["angles"]))
          },
          "showlegend": False
       }
 
-      return direction
+      return [direction]
 
 
    def _add_node(self, x, y, node_type, text):
@@ -191,8 +321,8 @@ class NetworkPlot:
       node = {
          "type": "scatter",
          "name": node_type,
-         "x": x,
-         "y": y,
+         "x": FigureFactory.typed_array(x),
+         "y": FigureFactory.typed_array(y),
          "mode": "markers",
          "zorder": 2,
          "customdata": text,
@@ -217,7 +347,7 @@ class NetworkPlot:
          node_x[node_type].append(pos[0])
          node_y[node_type].append(pos[1])
          node_text[node_type].append(f"{node_name}" + "<extra></extra>")
-         nodes_visited.append(node_name)
+         nodes_visited.add(node_name)
 
 
    def _find_normal_vectors(self, pos1, pos2):
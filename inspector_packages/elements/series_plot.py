@@ -0,0 +1,29 @@
+from inspector_packages import *
+from .figure_factory import FigureFactory
+
+
+class SeriesPlot:
+
+   @staticmethod
+   def series_figure(times, values, column, num_rows, x_range, uirevision):
+
+      line = {
+         "type": "scattergl",
+         "mode": "lines",
+         "x": FigureFactory.typed_array(times * 1000, np.float64),
+         "y": FigureFactory.typed_array(values, np.float64),
+         "line": {"color": "steelblue", "width": 1},
+         "hovertemplate": "%{y}<extra></extra>"
+      }
+
+      layout = {
+         "title": {"text": f"{column.replace('_', ' ')}: {times.shape[0]:,} of {num_rows:,} points"},
+         "paper_bgcolor": 'rgba(0,0,0,0)',
+         "plot_bgcolor": 'rgba(0,0,0,0)',
+         "uirevision": uirevision,
+         "showlegend": False,
+         "xaxis": {"type": "date", "range": [x_range[0] * 1000, x_range[1] * 1000]},
+         "yaxis": {"title": {"text": column.replace('_', ' ')}}
+      }
+
+      return FigureFactory.build([line], layout)
@@ -0,0 +1,73 @@
+import plotly.colors
+from inspector_packages import *
+from .figure_factory import FigureFactory
+
+
+class TimelinePlot:
+
+   @staticmethod
+   def density_figure(event_times, timestamps, num_bins=120):
+
+      layout = {
+         "margin": {"l": 10, "r": 10, "t": 0, "b": 0},
+         "paper_bgcolor": 'rgba(0,0,0,0)',
+         "plot_bgcolor": 'rgba(0,0,0,0)',
+         "bargap": 0,
+         "showlegend": False,
+         "xaxis": {"visible": False, "range": [-0.5, max(len(timestamps), 1) - 0.5], "fixedrange": True},
+         "yaxis": {"visible": False, "fixedrange": True}
+      }
+
+      if len(timestamps) == 0:
+         return FigureFactory.build([], layout)
+
+      events_per_step = np.bincount(np.searchsorted(timestamps, event_times), minlength=len(timestamps))
+
+      num_bins = min(num_bins, len(timestamps))
+      edges = np.linspace(0, len(timestamps), num_bins + 1).astype(np.int64)
+      counts = np.add.reduceat(events_per_step, edges[:-1])
+
+      density = {
+         "type": "bar",
+         "x": FigureFactory.typed_array((edges[:-1] + edges[1:] - 1) / 2),
+         "y": FigureFactory.typed_array(counts, np.int32),
+         "width": FigureFactory.typed_array(edges[1:] - edges[:-1]),
+         "marker": {"color": "steelblue"},
+         "hoverinfo": "skip"
+      }
+
+      return FigureFactory.build([density], layout)
+
+
+   @staticmethod
+   def pyramid_figure(series, resolution, x_range, uirevision):
+
+      bucket_times = series.index.to_numpy() * 1000
+      colors = plotly.colors.qualitative.Plotly
+
+      traces = []
+      for idx, category in enumerate(series.columns):
+         traces.append(
+            {
+               "type": "bar",
+               "name": str(category),
+               "x": FigureFactory.typed_array(bucket_times, np.float64),
+               "y": FigureFactory.typed_array(series[category].to_numpy(), np.int32),
+               "width": resolution * 1000,
+               "offset": 0,
+               "marker": {"color": colors[idx % len(colors)], "line": {"width": 0}},
+               "hovertemplate": f"{category}: " + "%{y}<extra></extra>"
+            }
+         )
+
+      layout = {
+         "barmode": "stack",
+         "bargap": 0,
+         "uirevision": uirevision,
+         "title": {"text": f"Events per {resolution} s"},
+         "legend": {"orientation": "h", "y": -0.15},
+         "xaxis": {"type": "date", "range": [x_range[0] * 1000, x_range[1] * 1000]},
+         "yaxis": {"title": {"text": "Events"}, "fixedrange": True}
+      }
+
+      return FigureFactory.build(traces, layout)
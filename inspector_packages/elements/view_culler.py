@@ -0,0 +1,163 @@
+import numpy as np
+from .globe_methods import GlobeMethods
+
+
+class ViewCuller:
+   """
+   Decides which globe geometry can be seen from a camera before any of it
+   is built or serialized.
+
+   A point is hidden when the line of sight from the eye passes through
+   the Earth, or when it falls outside the cone that bounds the camera's
+   field of view. A link is kept if any sample along its straight line or
+   its great-circle arc is visible, so only links that are hidden end to
+   end are culled. The occluding sphere is slightly smaller than the polar
+   radius, so points near the horizon are kept. Counts of kept and culled
+   items accumulate per kind for the frame's summary.
+   """
+
+   SAMPLES = 8
+   FOV = np.radians(60)
+   CONE_MARGIN = np.radians(2)
+   OCCLUDER_RADIUS = 0.99 * GlobeMethods.POLAR_RADIUS
+   SENDER = ["SenderLocation_X", "SenderLocation_Y", "SenderLocation_Z"]
+   RECEIVER = ["ReceiverLocation_X", "ReceiverLocation_Y", "ReceiverLocation_Z"]
+
+   def __init__(self, eye, direction=None, fov=None, aspect_ratio=None):
+
+      self._eye = np.asarray(eye, dtype=np.float64)
+      direction = -self._eye if direction is None else np.asarray(direction, dtype=np.float64)
+      self._direction = direction / np.linalg.norm(direction)
+
+      fov = fov or self.FOV
+      aspect_ratio = aspect_ratio or 1.0
+      tan_x = np.tan(fov / 2) if aspect_ratio >= 1 else np.tan(fov / 2) * aspect_ratio
+      tan_y = tan_x / aspect_ratio
+      self._cos_cone = np.cos(min(np.arctan(np.hypot(tan_x, tan_y)) + self.CONE_MARGIN, np.pi))
+
+      self._counts = {}
+
+
+   @classmethod
+   def from_camera(cls, camera):
+      """
+      Culler for a camera reported by the Cesium viewer: a dict with
+      ``position`` and ``direction`` vectors, ``fov`` in radians and
+      ``aspect_ratio``.
+      """
+
+      return cls(
+         [camera["position"][axis] for axis in "xyz"],
+         [camera["direction"][axis] for axis in "xyz"],
+         camera.get("fov"),
+         camera.get("aspect_ratio"))
+
+
+   @property
+   def counts(self):
+
+      return self._counts
+
+
+   def visible(self, points):
+
+      points = np.asarray(points, dtype=np.float64)
+      sight = points - self._eye
+      length_sq = (sight ** 2).sum(axis=-1)
+
+      with np.errstate(divide="ignore", invalid="ignore"):
+         t = np.clip(-(sight @ self._eye) / length_sq, 0, 1)
+      closest = self._eye + np.nan_to_num(t)[..., None] * sight
+      unobstructed = np.linalg.norm(closest, axis=-1) >= self.OCCLUDER_RADIUS
+
+      in_cone = sight @ self._direction >= np.sqrt(length_sq) * self._cos_cone
+
+      return unobstructed & in_cone
+
+
+   def visible_links(self, senders, receivers):
+
+      senders = np.asarray(senders, dtype=np.float64).reshape(-1, 3)
+      receivers = np.asarray(receivers, dtype=np.float64).reshape(-1, 3)
+      if senders.shape[0] == 0:
+         return np.zeros(0, dtype=bool)
+
+      fraction = np.linspace(0, 1, self.SAMPLES)[None, :, None]
+      chord = senders[:, None, :] + fraction * (receivers - senders)[:, None, :]
+
+      sender_radius = np.linalg.norm(senders, axis=-1)[:, None, None]
+      receiver_radius = np.linalg.norm(receivers, axis=-1)[:, None, None]
+      with np.errstate(divide="ignore", invalid="ignore"):
+         arc = chord / np.linalg.norm(chord, axis=-1, keepdims=True)
+         arc = np.nan_to_num(arc * (sender_radius + fraction * (receiver_radius - sender_radius)))
+
+      return self.visible(chord).any(axis=1) | self.visible(arc).any(axis=1)
+
+
+   def cull_links(self, groups, kind="links"):
+
+      if len(groups) == 0:
+         return groups
+
+      senders = np.array([group[self.SENDER].to_numpy(dtype=np.float64)[0] for _, group in groups])
+      receivers = np.array([group[self.RECEIVER].to_numpy(dtype=np.float64)[0] for _, group in groups])
+      keep = self.visible_links(senders, receivers)
+      self._record(kind, keep)
+
+      return [group for group, kept in zip(groups, keep) if kept]
+
+
+   def cull_points(self, groups, kind="events"):
+
+      if len(groups) == 0:
+         return groups
+
+      points = np.array([group[self.SENDER].to_numpy(dtype=np.float64)[0] for _, group in groups])
+      keep = self.visible(points)
+      self._record(kind, keep)
+
+      return [group for group, kept in zip(groups, keep) if kept]
+
+
+   def cull_platforms(self, platforms, trails=None, kind="platforms"):
+
+      keep = self.visible(platforms[["X", "Y", "Z"]].to_numpy())
+      if trails is not None:
+         keep |= self.visible(trails).any(axis=1)
+         trails = trails[keep]
+      self._record(kind, keep)
+
+      return platforms[keep], trails
+
+
+   def cull_clusters(self, clusters, kind="clusters"):
+
+      keep = self.visible(clusters[["X", "Y", "Z"]].to_numpy(dtype=np.float64))
+      self._record(kind, keep)
+
+      return clusters[keep]
+
+
+   def cull_bundles(self, bundles, kind="bundles"):
+
+      keep = self.visible_links(
+         bundles[["From_X", "From_Y", "From_Z"]].to_numpy(dtype=np.float64),
+         bundles[["To_X", "To_Y", "To_Z"]].to_numpy(dtype=np.float64))
+      self._record(kind, keep)
+
+      return bundles[keep]
+
+
+   def summary(self):
+
+      parts = []
+      for kind, (kept, total) in self._counts.items():
+         parts.append(f"{kind.capitalize()}: {kept:,} of {total:,} drawn ({total - kept:,} culled)")
+
+      return " | ".join(parts)
+
+
+   def _record(self, kind, keep):
+
+      kept, total = self._counts.get(kind, (0, 0))
+      self._counts[kind] = (kept + int(keep.sum()), total + keep.shape[0])
@@ -4,6 +4,7 @@ from pathlib import Path
 from utils import cli_output
 from dateutil import parser
 import pandas as pd
+from inspector_packages import NO_FAILURE
 
 
 class Executor:
@@ -109,7 +110,7 @@ class Executor:
          'ReceiverPart_BaseType': 'unknown',
          'CommInteraction_Succeeded': -1,
          'CommInteraction_Failed': -1,
-         'CommInteraction_FailedStatus': 'Does Not Exist',
+         'CommInteraction_FailedStatus': NO_FAILURE,
          'Queue_Size': -1
          }
 
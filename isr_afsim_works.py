@@ -2,6 +2,8 @@ import json, sys
 import webbrowser
 from utils import *
 from inspector_packages.dash_app.dash_callbacks import DashCallbacks
+from inspector_packages.dash_app.production_server import ProductionServer
+from inspector_packages.data_store import EventStore
 from inspector_packages.mission_execution.executor import Executor
 from pathlib import Path
 
@@ -14,28 +16,51 @@ class Inspector:
       ocean_color=None, 
       resolution=None,
       classification=None,
-      use_cesium=False):
+      use_cesium=False,
+      use_map=False,
+      validate_figures=False,
+      text_arrays=False,
+      workers=1):
 
       self._host = "127.0.0.1"
       self._port = 8050
+      self._workers = workers
+      self._server = None
 
       mission_config, cesium_config = self._extract_configs(config_file)
 
       self._mission_executor = Executor(mission_config)
       df = self._mission_executor.get_afsim_data()
 
-      self._callbacks = DashCallbacks(
-         df, 
-         land_color, ocean_color, 
-         resolution, classification, 
-         json.dumps(cesium_config),
-         use_cesium)
+      callback_args = {
+         "land_color": land_color,
+         "ocean_color": ocean_color,
+         "resolution": resolution,
+         "classification": classification,
+         "cesium_config": json.dumps(cesium_config),
+         "use_cesium": use_cesium,
+         "use_map": use_map,
+         "validate_figures": validate_figures,
+         "text_arrays": text_arrays
+      }
+
+      if self._workers != 1 and ProductionServer.available():
+         store_dir = Path(sys.argv[0]).parent.joinpath("output", "event_store")
+         EventStore.save(df, store_dir)
+         self._server = ProductionServer(store_dir, self._workers, self._host, self._port, callback_args)
+      else:
+         if self._workers != 1:
+            cli_output.WARNING("gunicorn is not installed... falling back to the single-process server.")
+         self._callbacks = DashCallbacks(df, **callback_args)
 
 
 
    def run(self):
       webbrowser.open(f"http://{self._host}:{self._port}/")
-      self._callbacks.app.run(debug=False, host=self._host, port=self._port)
+      if self._server is not None:
+         self._server.run()
+      else:
+         self._callbacks.app.run(debug=False, host=self._host, port=self._port)
 
    
    def _extract_configs(self, config_file):
@@ -76,13 +76,44 @@ class CLIParser:
          default=None,
          help="Classification of data used"
       )
-      cli_parser.add_argument(
+      globe_group = cli_parser.add_mutually_exclusive_group()
+      globe_group.add_argument(
          "-Cs", "--cesium",
          dest="use_cesium",
          action="store_true",
          help="Flag to use CesiumJS as globe visualizer instead of Plotly."
       )
 
+      globe_group.add_argument(
+         "-M", "--map-2d",
+         dest="use_map",
+         action="store_true",
+         help="Flag to use a flat 2D map instead of the 3D globe, for thin clients and remote desktops."
+      )
+
+      cli_parser.add_argument(
+         "--validate-figures",
+         dest="validate_figures",
+         action="store_true",
+         help="Debug flag to run Plotly property validation on every figure."
+      )
+
+      cli_parser.add_argument(
+         "--text-arrays",
+         dest="text_arrays",
+         action="store_true",
+         help="Send numeric trace data as JSON text instead of binary typed arrays."
+      )
+
+      cli_parser.add_argument(
+         "-W", "--workers",
+         metavar="4",
+         dest="workers",
+         type=int,
+         default=1,
+         help="Number of server worker processes (0 for one per CPU). More than one serves through gunicorn from a memory-mapped event store."
+      )
+
       cli_parser.add_argument("--version", action="version", version='%(prog)s 1.0.0')
       self._arguments = vars(cli_parser.parse_args())
 